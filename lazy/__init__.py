@@ -2,5 +2,20 @@
 
 from __future__ import absolute_import
 from .lazy import lazy
+from .locked import locked
+from .awaitable import awaitable
+from .slotted import slotted
+from .tracked import tracked
+from .expiring import expiring
+from .evictable import evictable
+from .persistent import persistent
+from .backoff import backoff
+from .classlazy import classlazy
+from .lazymodule import lazymodule
+from .streamed import streamed
+from .memoized import memoized
+from .mapped import mapped
+from .batched import batched
+from .revalidating import revalidating
 
-__all__ = ["lazy"]  # Re-export attribute
+__all__ = ["lazy", "locked", "awaitable", "slotted", "tracked", "expiring", "evictable", "persistent", "backoff", "classlazy", "lazymodule", "streamed", "memoized", "mapped", "batched", "revalidating"]  # Re-export attributes
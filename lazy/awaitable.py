@@ -0,0 +1,61 @@
+"""Decorator to create lazy attributes from coroutine functions."""
+
+from .lazy import lazy
+
+
+class awaitable(lazy):
+    """awaitable descriptor
+
+    Like lazy but for coroutine functions. The attribute evaluates to
+    an awaitable which runs the coroutine once and caches its result.
+    Concurrent awaiters share the same task.
+    """
+
+    # Coroutines run in the event loop of the process awaiting them
+    _materialize = False
+
+    def _compute(self, inst, name):
+        return _Shared(lazy._compute(self, inst, name), inst, name)
+
+
+class _Shared(object):
+    """Awaitable stored in the instance __dict__ of an awaitable attribute."""
+
+    def __init__(self, coro, inst, name):
+        self.__coro = coro
+        self.__task = None
+        self.__inst = inst
+        self.__name = name
+
+    def __await__(self):
+        import asyncio
+
+        task = self.__task
+        if task is None:
+            # Schedule the task in the loop of the first awaiter
+            task = self.__task = asyncio.ensure_future(self.__coro)
+            task.add_done_callback(self.__done)
+            self.__coro = None
+
+        if not task.done():
+            # Cancelling one awaiter must not cancel the others
+            task = asyncio.shield(task)
+        return task.__await__()
+
+    def __done(self, task):
+        inst, name = self.__inst, self.__name
+        self.__inst = self.__name = None
+
+        if task.cancelled() or task.exception() is not None:
+            # Failures are not cached
+            if inst.__dict__.get(name) is self:
+                del inst.__dict__[name]
+
+    def __repr__(self):
+        if self.__task is None:
+            state = 'pending'
+        elif not self.__task.done():
+            state = 'running'
+        else:
+            state = 'done'
+        return '<%s %s>' % (self.__class__.__name__, state)
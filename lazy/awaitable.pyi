@@ -0,0 +1,9 @@
+from typing import TypeVar, Awaitable
+
+from .lazy import lazy
+
+_R = TypeVar("_R")
+
+
+class awaitable(lazy[Awaitable[_R]]):
+    pass
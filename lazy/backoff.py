@@ -0,0 +1,84 @@
+"""Decorator to create lazy attributes which cache failures."""
+
+import time
+
+from .lazy import lazy
+
+try:
+    _clock = time.monotonic
+except AttributeError:
+    _clock = time.time
+
+# Key of the failures in the instance __dict__
+_FAILURES = '__lazy_failures__'
+
+
+class backoff(lazy):
+    """backoff descriptor
+
+    Like lazy but when the function raises one of 'exceptions', the
+    exception is cached and raised again on access for 'delay' seconds.
+    The delay grows by 'factor' with every failure in a row, up to
+    'max_delay' seconds.
+    """
+
+    def __init__(self, func, delay=1.0, factor=2.0, max_delay=60.0, exceptions=Exception, **options):
+        lazy.__init__(self, func, **options)
+        self.__delay = delay
+        self.__factor = factor
+        self.__max_delay = max_delay
+        self.__exceptions = exceptions
+
+    def _compute(self, inst, name):
+        failures = inst.__dict__.get(_FAILURES)
+        failure = failures.get(name) if failures else None
+
+        attempts = 0
+        if failure is not None:
+            exc, deadline, attempts = failure
+            if _clock() < deadline:
+                # Drop the traceback, it keeps growing otherwise
+                if hasattr(exc, 'with_traceback'):
+                    exc = exc.with_traceback(None)
+                raise exc
+
+        try:
+            value = lazy._compute(self, inst, name)
+        except self.__exceptions as e:
+            delay = min(self.__delay * self.__factor ** attempts, self.__max_delay)
+            _update(inst, name, (e, _clock() + delay, attempts + 1))
+            raise
+
+        if failure is not None:
+            _update(inst, name, None)
+        return value
+
+    def _invalidate(self, inst, name):
+        lazy._invalidate(self, inst, name)
+        if name in inst.__dict__.get(_FAILURES, ()):
+            _update(inst, name, None)
+
+    @classmethod
+    def failure(cls, inst, name):
+        """Return the cached exception of attribute 'name' of instance
+        'inst', or None.
+        """
+        name, descriptor = cls._lookup(inst.__class__, name)
+        failure = inst.__dict__.get(_FAILURES, {}).get(name)
+        if failure is not None and _clock() < failure[1]:
+            return failure[0]
+        return None
+
+
+def _update(inst, name, failure):
+    # Replace the failures dict, copies of the instance may share it
+    failures = dict(inst.__dict__.get(_FAILURES, ()))
+    if failure is None:
+        failures.pop(name, None)
+    else:
+        failures[name] = failure
+
+    if failures:
+        inst.__dict__[_FAILURES] = failures
+    else:
+        inst.__dict__.pop(_FAILURES, None)
@@ -0,0 +1,30 @@
+from typing import TypeVar, Callable, Tuple, Type, Union, Optional, Any, overload
+from typing_extensions import Self
+
+from .lazy import lazy, _Tags, _Names
+
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+
+_Exceptions = Union[Type[BaseException], Tuple[Type[BaseException], ...]]
+
+
+class backoff(lazy[_R]):
+
+    @overload
+    def __new__(cls, func: Callable[[Any], _R], delay: float = ..., factor: float = ...,
+                max_delay: float = ..., exceptions: _Exceptions = ..., tags: _Tags = ...,
+                depends_on: _Names = ...) -> Self: ...
+
+    @overload
+    def __new__(cls, *, delay: float = ..., factor: float = ...,
+                max_delay: float = ..., exceptions: _Exceptions = ..., tags: _Tags = ...,
+                depends_on: _Names = ...) -> _backoff_decorator: ...
+
+    @classmethod
+    def failure(cls, inst: object, name: str) -> Optional[BaseException]: ...
+
+
+class _backoff_decorator(backoff[Any]):
+
+    def __call__(self, func: Callable[[Any], _T]) -> backoff[_T]: ...
@@ -0,0 +1,90 @@
+"""Decorator to create lazy attributes computed for batches of instances."""
+
+import weakref
+
+from .lazy import lazy, _index, _measure
+
+# Key of the batch in the instance __dict__
+_BATCH = '__lazy_batch__'
+
+
+class batched(lazy):
+    """batched descriptor
+
+    Like lazy but the decorated function receives a list of instances
+    and returns a sequence of their values. On first access, the value
+    is computed for the instance and its siblings in the batch which
+    have not computed it yet, at most 'size' instances per call. None
+    means no limit. Batches are registered with batched.batch().
+    """
+
+    def __init__(self, func, size=None, **options):
+        lazy.__init__(self, func, **options)
+        self.__size = size
+
+    def _compute(self, inst, name):
+        siblings = self.__siblings(inst, name)
+
+        func = self._lazy__func
+        if self._metrics is not None:
+            values = _measure(self, func, siblings)
+        else:
+            values = func(siblings)
+
+        values = list(values)
+        if len(values) != len(siblings):
+            raise ValueError('%s returned %d values for %d instances' % (
+                self.__name__, len(values), len(siblings)))
+
+        for sibling, value in zip(siblings[1:], values[1:]):
+            self._store(sibling, name, value)
+        return values[0]
+
+    def __siblings(self, inst, name):
+        # Return inst and the siblings which need the value, in batch
+        # order starting after inst
+        siblings = [inst]
+        entry = inst.__dict__.get(_BATCH)
+        if entry is None:
+            return siblings
+
+        batch, position = entry
+        size = self.__size
+        refs = batch.refs
+        count = len(refs)
+        for i in range(position + 1, position + count):
+            if size is not None and len(siblings) >= size:
+                break
+            sibling = refs[i % count]()
+            if (sibling is not None and
+                    sibling.__dict__.get(_BATCH, (None,))[0] is batch and
+                    _index(sibling.__class__).descriptors.get(name) is self and
+                    not self._has_value(sibling, name)):
+                siblings.append(sibling)
+        return siblings
+
+    @classmethod
+    def batch(cls, instances):
+        """Register instances as a batch, replacing their previous batches.
+
+        Instances must support weak references. Returns the instances
+        as a list.
+        """
+        instances = list(instances)
+        batch = _Batch([weakref.ref(inst) for inst in instances])
+        for position, inst in enumerate(instances):
+            inst.__dict__[_BATCH] = (batch, position)
+        return instances
+
+
+class _Batch(object):
+    """Weak references to the instances of a batch."""
+
+    __slots__ = ('refs',)
+
+    def __init__(self, refs=()):
+        self.refs = refs
+
+    def __reduce__(self):
+        # Copies of instances do not belong to the batch
+        return (_Batch, ())
@@ -0,0 +1,27 @@
+from typing import TypeVar, Callable, Iterable, Sequence, List, Optional, Any, overload
+from typing_extensions import Self
+
+from .lazy import lazy, _Tags, _Names
+
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+_I = TypeVar("_I")
+
+
+class batched(lazy[_R]):
+
+    @overload
+    def __new__(cls, func: Callable[[List[Any]], Sequence[_R]], size: Optional[int] = ...,
+                tags: _Tags = ..., depends_on: _Names = ...) -> Self: ...
+
+    @overload
+    def __new__(cls, *, size: Optional[int] = ..., tags: _Tags = ...,
+                depends_on: _Names = ...) -> _batched_decorator: ...
+
+    @classmethod
+    def batch(cls, instances: Iterable[_I]) -> List[_I]: ...
+
+
+class _batched_decorator(batched[Any]):
+
+    def __call__(self, func: Callable[[List[Any]], Sequence[_T]]) -> batched[_T]: ...
@@ -0,0 +1,256 @@
+"""Benchmarks for lazy attributes.
+
+Compares lazy and lazy subclasses with functools.cached_property and
+property. Run with
+
+    python -m lazy.benchmarks.bench [-o results.json] [--compare baseline.json]
+
+Results are written as JSON. With --compare, benchmarks that got slower
+than the baseline by more than the tolerance are reported and the exit
+status is 1.
+"""
+
+import sys
+import json
+import timeit
+import argparse
+import platform
+import threading
+
+from lazy import lazy
+from lazy import locked
+
+try:
+    from functools import cached_property
+except ImportError:
+    cached_property = None
+
+
+class cached(lazy):
+    """A lazy subclass"""
+
+
+def _classes(decorator, depth=10):
+    # Return the benchmark classes for decorator
+
+    class Plain(object):
+
+        @decorator
+        def value(self):
+            return 42
+
+    class Private(object):
+
+        @decorator
+        def __value(self):
+            return 42
+
+        def get(self):
+            return self.__value
+
+    deep = Plain
+    for i in range(depth):
+        deep = type('Deep%d' % i, (deep,), {})
+
+    return {'plain': Plain, 'private': Private, 'deep': deep}
+
+
+VARIANTS = [
+    ('property', property),
+    ('cached_property', cached_property),
+    ('lazy', lazy),
+    ('cached', cached),
+    ('locked', locked),
+]
+
+CLASSES = dict((name, _classes(decorator)) for name, decorator in VARIANTS
+               if decorator is not None)
+
+# Statements dropping the cached value of obj.value
+INVALIDATE = {
+    'property': 'pass',
+    'cached_property': "obj.__dict__.pop('value', None)",
+    'lazy': "lazy.invalidate(obj, 'value')",
+    'cached': "cached.invalidate(obj, 'value')",
+    'locked': "locked.invalidate(obj, 'value')",
+}
+
+SETUP = ('from lazy.benchmarks.bench import CLASSES, lazy, cached, locked\n'
+         'classes = CLASSES[%r]\n'
+         'Plain = classes["plain"]\n'
+         'Private = classes["private"]\n'
+         'Deep = classes["deep"]\n'
+         'obj = Plain()\n'
+         'obj.value\n')
+
+# Name, statement, and description of the timeit benchmarks
+BENCHMARKS = [
+    ('cold', 'Plain().value', 'first access on a new instance'),
+    ('warm', 'obj.value', 'access of a computed value'),
+    ('invalidate', None, 'invalidate and recompute'),
+    ('deep', 'Deep().value', 'first access, attribute inherited over 10 classes'),
+    ('private', 'Private().get()', 'first access of a private attribute'),
+]
+
+
+def run_timeit(benchmark, variant, stmt, number, repeat):
+    """Return the best time per operation in seconds."""
+    if stmt is None:
+        stmt = '%s; obj.value' % INVALIDATE[variant]
+    timer = timeit.Timer(stmt, SETUP % variant)
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run_threads(variant, threads, number, repeat):
+    """Return the best time per round in seconds with 'threads' threads
+    reading the attribute of the same new instance twice, so they
+    contend for its computation.
+    """
+    cls = CLASSES[variant]['plain']
+    # Rounds synchronize all threads twice, which costs far more than
+    # the reads, so there are fewer of them
+    rounds = max(number // 100, 1)
+    start = _Barrier(threads + 1)
+    done = _Barrier(threads + 1)
+    shared = [None]
+    best = None
+
+    def target():
+        for i in range(rounds):
+            start.wait()
+            obj = shared[0]
+            obj.value
+            obj.value
+            done.wait()
+
+    for i in range(repeat):
+        workers = [threading.Thread(target=target) for j in range(threads)]
+        for worker in workers:
+            worker.start()
+        begin = timeit.default_timer()
+        for j in range(rounds):
+            # A cold instance per round, replaced while the threads wait
+            shared[0] = cls()
+            start.wait()
+            done.wait()
+        elapsed = (timeit.default_timer() - begin) / rounds
+        for worker in workers:
+            worker.join()
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+class _Barrier(object):
+    """Reusable threading.Barrier for Python 2"""
+
+    def __init__(self, parties):
+        self.parties = parties
+        self.count = 0
+        self.generation = 0
+        self.condition = threading.Condition()
+
+    def wait(self):
+        with self.condition:
+            generation = self.generation
+            self.count += 1
+            if self.count == self.parties:
+                self.count = 0
+                self.generation += 1
+                self.condition.notify_all()
+            while generation == self.generation:
+                self.condition.wait()
+
+
+def run(benchmarks=None, variants=None, number=100000, repeat=5, threads=4):
+    """Run the benchmarks and return the results as a dict."""
+    results = []
+
+    for variant, decorator in VARIANTS:
+        if variant not in CLASSES or (variants and variant not in variants):
+            continue
+
+        for benchmark, stmt, description in BENCHMARKS:
+            if benchmarks and benchmark not in benchmarks:
+                continue
+            seconds = run_timeit(benchmark, variant, stmt, number, repeat)
+            results.append(_result(benchmark, variant, seconds, number, repeat))
+
+        if not benchmarks or 'threads' in benchmarks:
+            seconds = run_threads(variant, threads, number, repeat)
+            results.append(_result('threads', variant, seconds, number, repeat))
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def _result(benchmark, variant, seconds, number, repeat):
+    return {
+        'benchmark': benchmark,
+        'variant': variant,
+        'ns_per_op': round(seconds * 1e9, 2),
+        'number': number,
+        'repeat': repeat,
+    }
+
+
+def compare(results, baseline, tolerance=0.25):
+    """Return (benchmark, variant, baseline, current) tuples of the
+    benchmarks that are slower than in the baseline by more than
+    'tolerance', a fraction.
+    """
+    previous = dict(((r['benchmark'], r['variant']), r['ns_per_op']) for r in baseline['results'])
+    regressions = []
+
+    for r in results['results']:
+        key = (r['benchmark'], r['variant'])
+        if key in previous and r['ns_per_op'] > previous[key] * (1 + tolerance):
+            regressions.append(key + (previous[key], r['ns_per_op']))
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Benchmark lazy attributes.')
+    parser.add_argument('-b', '--benchmark', action='append',
+                        help='benchmark to run, may be repeated (default: all)')
+    parser.add_argument('-v', '--variant', action='append',
+                        help='variant to run, may be repeated (default: all)')
+    parser.add_argument('-n', '--number', type=int, default=100000,
+                        help='operations per repeat (default: 100000)')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='repeats, the best is reported (default: 5)')
+    parser.add_argument('-t', '--threads', type=int, default=4,
+                        help='threads of the threads benchmark (default: 4)')
+    parser.add_argument('-o', '--output', help='write results to file')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='compare with results in file')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown as a fraction (default: 0.25)')
+    args = parser.parse_args(args)
+
+    results = run(args.benchmark, args.variant, args.number, args.repeat, args.threads)
+    output = json.dumps(results, indent=2, sort_keys=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for benchmark, variant, before, after in regressions:
+            sys.stderr.write('%s/%s: %.2f ns -> %.2f ns\n' % (benchmark, variant, before, after))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
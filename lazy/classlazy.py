@@ -0,0 +1,71 @@
+"""Decorator to create lazy class attributes."""
+
+from .lazy import lazy, _record, _storage_name
+
+_marker = object()
+
+
+class classlazy(lazy):
+    """classlazy descriptor
+
+    Like lazy but the decorated function receives the class and the
+    value is computed once per class. Subclasses compute their own
+    values. Values are stored in the class __dict__.
+    """
+
+    def __get__(self, inst, owner):
+        if owner is None:
+            owner = inst.__class__
+
+        if inst is not None and self._metrics is not None:
+            # Metrics make lazy a data descriptor, so instance values
+            # no longer shadow the class attribute by themselves
+            value = getattr(inst, '__dict__', {}).get(_storage_name(self, inst), _marker)
+            if value is not _marker:
+                return value
+
+        key = self.__key(owner)
+        value = owner.__dict__.get(key, _marker)
+        if value is _marker:
+            value = self._compute(owner, key)
+            type.__setattr__(owner, key, value)
+        elif self._metrics is not None:
+            _record(self, 'hit', owner)
+        return value
+
+    def __key(self, owner):
+        # Values are stored under '__lazy_' + the mangled name
+        name = self.__name__
+        if name.startswith('__') and not name.endswith('__'):
+            name = '_%s%s' % (owner.__name__, name)
+        return '__lazy_' + name
+
+    def _has_value(self, inst, name):
+        owner = inst if isinstance(inst, type) else inst.__class__
+        return self.__key(owner) in owner.__dict__
+
+    def _store(self, inst, name, value):
+        owner = inst if isinstance(inst, type) else inst.__class__
+        type.__setattr__(owner, self.__key(owner), value)
+
+    def _invalidate(self, inst, name):
+        # Invalidating instances leaves the class alone
+        if not isinstance(inst, type):
+            return
+
+        pending = [inst]
+        while pending:
+            owner = pending.pop()
+            key = self.__key(owner)
+            if key in owner.__dict__:
+                type.__delattr__(owner, key)
+            pending.extend(owner.__subclasses__())
+
+    @classmethod
+    def invalidate(cls, owner, name, *names):
+        """Invalidate one or more lazy class attributes of class 'owner'
+        and its subclasses.
+        """
+        for name in (name,) + names:
+            name, descriptor = cls._lookup(owner, name)
+            descriptor._invalidate(owner, name)
@@ -0,0 +1,26 @@
+from typing import TypeVar, Callable, Type, Optional, Any, overload
+from typing_extensions import Self
+
+from .lazy import lazy, _Tags
+
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+
+
+class classlazy(lazy[_R]):
+
+    @overload
+    def __new__(cls, func: Callable[[Any], _R], tags: _Tags = ...) -> Self: ...
+
+    @overload
+    def __new__(cls, *, tags: _Tags = ...) -> _classlazy_decorator: ...
+
+    def __get__(self, inst: Optional[object], owner: Optional[Type[Any]] = ...) -> _R: ...  # type: ignore[override]
+
+    @classmethod
+    def invalidate(cls, owner: Type[Any], name: str, *names: str) -> None: ...  # type: ignore[override]
+
+
+class _classlazy_decorator(classlazy[Any]):
+
+    def __call__(self, func: Callable[[Any], _T]) -> classlazy[_T]: ...
@@ -0,0 +1,164 @@
+"""Decorator to create lazy attributes with a memory budget."""
+
+import sys
+import threading
+import weakref
+
+from collections import OrderedDict
+
+from .lazy import lazy, _record, _storage_name
+
+_marker = object()
+
+
+class evictable(lazy):
+    """evictable descriptor
+
+    Like lazy but values are registered in a process-wide LRU. When the
+    LRU exceeds its budget, the least recently used values are dropped
+    from their instances and computed again on next access. 'cost' is
+    the cost of a value in bytes, or a function returning it. It
+    defaults to sys.getsizeof.
+    """
+
+    def __init__(self, func, cost=None, **options):
+        lazy.__init__(self, func, **options)
+        self.__cost = cost
+
+    def __get__(self, inst, owner):
+        if inst is None:
+            return self
+
+        if not hasattr(inst, '__dict__'):
+            raise AttributeError("'%s' object has no attribute '__dict__'" % (owner.__name__,))
+
+        name = self.__name__
+        if name.startswith('__') and not name.endswith('__'):
+            name = '_%s%s' % (owner.__name__, name)
+
+        value = inst.__dict__.get(name, _marker)
+        if value is not _marker:
+            _lru.touch(inst, name)
+            if self._metrics is not None:
+                _record(self, 'hit', inst)
+            return value
+
+        value = lazy.__get__(self, inst, owner)
+        _lru.add(inst, name, self.__value_cost(value))
+        return value
+
+    def __set__(self, inst, value):
+        self._store(inst, _storage_name(self, inst), value)
+
+    def __delete__(self, inst):
+        name = _storage_name(self, inst)
+        if name not in inst.__dict__:
+            raise AttributeError(name)
+        self._invalidate(inst, name)
+
+    def __value_cost(self, value):
+        cost = self.__cost
+        if cost is None:
+            return sys.getsizeof(value)
+        if callable(cost):
+            return cost(value)
+        return cost
+
+    def _store(self, inst, name, value):
+        inst.__dict__[name] = value
+        _lru.add(inst, name, self.__value_cost(value))
+
+    def _invalidate(self, inst, name):
+        lazy._invalidate(self, inst, name)
+        _lru.remove(inst, name)
+
+    @classmethod
+    def configure(cls, max_entries=None, max_bytes=None):
+        """Set the budget of the LRU. None means unlimited."""
+        _lru.configure(max_entries, max_bytes)
+
+    @classmethod
+    def usage(cls):
+        """Return the number of entries and bytes held by the LRU."""
+        return _lru.usage()
+
+    @classmethod
+    def evict_all(cls):
+        """Drop all values held by the LRU."""
+        _lru.clear()
+
+
+class _LRU(object):
+    """Process-wide LRU of evictable values."""
+
+    def __init__(self):
+        # Reentrant because weakref callbacks may run during eviction
+        self.lock = threading.RLock()
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.budget = (None, None)
+
+    def configure(self, max_entries, max_bytes):
+        with self.lock:
+            self.budget = (max_entries, max_bytes)
+            self.evict()
+
+    def usage(self):
+        with self.lock:
+            return len(self.entries), self.bytes
+
+    def clear(self):
+        with self.lock:
+            budget = self.budget
+            self.budget = (0, None)
+            try:
+                self.evict()
+            finally:
+                self.budget = budget
+
+    def add(self, inst, name, cost):
+        key = (id(inst), name)
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                self.bytes -= entry[1]
+            self.entries[key] = (weakref.ref(inst, self.remover(key)), cost)
+            self.bytes += cost
+            self.evict()
+
+    def touch(self, inst, name):
+        key = (id(inst), name)
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                self.entries[key] = entry
+
+    def remove(self, inst, name):
+        with self.lock:
+            entry = self.entries.pop((id(inst), name), None)
+            if entry is not None:
+                self.bytes -= entry[1]
+
+    def remover(self, key):
+        # Drop the entry when the instance goes away
+        def remove(ref):
+            with self.lock:
+                entry = self.entries.get(key)
+                if entry is not None and entry[0] is ref:
+                    del self.entries[key]
+                    self.bytes -= entry[1]
+        return remove
+
+    def evict(self):
+        max_entries, max_bytes = self.budget
+        entries = self.entries
+        while entries and ((max_entries is not None and len(entries) > max_entries) or
+                           (max_bytes is not None and self.bytes > max_bytes)):
+            (key, name), (ref, cost) = entries.popitem(last=False)
+            self.bytes -= cost
+            inst = ref()
+            if inst is not None:
+                inst.__dict__.pop(name, None)
+
+
+_lru = _LRU()
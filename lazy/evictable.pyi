@@ -0,0 +1,38 @@
+from typing import TypeVar, Callable, Tuple, Union, Optional, Any, overload
+from typing_extensions import Self
+
+from .lazy import lazy, _Tags, _Names
+
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+
+_Cost = Union[int, Callable[[Any], int], None]
+
+
+class evictable(lazy[_R]):
+
+    @overload
+    def __new__(cls, func: Callable[[Any], _R], cost: _Cost = ..., tags: _Tags = ...,
+                depends_on: _Names = ...) -> Self: ...
+
+    @overload
+    def __new__(cls, *, cost: _Cost = ..., tags: _Tags = ...,
+                depends_on: _Names = ...) -> _evictable_decorator: ...
+
+    def __set__(self, inst: object, value: _R) -> None: ...
+
+    def __delete__(self, inst: object) -> None: ...
+
+    @classmethod
+    def configure(cls, max_entries: Optional[int] = ..., max_bytes: Optional[int] = ...) -> None: ...
+
+    @classmethod
+    def usage(cls) -> Tuple[int, int]: ...
+
+    @classmethod
+    def evict_all(cls) -> None: ...
+
+
+class _evictable_decorator(evictable[Any]):
+
+    def __call__(self, func: Callable[[Any], _T]) -> evictable[_T]: ...
@@ -1,7 +1,23 @@
 from datetime import date
 from lazy import lazy
-
-from typing import TypeVar, Any
+from lazy import locked
+from lazy import awaitable
+from lazy import slotted
+from lazy import tracked
+from lazy import expiring
+from lazy import evictable
+from lazy import persistent
+from lazy import backoff
+from lazy import classlazy
+from lazy import lazymodule
+from lazy import streamed
+from lazy import memoized
+from lazy import mapped
+from lazy import batched
+from lazy import revalidating
+from lazy.persistent import SQLiteBackend
+
+from typing import TypeVar, Iterator, List, Optional, Any
 
 
 class C(object):
@@ -40,6 +56,38 @@ def f() -> None:
     c.quux.strftime('%y') == '10'
 
     lazy.invalidate(c, 'foo')
+    lazy.invalidate(c, 'foo', 'bar')
+    lazy.invalidate_all(c)
+
+    for name in lazy.attributes(C):
+        'hello ' + name
+    for name in lazy.computed(c):
+        'hello ' + name
+
+    for name, future in lazy.prefetch(c, ['foo', 'bar']).items():
+        'hello ' + name
+        future.result()
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor() as executor:
+        1 + lazy.compute_many([C(), C()], 'baz', executor=executor, chunksize=2)
+
+    1 + lazy.materialize(c)['attributes']
+    1 + lazy.materialize([C(), C()], recursive=True, freeze=False)['seconds']
+
+    def hook(event: str, descriptor: lazy[Any], inst: Any, elapsed: Optional[float]) -> None:
+        'hello ' + event + descriptor.__name__
+
+    lazy.enable_metrics(hook)
+    for name, stats in lazy.metrics().items():
+        'hello ' + name
+        1 + stats['hits'] + stats['total_time']
+    lazy.reset_metrics()
+    lazy.disable_metrics()
+
+    for name, entry in lazy.footprint([c]).items():
+        'hello ' + name
+        1 + entry['bytes']
 
     type(C.foo) == lazy
     type(C.bar) == lazy
@@ -131,10 +179,336 @@ def j() -> None:
     Z.foo.__name__ == 'bar'
 
 
+# Check tags
+class T(object):
+    @lazy(tags='db')
+    def foo(self) -> str:
+        return 'foo'
+
+    @lazy(tags=('db', 'http'))
+    def bar(self) -> int:
+        return 42
+
+
+def l() -> None:
+    t = T()
+    'hello ' + t.foo
+    1 + t.bar
+    lazy.invalidate_all(t, tags='db')
+    lazy.invalidate_all(t, tags=['db', 'http'])
+
+
+# Check locked
+class L(object):
+    @locked
+    def foo(self) -> str:
+        return 'foo'
+
+
+def k() -> None:
+    x = L()
+    'hello ' + x.foo
+    locked.invalidate(x, 'foo')
+
+
+# Check awaitable
+class A(object):
+    @awaitable
+    async def foo(self) -> str:
+        return 'foo'
+
+
+async def m() -> None:
+    a = A()
+    'hello ' + await a.foo
+    awaitable.invalidate(a, 'foo')
+
+
+# Check slotted
+class S(object):
+    __slots__ = ('_foo', 'cache', '__weakref__')
+
+    @slotted
+    def foo(self) -> str:
+        return 'foo'
+
+    @slotted(slot='cache')
+    def bar(self) -> int:
+        return 42
+
+
+def n() -> None:
+    s = S()
+    'hello ' + s.foo
+    1 + s.bar
+    slotted.invalidate(s, 'foo')
+
+
+# Check tracked
+class R(object):
+    @tracked
+    def rows(self) -> list[int]:
+        return [1, 2, 3]
+
+    @tracked
+    def total(self) -> int:
+        return sum(self.rows)
+
+
+def o() -> None:
+    r = R()
+    1 + r.total
+    r.rows = [4, 5, 6]
+    del r.rows
+    for name in tracked.dependents(r, 'rows'):
+        'hello ' + name
+
+
+# Check expiring
+class X(object):
+    @expiring(ttl=10, jitter=1.5, lock=True)
+    def foo(self) -> str:
+        return 'foo'
+
+
+def p() -> None:
+    x = X()
+    'hello ' + x.foo
+    x.foo = 'bar'
+    expiring.invalidate(x, 'foo')
+
+
+# Check evictable
+class V(object):
+    @evictable(cost=len)
+    def foo(self) -> str:
+        return 'foo'
+
+    @evictable
+    def bar(self) -> int:
+        return 42
+
+
+def q() -> None:
+    evictable.configure(max_entries=1000, max_bytes=1024)
+    v = V()
+    'hello ' + v.foo
+    1 + v.bar
+    entries, size = evictable.usage()
+    1 + entries + size
+    evictable.evict_all()
+
+
+# Check transient
+@lazy.transient
+class T1(object):
+    @lazy
+    def foo(self) -> str:
+        return 'foo'
+
+
+@lazy.transient(keep=['foo'])
+class T2(T1):
+    pass
+
+
+def t() -> None:
+    import copy
+    'hello ' + copy.copy(T1()).foo
+    'hello ' + copy.copy(T2()).foo
+
+
+# Check persistent
+class W(object):
+    @persistent(backend=SQLiteBackend(':memory:'), key=id)
+    def foo(self) -> str:
+        return 'foo'
+
+
+def s() -> None:
+    w = W()
+    'hello ' + w.foo
+    persistent.invalidate(w, 'foo')
+
+
+# Check backoff
+class B(object):
+    @backoff(delay=0.5, factor=3, max_delay=10, exceptions=(ValueError, KeyError))
+    def foo(self) -> str:
+        return 'foo'
+
+    @backoff
+    def bar(self) -> int:
+        return 42
+
+
+def u() -> None:
+    b = B()
+    'hello ' + b.foo
+    1 + b.bar
+    error = backoff.failure(b, 'foo')
+    if error is not None:
+        error.args
+
+
+# Check classlazy
+class K(object):
+    @classlazy
+    def foo(cls: Any) -> str:
+        return str(cls.__name__)
+
+
+def w() -> None:
+    'hello ' + K.foo
+    'hello ' + K().foo
+    classlazy.invalidate(K, 'foo')
+
+
+# Check streamed
+class G(object):
+    @streamed
+    def foo(self) -> Iterator[str]:
+        yield 'foo'
+        yield 'bar'
+
+
+def x() -> None:
+    g = G()
+    'hello ' + g.foo[0]
+    for item in g.foo[:1]:
+        'hello ' + item
+    for item in g.foo:
+        'hello ' + item
+    1 + g.foo.consumed + len(g.foo)
+
+
+# Check depends_on
+class H(object):
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+
+    @lazy(depends_on=('width', 'height'))
+    def area(self) -> int:
+        return self.width * self.height
+
+
+def z() -> None:
+    h = H(2, 3)
+    1 + h.area
+    h.width = 4
+    1 + h.area
+
+
+# Check lazymodule
+module = lazymodule(__name__)
+module.imports(json='json', loads='json:loads')
+
+
+@module.attribute('TABLE')
+def _table() -> str:
+    return 'table'
+
+
+def y() -> None:
+    module.invalidate('TABLE', 'json')
+    'hello ' + _table()
+
+
+
+# Check memoized
+class M(object):
+    @memoized(maxsize=16)
+    def foo(self, name: str, count: int = 1) -> str:
+        return name * count
+
+    @memoized
+    def bar(self, x: int) -> int:
+        return x
+
+
+def v() -> None:
+    m = M()
+    'hello ' + m.foo('a')
+    'hello ' + m.foo('a', count=2)
+    1 + m.bar(1)
+    lazy.invalidate(m, 'foo')
+
+
+
+# Check mapped
+class N(object):
+    @mapped
+    def foo(self) -> str:
+        return __file__
+
+
+def r() -> None:
+    n = N()
+    1 + len(n.foo)
+    b'hello ' + n.foo[:5].tobytes()
+    lazy.invalidate(n, 'foo')
+
+
+
+# Check batched
+class O(object):
+    @batched
+    def foo(objs: List['O']) -> List[str]:
+        return ['foo' for obj in objs]
+
+    @batched(size=10)
+    def bar(objs: List['O']) -> List[int]:
+        return [1 for obj in objs]
+
+
+def e() -> None:
+    for o in batched.batch(O() for i in range(3)):
+        'hello ' + o.foo
+        1 + o.bar
+
+
+
+# Check revalidating
+class P(object):
+    @revalidating(ttl=60, max_stale=300)
+    def foo(self) -> str:
+        return 'foo'
+
+    @revalidating(ttl=60)
+    def bar(self) -> int:
+        return 1
+
+
+def a() -> None:
+    p = P()
+    'hello ' + p.foo
+    1 + p.bar
+    p.bar = 2
+    lazy.invalidate(p, 'foo')
+
+
 if __name__ == '__main__':
     f()
     g()
     h()
     i()
     j()
+    l()
+    k()
+    n()
+    o()
+    p()
+    q()
+    s()
+    t()
+    u()
+    w()
+    x()
+    y()
+    z()
+    v()
+    r()
+    e()
+    a()
 
@@ -0,0 +1,84 @@
+"""Decorator to create lazy attributes with a time-to-live."""
+
+import time
+import random
+
+from .lazy import lazy, _record, _storage_name
+from .locked import _Locks
+
+try:
+    _clock = time.monotonic
+except AttributeError:
+    _clock = time.time
+
+
+class expiring(lazy):
+    """expiring descriptor
+
+    Like lazy but the value expires 'ttl' seconds after it was computed
+    and is computed again on the next access. Up to 'jitter' seconds are
+    added to the ttl at random. If 'lock' is true, one thread computes
+    the value and concurrent readers wait for its result.
+    """
+
+    def __init__(self, func, ttl, jitter=0, lock=False, **options):
+        lazy.__init__(self, func, **options)
+        self.__ttl = ttl
+        self.__jitter = jitter
+        self.__locks = _Locks() if lock else None
+
+    def __get__(self, inst, owner):
+        if inst is None:
+            return self
+
+        if not hasattr(inst, '__dict__'):
+            raise AttributeError("'%s' object has no attribute '__dict__'" % (owner.__name__,))
+
+        name = self.__name__
+        if name.startswith('__') and not name.endswith('__'):
+            name = '_%s%s' % (owner.__name__, name)
+
+        # The instance __dict__ holds (value, deadline) tuples
+        entry = inst.__dict__.get(name)
+        if entry is not None and _clock() < entry[1]:
+            if self._metrics is not None:
+                _record(self, 'hit', inst)
+            return entry[0]
+
+        if self.__locks is None:
+            return self.__refresh(inst, name)
+        return self.__locks.call(inst, self.__refresh_expired, inst, name)
+
+    def __set__(self, inst, value):
+        self._store(inst, _storage_name(self, inst), value)
+
+    def __delete__(self, inst):
+        name = _storage_name(self, inst)
+        if name not in inst.__dict__:
+            raise AttributeError(name)
+        del inst.__dict__[name]
+
+    def __deadline(self):
+        ttl = self.__ttl
+        if self.__jitter:
+            ttl += random.random() * self.__jitter
+        return _clock() + ttl
+
+    def __refresh(self, inst, name):
+        value = self._compute(inst, name)
+        self._store(inst, name, value)
+        return value
+
+    def __refresh_expired(self, inst, name):
+        # Another thread may have refreshed the value while we waited
+        entry = inst.__dict__.get(name)
+        if entry is not None and _clock() < entry[1]:
+            return entry[0]
+        return self.__refresh(inst, name)
+
+    def _store(self, inst, name, value):
+        inst.__dict__[name] = (value, self.__deadline())
+
+    def _has_value(self, inst, name):
+        entry = getattr(inst, '__dict__', {}).get(name)
+        return entry is not None and _clock() < entry[1]
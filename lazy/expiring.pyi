@@ -0,0 +1,28 @@
+from typing import TypeVar, Callable, Any, overload
+from typing_extensions import Self
+
+from .lazy import lazy, _Tags, _Names
+
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+
+
+class expiring(lazy[_R]):
+
+    @overload
+    def __new__(cls, func: Callable[[Any], _R], ttl: float, jitter: float = ...,
+                lock: bool = ..., tags: _Tags = ..., depends_on: _Names = ...) -> Self: ...
+
+    @overload
+    def __new__(cls, *, ttl: float, jitter: float = ...,
+                lock: bool = ..., tags: _Tags = ...,
+                depends_on: _Names = ...) -> _expiring_decorator: ...
+
+    def __set__(self, inst: object, value: _R) -> None: ...
+
+    def __delete__(self, inst: object) -> None: ...
+
+
+class _expiring_decorator(expiring[Any]):
+
+    def __call__(self, func: Callable[[Any], _T]) -> expiring[_T]: ...
@@ -1,13 +1,45 @@
 """Decorator to create lazy attributes."""
 
+import gc
+import os
 import sys
+import time
+import types
+import weakref
+import threading
 import functools
 
+try:
+    import copyreg
+except ImportError:
+    import copy_reg as copyreg
+
 if sys.version_info >= (3, 9):
     from types import GenericAlias
 
 _marker = object()
 
+_indexes = weakref.WeakKeyDictionary()
+
+# Names of all attributes lazy attributes depend on
+_inputs = set()
+
+# Python < 3.6 does not call __set_name__
+_set_name = sys.version_info >= (3, 6)
+
+_pending = {}
+_pending_lock = threading.RLock()
+_local = threading.local()
+_executor = None
+
+_metrics_lock = threading.Lock()
+_hook = None
+
+try:
+    _timer = time.perf_counter
+except AttributeError:
+    _timer = time.time
+
 
 class lazy(object):
     """lazy descriptor
@@ -16,12 +48,38 @@ class lazy(object):
     are evaluated on first use.
     """
 
-    def __init__(self, func):
+    # Metrics by descriptor while metrics are enabled
+    _metrics = None
+
+    # Computed by lazy.materialize()
+    _materialize = True
+
+    def __new__(cls, func=None, **options):
+        if func is None:
+            # Called with options only, return a decorator
+            return functools.partial(cls, **options)
+        return object.__new__(cls)
+
+    def __init__(self, func, tags=(), depends_on=()):
         self.__func = func
         functools.wraps(self.__func)(self)
+        if isinstance(tags, str):
+            tags = (tags,)
+        self.__tags = frozenset(tags)
+        if isinstance(depends_on, str):
+            depends_on = (depends_on,)
+        self.__depends_on = frozenset(depends_on)
+
+    def __getnewargs__(self):
+        # Copies and pickles call __new__, which needs func to not
+        # return a decorator
+        return (self.__func,)
 
     def __set_name__(self, owner, name):
         self.__name__ = name
+        _forget(owner)
+        if self.__depends_on:
+            _watch(owner)
 
     def __get__(self, inst, owner):
         if inst is None:
@@ -35,31 +93,768 @@ class lazy(object):
             name = '_%s%s' % (owner.__name__, name)
 
         value = inst.__dict__.get(name, _marker)
+        if value is _marker and _pending:
+            future = _join(inst, name)
+            if future is not None:
+                # The prefetch stored the value
+                future.result()
+                value = inst.__dict__.get(name, _marker)
         if value is _marker:
-            inst.__dict__[name] = value = self.__func(inst)
+            inst.__dict__[name] = value = self._compute(inst, name)
+        elif self._metrics is not None:
+            _record(self, 'hit', inst)
         return value
 
+    def _compute(self, inst, name):
+        # Extension point for subclasses: return the value to be
+        # stored under 'name' in the instance __dict__.
+        if self.__depends_on and not _set_name:
+            _watch(inst.__class__)
+        if _pending and not _overrides(self, '_compute'):
+            # Subclasses with their own __get__ join here, the result
+            # of their __get__ is the result of the function
+            future = _join(inst, name)
+            if future is not None:
+                return future.result()
+        if self._metrics is not None:
+            return _measure(self, self.__func, inst)
+        return self.__func(inst)
+
     @classmethod
-    def invalidate(cls, inst, name):
-        """Invalidate a lazy attribute.
+    def invalidate(cls, inst, name, *names):
+        """Invalidate one or more lazy attributes.
 
         This obviously violates the lazy contract. A subclass of lazy
         may however have a contract where invalidation is appropriate.
         """
         owner = inst.__class__
 
-        if not hasattr(inst, '__dict__'):
-            raise AttributeError("'%s' object has no attribute '__dict__'" % (owner.__name__,))
+        for name in (name,) + names:
+            name, descriptor = cls._lookup(owner, name)
+            if descriptor._metrics is not None and descriptor._has_value(inst, name):
+                _record(descriptor, 'invalidate', inst)
+            descriptor._invalidate(inst, name)
+
+    @classmethod
+    def invalidate_all(cls, inst, tags=None):
+        """Invalidate all lazy attributes of an instance.
 
+        If tags are given, invalidate only the attributes carrying at
+        least one of the tags.
+        """
+        index = _index(inst.__class__)
+
+        if tags is None:
+            items = index.descriptors.items()
+        else:
+            if isinstance(tags, str):
+                tags = (tags,)
+            items = {}
+            for tag in tags:
+                items.update(index.tags.get(tag, ()))
+            items = items.items()
+
+        for name, descriptor in items:
+            if isinstance(descriptor, cls):
+                if descriptor._metrics is not None and descriptor._has_value(inst, name):
+                    _record(descriptor, 'invalidate', inst)
+                descriptor._invalidate(inst, name)
+
+    @classmethod
+    def prefetch(cls, inst, names=None, executor=None):
+        """Start computing lazy attributes in the background.
+
+        Computes the attributes in 'names', or all uncomputed attributes
+        except memoized and awaitable ones, in a concurrent.futures
+        executor. Accessing an attribute while it
+        is computed waits for the result. Returns a dict mapping names
+        to futures.
+        """
+        owner = inst.__class__
+
+        prefetch_all = names is None
+        if prefetch_all:
+            names = cls.attributes(owner)
+        elif isinstance(names, str):
+            names = (names,)
+
+        if executor is None:
+            executor = _default_executor()
+
+        futures = {}
+        for name in names:
+            name, descriptor = cls._lookup(owner, name)
+            if descriptor._has_value(inst, name):
+                continue
+            if prefetch_all and not descriptor._materialize:
+                continue
+
+            key = (id(inst), name)
+            with _pending_lock:
+                future = _pending.get(key)
+                if future is None:
+                    future = _pending[key] = executor.submit(_prefetch, descriptor, inst, owner, key)
+            futures[name] = future
+        return futures
+
+    @classmethod
+    def compute_many(cls, instances, name, executor=None, chunksize=1):
+        """Compute lazy attribute 'name' of many instances in parallel.
+
+        The undecorated function runs in a concurrent.futures executor,
+        a ProcessPoolExecutor by default, and the results are stored in
+        the instances. Instances must be picklable when a process pool
+        is used. Instances that have already computed the attribute are
+        skipped. Returns the number of values computed. Raises TypeError
+        for lazy subclasses which compute values differently, and for
+        classlazy.
+        """
+        from .classlazy import classlazy
+
+        todo = []
+        seen = set()
+        for inst in instances:
+            if id(inst) in seen:
+                continue
+            seen.add(id(inst))
+            storage_name, descriptor = cls._lookup(inst.__class__, name)
+            if _overrides(descriptor, '_compute') or isinstance(descriptor, classlazy):
+                # The undecorated function does not compute the value
+                # of the instance
+                raise TypeError("compute_many does not support %s attribute '%s.%s'" % (
+                    type(descriptor).__name__, inst.__class__.__name__, storage_name))
+            if not descriptor._has_value(inst, storage_name):
+                todo.append((inst, storage_name, descriptor))
+
+        if not todo:
+            return 0
+
+        shutdown = False
+        if executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor()
+            shutdown = True
+
+        try:
+            values = executor.map(_compute_one,
+                                  [inst.__class__ for inst, storage_name, descriptor in todo],
+                                  [storage_name for inst, storage_name, descriptor in todo],
+                                  [inst for inst, storage_name, descriptor in todo],
+                                  chunksize=chunksize)
+            for (inst, storage_name, descriptor), value in zip(todo, values):
+                descriptor._store(inst, storage_name, value)
+        finally:
+            if shutdown:
+                executor.shutdown()
+
+        return len(todo)
+
+    @classmethod
+    def materialize(cls, roots, recursive=False, freeze=False):
+        """Compute all lazy attributes of one or more objects.
+
+        Meant to be called before forking worker processes, so workers
+        start with computed values and share their memory pages. 'roots'
+        is an object or a list, tuple, or set of objects. If 'recursive'
+        is true, objects reachable through instance attributes, lazy
+        attributes, and containers are included. If 'freeze' is true,
+        gc.freeze() is called afterwards, on Python >= 3.7. Returns a
+        dict with the number of 'objects' and 'attributes' computed and
+        the 'seconds' spent.
+        """
+        start = _timer()
+        objects = attributes = 0
+
+        if isinstance(roots, (list, tuple, set, frozenset)):
+            stack = list(roots)
+        else:
+            stack = [roots]
+        stack.reverse()
+        seen = {}
+
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen or isinstance(obj, type):
+                continue
+            seen[id(obj)] = obj
+
+            computed = 0
+            index = _index(obj.__class__)
+            for name in index.attributes(cls)[0]:
+                descriptor = index.descriptors[name]
+                if descriptor._materialize and not descriptor._has_value(obj, name):
+                    getattr(obj, name)
+                    computed += 1
+            if computed:
+                objects += 1
+                attributes += computed
+
+            if recursive:
+                stack.extend(reversed(_children(obj)))
+
+        if freeze and hasattr(gc, 'freeze'):
+            gc.collect()
+            gc.freeze()
+
+        return {'objects': objects, 'attributes': attributes, 'seconds': _timer() - start}
+
+    @classmethod
+    def _lookup(cls, owner, name):
+        # Return the storage name and descriptor of attribute 'name'
         if name.startswith('__') and not name.endswith('__'):
             name = '_%s%s' % (owner.__name__, name)
 
-        if not isinstance(getattr(owner, name), cls):
+        descriptor = _index(owner).descriptors.get(name)
+        if descriptor is None:
+            descriptor = getattr(owner, name)
+
+        if not isinstance(descriptor, cls):
             raise AttributeError("'%s.%s' is not a %s attribute" % (owner.__name__, name, cls.__name__))
 
+        return name, descriptor
+
+    @classmethod
+    def attributes(cls, owner):
+        """Return the names of the lazy attributes of a class.
+
+        Inherited attributes are included. Private attributes are
+        returned by their mangled names.
+        """
+        return _index(owner).attributes(cls)[0]
+
+    @classmethod
+    def computed(cls, inst):
+        """Return the names of the lazy attributes an instance has
+        already computed.
+        """
+        d = getattr(inst, '__dict__', ())
+        return tuple(name for name, descriptor in _index(inst.__class__).attributes(cls)[1]
+                     if (name in d if descriptor is None else descriptor._has_value(inst, name)))
+
+    @classmethod
+    def transient(cls, owner=None, keep=()):
+        """Class decorator making pickle and copy drop computed lazy
+        attributes.
+
+        Attributes named in 'keep' are pickled and copied as usual. May
+        be used with or without arguments.
+        """
+        if owner is None:
+            return functools.partial(cls.transient, keep=keep)
+
+        if isinstance(keep, str):
+            keep = (keep,)
+        names = []
+        for name in keep:
+            if name.startswith('__') and not name.endswith('__'):
+                name = '_%s%s' % (owner.__name__, name)
+            names.append(name)
+        keep = frozenset(names)
+
+        for base in owner.__mro__:
+            if base is not object and '__getstate__' in base.__dict__:
+                getstate = base.__dict__['__getstate__']
+                break
+        else:
+            getstate = getattr(object, '__getstate__', _getstate)
+
+        def __getstate__(self):
+            state = getstate(self)
+            drop = _index(self.__class__).transient(cls, keep)
+            if isinstance(state, dict):
+                return _without(state, drop)
+            if isinstance(state, tuple) and len(state) == 2 and isinstance(state[0], dict):
+                return (_without(state[0], drop), state[1])
+            return state
+
+        owner.__getstate__ = __getstate__
+        return owner
+
+    @classmethod
+    def enable_metrics(cls, hook=None):
+        """Start collecting metrics for all lazy attributes.
+
+        Counts hits, misses, invalidations and exceptions, and measures
+        compute times. If given, 'hook' is called for every event with
+        the event name, the descriptor, the instance, and the compute
+        time or None.
+        """
+        global _hook
+        with _metrics_lock:
+            _hook = hook
+            if lazy._metrics is None:
+                lazy._metrics = weakref.WeakKeyDictionary()
+                # Make reads of computed values go through __get__
+                lazy.__set__ = _set
+                lazy.__delete__ = _delete
+
+    @classmethod
+    def disable_metrics(cls):
+        """Stop collecting metrics and discard them."""
+        global _hook
+        with _metrics_lock:
+            _hook = None
+            if lazy._metrics is not None:
+                lazy._metrics = None
+                del lazy.__set__
+                del lazy.__delete__
+
+    @classmethod
+    def metrics(cls):
+        """Return a snapshot of the metrics collected so far.
+
+        Returns a dict mapping the qualified names of attributes to dicts
+        with the keys 'hits', 'misses', 'invalidations', 'exceptions',
+        'total_time', and 'max_time'.
+        """
+        snapshot = {}
+        with _metrics_lock:
+            for descriptor, stats in list((lazy._metrics or {}).items()):
+                if not isinstance(descriptor, cls):
+                    continue
+                func = descriptor.__func
+                key = '%s.%s' % (getattr(func, '__module__', None),
+                                 getattr(func, '__qualname__', descriptor.__name__))
+                stats.add_to(snapshot.setdefault(key, _Stats().as_dict()))
+        return snapshot
+
+    @classmethod
+    def reset_metrics(cls):
+        """Set all metrics back to zero."""
+        with _metrics_lock:
+            if lazy._metrics is not None:
+                lazy._metrics.clear()
+
+    @classmethod
+    def footprint(cls, instances=None):
+        """Estimate the memory held by computed lazy attributes.
+
+        Inspects 'instances', or all live objects tracked by the garbage
+        collector. Values are sized deeply, counting objects shared by
+        several values once. Returns a dict mapping the qualified names
+        of classes to dicts with the keys 'instances', 'bytes', and
+        'attributes', which maps attribute names to dicts with the keys
+        'count' and 'bytes'.
+        """
+        if instances is None:
+            instances = gc.get_objects()
+
+        found = []
+        classes = {}
+        for inst in instances:
+            owner = type(inst)
+            names = classes.get(owner)
+            if names is None:
+                names = classes[owner] = _has_lazy(owner) and _index(owner).attributes(cls)[0]
+            if names:
+                found.append((inst, names))
+
+        # Values referencing instances do not hold their memory
+        seen = set(id(inst) for inst, names in found)
+        report = {}
+
+        for inst, names in found:
+            owner = type(inst)
+            key = '%s.%s' % (owner.__module__, getattr(owner, '__qualname__', owner.__name__))
+            entry = report.get(key)
+            if entry is None:
+                entry = report[key] = {'instances': 0, 'bytes': 0, 'attributes': {}}
+            entry['instances'] += 1
+
+            index = _index(owner)
+            d = getattr(inst, '__dict__', {})
+            for name in names:
+                if name in d:
+                    value = d[name]
+                elif index.descriptors[name]._has_value(inst, name):
+                    value = getattr(inst, name)
+                else:
+                    continue
+                size = _sizeof(value, seen)
+                attribute = entry['attributes'].setdefault(name, {'count': 0, 'bytes': 0})
+                attribute['count'] += 1
+                attribute['bytes'] += size
+                entry['bytes'] += size
+
+        return report
+
+    def _has_value(self, inst, name):
+        # Extension point for subclasses: return True if a value is
+        # stored under 'name' in the instance.
+        return name in getattr(inst, '__dict__', ())
+
+    def _store(self, inst, name, value):
+        # Extension point for subclasses: store a value computed
+        # elsewhere under 'name' in the instance.
+        inst.__dict__[name] = value
+
+    def _invalidate(self, inst, name):
+        # Extension point for subclasses: remove the value stored
+        # under 'name' from the instance.
+        if not hasattr(inst, '__dict__'):
+            raise AttributeError("'%s' object has no attribute '__dict__'" % (inst.__class__.__name__,))
+
         if name in inst.__dict__:
             del inst.__dict__[name]
 
     if sys.version_info >= (3, 9):
         __class_getitem__ = classmethod(GenericAlias)
 
+
+class _Index(object):
+    """Lazy descriptors of a class, including inherited ones."""
+
+    def __init__(self, cls):
+        descriptors = {}
+        inputs = {}
+        seen = set()
+
+        for base in cls.__mro__:
+            for key, value in base.__dict__.items():
+                if key in seen:
+                    continue
+                seen.add(key)
+                # Attributes of subclasses shadow those of their bases
+                if isinstance(value, lazy):
+                    name = value.__name__
+                    if name.startswith('__') and not name.endswith('__'):
+                        name = '_%s%s' % (cls.__name__, name)
+                    if name in descriptors:
+                        continue
+                    descriptors[name] = value
+                    for input in value._lazy__depends_on:
+                        # Private names are mangled in the defining class
+                        if input.startswith('__') and not input.endswith('__'):
+                            input = '_%s%s' % (base.__name__, input)
+                        inputs.setdefault(input, []).append((name, value))
+
+        tags = {}
+        for name, descriptor in descriptors.items():
+            for tag in descriptor._lazy__tags:
+                tags.setdefault(tag, []).append((name, descriptor))
+
+        self.descriptors = descriptors
+        self.tags = tags
+        self.inputs = inputs
+        self.__attributes = {}
+        self.__transient = {}
+
+    def attributes(self, cls):
+        """Return the names and (name, descriptor) pairs of cls attributes,
+        sorted by name.
+
+        The descriptor is None if the value is stored in the instance
+        __dict__.
+        """
+        try:
+            return self.__attributes[cls]
+        except KeyError:
+            pass
+
+        attributes = []
+        for name in sorted(self.descriptors):
+            descriptor = self.descriptors[name]
+            if isinstance(descriptor, cls):
+                if not _overrides(descriptor, '_has_value'):
+                    descriptor = None
+                attributes.append((name, descriptor))
+
+        attributes = self.__attributes[cls] = (
+            tuple(name for name, descriptor in attributes), tuple(attributes))
+        return attributes
+
+    def transient(self, cls, keep):
+        """Return the names of cls attributes not in keep."""
+        try:
+            return self.__transient[cls, keep]
+        except KeyError:
+            pass
+
+        names = self.__transient[cls, keep] = tuple(
+            name for name in self.attributes(cls)[0] if name not in keep)
+        return names
+
+
+def _index(cls):
+    # Build the index once per class
+    try:
+        return _indexes[cls]
+    except KeyError:
+        index = _indexes[cls] = _Index(cls)
+        return index
+
+
+def _forget(cls):
+    # Drop the indexes of cls and its subclasses, which depend on it
+    pending = [cls]
+    while pending:
+        cls = pending.pop()
+        _indexes.pop(cls, None)
+        pending.extend(type.__subclasses__(cls))
+
+
+def _watch(cls):
+    # Wrap __setattr__ and __delattr__ of cls to invalidate lazy
+    # attributes when their inputs change
+    _inputs.update(_index(cls).inputs)
+    if getattr(cls.__setattr__, '_lazy_watch', False):
+        return
+
+    setattr_ = cls.__setattr__
+    delattr_ = cls.__delattr__
+
+    def __setattr__(self, name, value):
+        if name not in _inputs:
+            # Assignments to other attributes skip the index
+            return setattr_(self, name, value)
+        setattr_(self, name, value)
+        inputs = _index(self.__class__).inputs
+        if name in inputs:
+            _invalidate_dependents(self, name, inputs)
+
+    def __delattr__(self, name):
+        if name not in _inputs:
+            return delattr_(self, name)
+        delattr_(self, name)
+        inputs = _index(self.__class__).inputs
+        if name in inputs:
+            _invalidate_dependents(self, name, inputs)
+
+    __setattr__._lazy_watch = __delattr__._lazy_watch = True
+    type.__setattr__(cls, '__setattr__', __setattr__)
+    type.__setattr__(cls, '__delattr__', __delattr__)
+
+
+def _invalidate_dependents(inst, name, inputs):
+    # Invalidate the lazy attributes depending on 'name', and the
+    # attributes depending on those
+    pending = [name]
+    seen = set(pending)
+    while pending:
+        for dependent, descriptor in inputs.get(pending.pop(), ()):
+            if dependent not in seen:
+                seen.add(dependent)
+                if descriptor._metrics is not None and descriptor._has_value(inst, dependent):
+                    _record(descriptor, 'invalidate', inst)
+                descriptor._invalidate(inst, dependent)
+                pending.append(dependent)
+
+
+def _has_lazy(cls):
+    # Return True if cls has lazy attributes, without building an index
+    for base in getattr(cls, '__mro__', ()):
+        for value in base.__dict__.values():
+            if isinstance(value, lazy):
+                return True
+    return False
+
+
+def _sizeof(value, seen):
+    # Return the size of value and the objects it references, skipping
+    # the objects in seen and adding the others
+    size = 0
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _shared_types):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj, 0)
+        stack.extend(gc.get_referents(obj))
+    return size
+
+
+# Objects not held by lazy values
+_shared_types = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType)
+
+
+def _children(obj):
+    # Return the objects referenced by attributes or items of obj
+    if isinstance(obj, dict):
+        return list(obj.values())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return list(obj)
+    if isinstance(obj, (str, bytes, types.ModuleType, types.FunctionType)):
+        return []
+    return list(getattr(obj, '__dict__', {}).values())
+
+
+def _getstate(inst):
+    # object.__getstate__ of Python >= 3.11
+    state = getattr(inst, '__dict__', None) or None
+    slots = {}
+    for name in copyreg._slotnames(inst.__class__):
+        try:
+            slots[name] = getattr(inst, name)
+        except AttributeError:
+            pass
+    if slots:
+        return (state, slots)
+    return state
+
+
+def _without(d, names):
+    # Return d without names, copying only if necessary
+    for name in names:
+        if name in d:
+            break
+    else:
+        return d
+
+    d = d.copy()
+    for name in names:
+        d.pop(name, None)
+    return d
+
+
+def _overrides(descriptor, method):
+    # Return True if a lazy subclass overrides method
+    for cls in type(descriptor).__mro__:
+        if method in cls.__dict__:
+            return cls is not lazy
+    return False
+
+
+def _prefetch(descriptor, inst, owner, key):
+    # Compute the attribute in an executor thread
+    _local.prefetch = key
+    try:
+        return descriptor.__get__(inst, owner)
+    finally:
+        _local.prefetch = None
+        # The future is registered before the lock is released
+        with _pending_lock:
+            _pending.pop(key, None)
+
+
+def _compute_one(owner, name, inst):
+    # Run the undecorated function in an executor worker. The descriptor
+    # is looked up by name because decorated functions cannot be pickled.
+    descriptor = lazy._lookup(owner, name)[1]
+    return descriptor._lazy__func(inst)
+
+
+class _Stats(object):
+    """Metrics of a lazy descriptor."""
+
+    __slots__ = ('hits', 'misses', 'invalidations', 'exceptions', 'total_time', 'max_time')
+
+    def __init__(self):
+        self.hits = self.misses = self.invalidations = self.exceptions = 0
+        self.total_time = self.max_time = 0.0
+
+    def as_dict(self):
+        return dict((key, getattr(self, key)) for key in self.__slots__)
+
+    def add_to(self, d):
+        d['hits'] += self.hits
+        d['misses'] += self.misses
+        d['invalidations'] += self.invalidations
+        d['exceptions'] += self.exceptions
+        d['total_time'] += self.total_time
+        d['max_time'] = max(d['max_time'], self.max_time)
+
+
+def _record(descriptor, event, inst, elapsed=None):
+    # Count an event of the descriptor
+    with _metrics_lock:
+        metrics = lazy._metrics
+        if metrics is None:
+            return
+        stats = metrics.get(descriptor)
+        if stats is None:
+            stats = metrics[descriptor] = _Stats()
+        if event == 'hit':
+            stats.hits += 1
+        elif event == 'invalidate':
+            stats.invalidations += 1
+        else:
+            stats.misses += 1
+            if event == 'error':
+                stats.exceptions += 1
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+        hook = _hook
+
+    if hook is not None:
+        hook(event, descriptor, inst, elapsed)
+
+
+def _measure(descriptor, func, inst):
+    # Call func and record the compute time
+    start = _timer()
+    try:
+        value = func(inst)
+    except Exception:
+        _record(descriptor, 'error', inst, _timer() - start)
+        raise
+    _record(descriptor, 'miss', inst, _timer() - start)
+    return value
+
+
+def _set(self, inst, value):
+    # lazy.__set__ while metrics are enabled
+    if not hasattr(inst, '__dict__'):
+        raise AttributeError("'%s' object has no attribute '__dict__'" % (inst.__class__.__name__,))
+    inst.__dict__[_storage_name(self, inst)] = value
+
+
+def _delete(self, inst):
+    # lazy.__delete__ while metrics are enabled
+    if not hasattr(inst, '__dict__'):
+        raise AttributeError("'%s' object has no attribute '__dict__'" % (inst.__class__.__name__,))
+    name = _storage_name(self, inst)
+    if name not in inst.__dict__:
+        raise AttributeError(name)
+    del inst.__dict__[name]
+
+
+def _storage_name(descriptor, inst):
+    # Return the mangled name of the descriptor
+    name = descriptor.__name__
+    if name.startswith('__') and not name.endswith('__'):
+        name = '_%s%s' % (inst.__class__.__name__, name)
+    return name
+
+
+def _join(inst, name):
+    # Return the running prefetch of name, cancelling it if it has not
+    # started yet
+    key = (id(inst), name)
+    future = _pending.get(key)
+    if future is None or getattr(_local, 'prefetch', None) == key:
+        return None
+    if future.cancel():
+        _discard(key, future)
+        return None
+    return future
+
+
+def _discard(key, future):
+    # Remove a finished or cancelled prefetch
+    with _pending_lock:
+        if future is not None and _pending.get(key) is future:
+            del _pending[key]
+
+
+def _default_executor():
+    # Shared thread pool for prefetching
+    global _executor
+    with _pending_lock:
+        if _executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _executor = ThreadPoolExecutor()
+        return _executor
+
+
+def _after_fork():
+    # Threads do not survive a fork. Drop prefetches they were running,
+    # they would never finish in the child.
+    global _pending_lock, _executor
+    _pending.clear()
+    _pending_lock = threading.RLock()
+    _executor = None
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
@@ -1,19 +1,34 @@
 import sys
 
 from typing import TypeVar, Callable, Type, Generic
-from typing import Optional, Any, overload
+from typing import Iterable, Tuple, Dict, Union, Optional, Any, overload
+from concurrent.futures import Executor, Future
+from typing_extensions import Self
 
 if sys.version_info >= (3, 9):
     from types import GenericAlias
 
 _R = TypeVar("_R")
+_T = TypeVar("_T")
+_C = TypeVar("_C", bound=Type[Any])
+
+_Tags = Union[str, Iterable[str]]
+_Names = Union[str, Iterable[str]]
+_Hook = Callable[[str, "lazy[Any]", Any, Optional[float]], None]
 
 
 class lazy(Generic[_R]):
     __func: Callable[[Any], _R]
     __name__: str
 
-    def __init__(self, func: Callable[[Any], _R]) -> None: ...
+    @overload
+    def __new__(cls, func: Callable[[Any], _R], tags: _Tags = ...,
+                depends_on: _Names = ...) -> Self: ...
+
+    @overload
+    def __new__(cls, *, tags: _Tags = ..., depends_on: _Names = ...) -> _lazy_decorator: ...
+
+    def __getnewargs__(self) -> Tuple[Callable[[Any], _R]]: ...
 
     def __set_name__(self, owner: Type[Any], name: str) -> None: ...
 
@@ -24,8 +39,55 @@ class lazy(Generic[_R]):
     def __get__(self, inst: object, owner: Optional[Type[Any]] = ...) -> _R: ...
 
     @classmethod
-    def invalidate(cls, inst: object, name: str) -> None: ...
+    def invalidate(cls, inst: object, name: str, *names: str) -> None: ...
+
+    @classmethod
+    def invalidate_all(cls, inst: object, tags: Optional[_Tags] = ...) -> None: ...
+
+    @classmethod
+    def prefetch(cls, inst: object, names: Optional[_Names] = ...,
+                 executor: Optional[Executor] = ...) -> Dict[str, Future[Any]]: ...
+
+    @classmethod
+    def compute_many(cls, instances: Iterable[Any], name: str,
+                     executor: Optional[Executor] = ..., chunksize: int = ...) -> int: ...
+
+    @classmethod
+    def materialize(cls, roots: Any, recursive: bool = ..., freeze: bool = ...) -> Dict[str, float]: ...
+
+    @overload
+    @classmethod
+    def transient(cls, owner: _C, keep: _Names = ...) -> _C: ...
+
+    @overload
+    @classmethod
+    def transient(cls, *, keep: _Names = ...) -> Callable[[_C], _C]: ...
+
+    @classmethod
+    def enable_metrics(cls, hook: Optional[_Hook] = ...) -> None: ...
+
+    @classmethod
+    def disable_metrics(cls) -> None: ...
+
+    @classmethod
+    def metrics(cls) -> Dict[str, Dict[str, float]]: ...
+
+    @classmethod
+    def reset_metrics(cls) -> None: ...
+
+    @classmethod
+    def footprint(cls, instances: Optional[Iterable[Any]] = ...) -> Dict[str, Dict[str, Any]]: ...
+
+    @classmethod
+    def attributes(cls, owner: Type[Any]) -> Tuple[str, ...]: ...
+
+    @classmethod
+    def computed(cls, inst: object) -> Tuple[str, ...]: ...
 
     if sys.version_info >= (3, 9):
         def __class_getitem__(cls, params: Any) -> GenericAlias: ...
 
+
+class _lazy_decorator(lazy[Any]):
+
+    def __call__(self, func: Callable[[Any], _T]) -> lazy[_T]: ...
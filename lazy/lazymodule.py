@@ -0,0 +1,99 @@
+"""Lazy module attributes."""
+
+import sys
+import threading
+import importlib
+
+# PEP 562
+_getattr = sys.version_info >= (3, 7)
+
+
+class lazymodule(object):
+    """lazymodule helper
+
+    Adds lazy attributes and deferred imports to module 'name', usually
+    __name__. Values are computed on first access and stored in the
+    module __dict__. Python < 3.7 computes them right away.
+    """
+
+    def __init__(self, name):
+        self.module = sys.modules[name]
+        self.factories = {}
+        self.lock = threading.RLock()
+
+        if _getattr:
+            namespace = self.module.__dict__
+            self.fallback = namespace.get('__getattr__')
+            namespace['__getattr__'] = self.__getattr
+            namespace['__dir__'] = self.__dir
+
+    def attribute(self, name, func=None):
+        """Add lazy attribute 'name' computed by calling 'func'.
+
+        May be used as a decorator. Return func.
+        """
+        if func is None:
+            return lambda func: self.attribute(name, func)
+
+        self.__add(name, func)
+        return func
+
+    def imports(self, **names):
+        """Add deferred imports. Names map to module names, like 'json'
+        or '.submodule', or to 'module:attribute'.
+        """
+        for name, target in names.items():
+            self.__add(name, self.__importer(target))
+
+    def invalidate(self, name, *names):
+        """Invalidate one or more lazy attributes."""
+        for name in (name,) + names:
+            if name not in self.factories:
+                raise AttributeError("'%s.%s' is not a lazy attribute" % (self.module.__name__, name))
+            if _getattr:
+                self.module.__dict__.pop(name, None)
+            else:
+                self.__compute(name)
+
+    def __add(self, name, factory):
+        self.factories[name] = factory
+        if _getattr:
+            # An existing value would shadow __getattr__
+            self.module.__dict__.pop(name, None)
+        else:
+            self.__compute(name)
+
+    def __importer(self, target):
+        # Return a function importing target
+        module, _, attribute = target.partition(':')
+        package = self.module.__name__
+        if not hasattr(self.module, '__path__'):
+            package = package.rpartition('.')[0]
+
+        def factory():
+            value = importlib.import_module(module, package)
+            if attribute:
+                value = getattr(value, attribute)
+            return value
+        return factory
+
+    def __compute(self, name):
+        with self.lock:
+            namespace = self.module.__dict__
+            if name in namespace and _getattr:
+                # Another thread was first
+                return namespace[name]
+            value = namespace[name] = self.factories[name]()
+            return value
+
+    def __getattr(self, name):
+        # The module __getattr__
+        if name in self.factories:
+            return self.__compute(name)
+        if self.fallback is not None:
+            return self.fallback(name)
+        raise AttributeError("module '%s' has no attribute '%s'" % (self.module.__name__, name))
+
+    def __dir(self):
+        # The module __dir__
+        return sorted(set(self.module.__dict__) | set(self.factories))
@@ -0,0 +1,21 @@
+from types import ModuleType
+from typing import TypeVar, Callable, Dict, Optional, Any, overload
+
+_F = TypeVar("_F", bound=Callable[[], Any])
+
+
+class lazymodule(object):
+    module: ModuleType
+    factories: Dict[str, Callable[[], Any]]
+
+    def __init__(self, name: str) -> None: ...
+
+    @overload
+    def attribute(self, name: str, func: _F) -> _F: ...
+
+    @overload
+    def attribute(self, name: str, func: None = ...) -> Callable[[_F], _F]: ...
+
+    def imports(self, **names: str) -> None: ...
+
+    def invalidate(self, name: str, *names: str) -> None: ...
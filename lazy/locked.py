@@ -0,0 +1,69 @@
+"""Decorator to create thread-safe lazy attributes."""
+
+import os
+import threading
+import weakref
+
+from .lazy import lazy
+
+_instances = weakref.WeakSet()
+
+
+class locked(lazy):
+    """locked descriptor
+
+    Like lazy but safe to use from multiple threads. When several
+    threads access an uncomputed attribute at the same time, one
+    thread computes the value and the others wait for its result.
+    """
+
+    def __init__(self, func, **options):
+        lazy.__init__(self, func, **options)
+        self.__locks = _Locks()
+
+    def __get__(self, inst, owner):
+        if inst is None:
+            return self
+
+        # Once cached, the value in the instance __dict__ shadows
+        # the descriptor and no lock is involved.
+        return self.__locks.call(inst, lazy.__get__, self, inst, owner)
+
+
+class _Locks(object):
+    """Per-instance locks, held only while a function is running."""
+
+    def __init__(self):
+        self.reset()
+        _instances.add(self)
+
+    def reset(self):
+        self.mutex = threading.Lock()
+        self.pending = {}
+
+    def call(self, inst, func, *args):
+        key = id(inst)
+        with self.mutex:
+            entry = self.pending.get(key)
+            if entry is None:
+                entry = self.pending[key] = [threading.RLock(), 0]
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                return func(*args)
+        finally:
+            with self.mutex:
+                entry[1] -= 1
+                if not entry[1] and self.pending.get(key) is entry:
+                    del self.pending[key]
+
+
+def _after_fork():
+    # Threads do not survive a fork. Drop locks they may have held.
+    for locks in list(_instances):
+        locks.reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
@@ -0,0 +1,9 @@
+from typing import TypeVar
+
+from .lazy import lazy
+
+_R = TypeVar("_R")
+
+
+class locked(lazy[_R]):
+    pass
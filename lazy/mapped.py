@@ -0,0 +1,51 @@
+"""Decorator to create lazy attributes from memory-mapped files."""
+
+import mmap
+
+from .lazy import lazy
+
+
+class mapped(lazy):
+    """mapped descriptor
+
+    Like lazy but the decorated function returns the path of a file.
+    The attribute evaluates to a read-only memoryview of a memory map
+    of the file, so the file is not copied into memory and processes
+    mapping the same file share the page cache. Invalidating the
+    attribute closes the map. Python 2 returns the mmap object.
+    """
+
+    def _compute(self, inst, name):
+        path = lazy._compute(self, inst, name)
+        with open(path, 'rb') as f:
+            try:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                if f.read(1):
+                    raise
+                return memoryview(b'')
+        try:
+            return memoryview(mapping)
+        except TypeError:
+            return mapping
+
+    def _invalidate(self, inst, name):
+        value = getattr(inst, '__dict__', {}).get(name)
+        lazy._invalidate(self, inst, name)
+        _close(value)
+
+
+def _close(value):
+    # Close the map of a value unless slices of it are still in use
+    if isinstance(value, memoryview) and hasattr(value, 'release'):
+        mapping = value.obj
+        value.release()
+        value = mapping
+    if isinstance(value, mmap.mmap):
+        try:
+            value.close()
+        except BufferError:
+            # Slices are still in use, the map is closed when it is
+            # garbage collected
+            pass
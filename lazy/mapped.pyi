@@ -0,0 +1,23 @@
+import os
+
+from typing import Callable, Union, Any, overload
+from typing_extensions import Self
+
+from .lazy import lazy, _Tags, _Names
+
+_Path = Union[str, bytes, "os.PathLike[str]", "os.PathLike[bytes]"]
+
+
+class mapped(lazy[memoryview]):
+
+    @overload
+    def __new__(cls, func: Callable[[Any], _Path], tags: _Tags = ...,
+                depends_on: _Names = ...) -> Self: ...
+
+    @overload
+    def __new__(cls, *, tags: _Tags = ..., depends_on: _Names = ...) -> _mapped_decorator: ...
+
+
+class _mapped_decorator(mapped):
+
+    def __call__(self, func: Callable[[Any], _Path]) -> mapped: ...
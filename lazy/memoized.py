@@ -0,0 +1,110 @@
+"""Decorator to create memoized methods."""
+
+import threading
+
+from collections import OrderedDict
+
+from .lazy import lazy, _record, _measure, _watch, _set_name
+
+_marker = object()
+_kwd_mark = object()
+
+
+class memoized(lazy):
+    """memoized descriptor
+
+    Like lazy but for methods taking arguments. Results are cached by
+    arguments in a per-instance LRU of at most 'maxsize' entries, which
+    is stored in the instance __dict__ and freed with the instance.
+    None means unbounded. Arguments must be hashable.
+    """
+
+    # There is nothing to compute without arguments
+    _materialize = False
+
+    def __init__(self, func, maxsize=128, **options):
+        lazy.__init__(self, func, **options)
+        self.__maxsize = maxsize
+        self.__lock = threading.Lock()
+
+    def __get__(self, inst, owner):
+        if inst is None:
+            return self
+
+        if not hasattr(inst, '__dict__'):
+            raise AttributeError("'%s' object has no attribute '__dict__'" % (owner.__name__,))
+
+        name = self.__name__
+        if name.startswith('__') and not name.endswith('__'):
+            name = '_%s%s' % (owner.__name__, name)
+
+        return _Method(self, inst, name)
+
+    def __set__(self, inst, value):
+        raise AttributeError("can't set attribute '%s'" % (self.__name__,))
+
+    def __delete__(self, inst):
+        name = self.__name__
+        if name.startswith('__') and not name.endswith('__'):
+            name = '_%s%s' % (inst.__class__.__name__, name)
+        if name not in inst.__dict__:
+            raise AttributeError(name)
+        self._invalidate(inst, name)
+
+    def _compute(self, inst, name):
+        # The value stored in the instance __dict__ is the cache
+        if self._lazy__depends_on and not _set_name:
+            _watch(inst.__class__)
+        return OrderedDict()
+
+    def _call(self, inst, name, args, kwargs):
+        # Return the cached result for args, computing it if necessary
+        key = args
+        if kwargs:
+            key += (_kwd_mark,) + tuple(sorted(kwargs.items()))
+
+        cache = inst.__dict__.get(name)
+        if cache is None:
+            cache = inst.__dict__.setdefault(name, self._compute(inst, name))
+
+        with self.__lock:
+            value = cache.pop(key, _marker)
+            if value is not _marker:
+                # Move to the end
+                cache[key] = value
+
+        if value is not _marker:
+            if self._metrics is not None:
+                _record(self, 'hit', inst)
+            return value
+
+        func = self._lazy__func
+        if self._metrics is not None:
+            value = _measure(self, lambda inst: func(inst, *args, **kwargs), inst)
+        else:
+            value = func(inst, *args, **kwargs)
+
+        with self.__lock:
+            cache[key] = value
+            maxsize = self.__maxsize
+            if maxsize is not None:
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+        return value
+
+
+class _Method(object):
+    """memoized method bound to an instance."""
+
+    __slots__ = ('__descriptor', '__self__', '__name')
+
+    def __init__(self, descriptor, inst, name):
+        self.__descriptor = descriptor
+        self.__self__ = inst
+        self.__name = name
+
+    def __call__(self, *args, **kwargs):
+        return self.__descriptor._call(self.__self__, self.__name, args, kwargs)
+
+    def __repr__(self):
+        return '<memoized method %s of %r>' % (self.__descriptor.__name__, self.__self__)
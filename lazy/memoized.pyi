@@ -0,0 +1,29 @@
+from typing import TypeVar, Callable, Generic, Optional, Any, overload
+from typing_extensions import Self, ParamSpec, Concatenate
+
+from .lazy import lazy, _Tags, _Names
+
+_P = ParamSpec("_P")
+_Q = ParamSpec("_Q")
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+
+
+class memoized(lazy[Callable[_P, _R]], Generic[_P, _R]):
+
+    @overload
+    def __new__(cls, func: Callable[Concatenate[Any, _P], _R], maxsize: Optional[int] = ...,
+                tags: _Tags = ..., depends_on: _Names = ...) -> Self: ...
+
+    @overload
+    def __new__(cls, *, maxsize: Optional[int] = ..., tags: _Tags = ...,
+                depends_on: _Names = ...) -> _memoized_decorator: ...
+
+    def __set__(self, inst: object, value: Any) -> None: ...
+
+    def __delete__(self, inst: object) -> None: ...
+
+
+class _memoized_decorator(memoized[..., Any]):
+
+    def __call__(self, func: Callable[Concatenate[Any, _Q], _T]) -> memoized[_Q, _T]: ...
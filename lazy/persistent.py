@@ -0,0 +1,158 @@
+"""Decorator to create lazy attributes backed by a persistent store."""
+
+import os
+import threading
+
+from .lazy import lazy
+
+_replace = getattr(os, 'replace', os.rename)
+
+
+class persistent(lazy):
+    """persistent descriptor
+
+    Like lazy but values are also written to 'backend', a persistent
+    store, and read from it before the function is called. 'key' is a
+    function returning a key identifying the instance, and 'serializer'
+    an object with dumps and loads functions. It defaults to pickle.
+    """
+
+    def __init__(self, func, backend, key, serializer=None, **options):
+        lazy.__init__(self, func, **options)
+        self.__backend = backend
+        self.__key = key
+        self.__serializer = serializer or _pickle
+
+    def __store_key(self, inst, name):
+        # Keys are qualified by module and attribute
+        return '%s.%s:%s' % (self.__module__, getattr(self, '__qualname__', name), self.__key(inst))
+
+    def _compute(self, inst, name):
+        key = self.__store_key(inst, name)
+        data = self.__backend.get(key)
+        if data is not None:
+            try:
+                return self.__serializer.loads(data)
+            except Exception:
+                # Stale or corrupt, compute the value again
+                pass
+
+        value = lazy._compute(self, inst, name)
+        self.__write(key, value)
+        return value
+
+    def _store(self, inst, name, value):
+        lazy._store(self, inst, name, value)
+        self.__write(self.__store_key(inst, name), value)
+
+    def __write(self, key, value):
+        try:
+            self.__backend.set(key, self.__serializer.dumps(value))
+        except Exception:
+            # Unserializable or not written, the value is only cached
+            # in the instance
+            pass
+
+    def _invalidate(self, inst, name):
+        lazy._invalidate(self, inst, name)
+        self.__backend.delete(self.__store_key(inst, name))
+
+
+class _Pickle(object):
+    """Serializer using the highest pickle protocol."""
+
+    def dumps(self, value):
+        import pickle
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data):
+        import pickle
+        return pickle.loads(data)
+
+
+_pickle = _Pickle()
+
+
+class SQLiteBackend(object):
+    """Store values in table 'table' of SQLite database 'path'."""
+
+    def __init__(self, path, table='lazy'):
+        self.path = path
+        self.table = table
+        self.lock = threading.Lock()
+        self.connection = None
+        self.pid = None
+
+    def __connect(self):
+        # Connections must not be shared with forked children
+        if self.connection is None or self.pid != os.getpid():
+            # Imported on first use, keeping 'import lazy' fast
+            import sqlite3
+            connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            connection.execute('CREATE TABLE IF NOT EXISTS "%s" (key TEXT PRIMARY KEY, value BLOB)' % self.table)
+            self.connection = connection
+            self.pid = os.getpid()
+        return self.connection
+
+    def get(self, key):
+        with self.lock:
+            row = self.__connect().execute(
+                'SELECT value FROM "%s" WHERE key = ?' % self.table, (key,)).fetchone()
+        if row is not None:
+            return bytes(row[0])
+
+    def set(self, key, data):
+        import sqlite3
+        with self.lock:
+            self.__connect().execute(
+                'INSERT OR REPLACE INTO "%s" (key, value) VALUES (?, ?)' % self.table,
+                (key, sqlite3.Binary(data)))
+
+    def delete(self, key):
+        with self.lock:
+            self.__connect().execute(
+                'DELETE FROM "%s" WHERE key = ?' % self.table, (key,))
+
+    def close(self):
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+
+class DirectoryBackend(object):
+    """Store values in files in directory 'path'."""
+
+    def __init__(self, path):
+        self.path = path
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+    def __filename(self, key):
+        import hashlib
+        return os.path.join(self.path, hashlib.sha1(key.encode('utf-8')).hexdigest())
+
+    def get(self, key):
+        try:
+            with open(self.__filename(key), 'rb') as f:
+                return f.read()
+        except (IOError, OSError):
+            return None
+
+    def set(self, key, data):
+        # Write to a temporary file first, so readers never see partial data
+        import tempfile
+        fd, tmp = tempfile.mkstemp(dir=self.path, prefix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            _replace(tmp, self.__filename(key))
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    def delete(self, key):
+        try:
+            os.remove(self.__filename(key))
+        except (IOError, OSError):
+            pass
@@ -0,0 +1,68 @@
+from typing import TypeVar, Callable, Optional, Any, overload
+from typing_extensions import Self, Protocol
+
+from .lazy import lazy, _Tags, _Names
+
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+
+
+class _Backend(Protocol):
+
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, data: bytes) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+
+class _Serializer(Protocol):
+
+    def dumps(self, value: Any) -> bytes: ...
+
+    def loads(self, data: bytes) -> Any: ...
+
+
+class persistent(lazy[_R]):
+
+    @overload
+    def __new__(cls, func: Callable[[Any], _R], backend: _Backend, key: Callable[[Any], object],
+                serializer: Optional[_Serializer] = ..., tags: _Tags = ...,
+                depends_on: _Names = ...) -> Self: ...
+
+    @overload
+    def __new__(cls, *, backend: _Backend, key: Callable[[Any], object],
+                serializer: Optional[_Serializer] = ..., tags: _Tags = ...,
+                depends_on: _Names = ...) -> _persistent_decorator: ...
+
+
+class _persistent_decorator(persistent[Any]):
+
+    def __call__(self, func: Callable[[Any], _T]) -> persistent[_T]: ...
+
+
+class SQLiteBackend(object):
+    path: str
+    table: str
+
+    def __init__(self, path: str, table: str = ...) -> None: ...
+
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, data: bytes) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class DirectoryBackend(object):
+    path: str
+
+    def __init__(self, path: str) -> None: ...
+
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, data: bytes) -> None: ...
+
+    def delete(self, key: str) -> None: ...
@@ -0,0 +1,117 @@
+"""Decorator to create lazy attributes which are refreshed in the background."""
+
+import time
+import threading
+
+from .lazy import lazy, _record, _storage_name
+
+try:
+    _clock = time.monotonic
+except AttributeError:
+    _clock = time.time
+
+
+class revalidating(lazy):
+    """revalidating descriptor
+
+    Like expiring but the value goes stale 'ttl' seconds after it was
+    computed. Stale values are returned while one background thread
+    computes the new value, for at most 'max_stale' more seconds. None
+    means no limit. After that, and after invalidation, the value is
+    computed in the reading thread. If given, 'executor' runs the
+    background computations instead of a new thread.
+    """
+
+    def __init__(self, func, ttl, max_stale=None, executor=None, **options):
+        lazy.__init__(self, func, **options)
+        self.__ttl = ttl
+        self.__max_stale = max_stale
+        self.__executor = executor
+        self.__pending = set()
+        self.__lock = threading.Lock()
+
+    def __get__(self, inst, owner):
+        if inst is None:
+            return self
+
+        if not hasattr(inst, '__dict__'):
+            raise AttributeError("'%s' object has no attribute '__dict__'" % (owner.__name__,))
+
+        name = self.__name__
+        if name.startswith('__') and not name.endswith('__'):
+            name = '_%s%s' % (owner.__name__, name)
+
+        # The instance __dict__ holds (value, stale, expires) tuples
+        entry = inst.__dict__.get(name)
+        if entry is not None:
+            now = _clock()
+            if now < entry[1]:
+                if self._metrics is not None:
+                    _record(self, 'hit', inst)
+                return entry[0]
+            if entry[2] is None or now < entry[2]:
+                self.__revalidate(inst, name, entry)
+                if self._metrics is not None:
+                    _record(self, 'hit', inst)
+                return entry[0]
+
+        value = self._compute(inst, name)
+        self._store(inst, name, value)
+        return value
+
+    def __set__(self, inst, value):
+        self._store(inst, _storage_name(self, inst), value)
+
+    def __delete__(self, inst):
+        name = _storage_name(self, inst)
+        if name not in inst.__dict__:
+            raise AttributeError(name)
+        del inst.__dict__[name]
+
+    def __revalidate(self, inst, name, entry):
+        # Start computing the value in the background unless another
+        # thread is already doing it
+        key = (id(inst), name)
+        with self.__lock:
+            if key in self.__pending:
+                return
+            self.__pending.add(key)
+
+        try:
+            if self.__executor is not None:
+                self.__executor.submit(self.__background, inst, name, entry, key)
+            else:
+                thread = threading.Thread(target=self.__background, args=(inst, name, entry, key))
+                thread.daemon = True
+                thread.start()
+        except BaseException:
+            self.__discard(key)
+            raise
+
+    def __background(self, inst, name, entry, key):
+        # Compute the value and swap it in, unless the stale entry was
+        # replaced or invalidated in the meantime
+        try:
+            value = self._compute(inst, name)
+            if inst.__dict__.get(name) is entry:
+                self._store(inst, name, value)
+        except Exception:
+            # Keep the stale value, the next read tries again
+            pass
+        finally:
+            self.__discard(key)
+
+    def __discard(self, key):
+        with self.__lock:
+            self.__pending.discard(key)
+
+    def _store(self, inst, name, value):
+        stale = _clock() + self.__ttl
+        if self.__max_stale is None:
+            inst.__dict__[name] = (value, stale, None)
+        else:
+            inst.__dict__[name] = (value, stale, stale + self.__max_stale)
+
+    def _has_value(self, inst, name):
+        entry = getattr(inst, '__dict__', {}).get(name)
+        return entry is not None and (entry[2] is None or _clock() < entry[2])
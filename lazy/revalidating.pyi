@@ -0,0 +1,30 @@
+from typing import TypeVar, Callable, Optional, Any, overload
+from concurrent.futures import Executor
+from typing_extensions import Self
+
+from .lazy import lazy, _Tags, _Names
+
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+
+
+class revalidating(lazy[_R]):
+
+    @overload
+    def __new__(cls, func: Callable[[Any], _R], ttl: float, max_stale: Optional[float] = ...,
+                executor: Optional[Executor] = ..., tags: _Tags = ...,
+                depends_on: _Names = ...) -> Self: ...
+
+    @overload
+    def __new__(cls, *, ttl: float, max_stale: Optional[float] = ...,
+                executor: Optional[Executor] = ..., tags: _Tags = ...,
+                depends_on: _Names = ...) -> _revalidating_decorator: ...
+
+    def __set__(self, inst: object, value: _R) -> None: ...
+
+    def __delete__(self, inst: object) -> None: ...
+
+
+class _revalidating_decorator(revalidating[Any]):
+
+    def __call__(self, func: Callable[[Any], _T]) -> revalidating[_T]: ...
@@ -0,0 +1,107 @@
+"""Decorator to create lazy attributes on objects without __dict__."""
+
+import types
+import weakref
+
+from .lazy import lazy, _record
+
+
+class slotted(lazy):
+    """slotted descriptor
+
+    Like lazy but for objects that have no instance __dict__, like
+    classes with __slots__ and frozen dataclasses. Values are stored
+    in a reserved slot if the class defines one, and in a side table
+    keyed by the instance otherwise.
+    """
+
+    def __init__(self, func, slot=None, **options):
+        lazy.__init__(self, func, **options)
+        self.__slot = slot
+        self.__members = weakref.WeakKeyDictionary()
+        self.__table = {}
+
+    def __get__(self, inst, owner):
+        if inst is None:
+            return self
+
+        member = self.__member(owner)
+
+        if member is not False:
+            try:
+                value = member.__get__(inst, owner)
+            except AttributeError:
+                value = self._compute(inst, self.__name__)
+                member.__set__(inst, value)
+                return value
+            if self._metrics is not None:
+                _record(self, 'hit', inst)
+            return value
+
+        key = id(inst)
+        entry = self.__table.get(key)
+        if entry is not None and entry[0]() is inst:
+            if self._metrics is not None:
+                _record(self, 'hit', inst)
+            return entry[1]
+
+        ref = weakref.ref(inst, self.__remover(key))
+        value = self._compute(inst, self.__name__)
+        self.__table[key] = (ref, value)
+        return value
+
+    def __member(self, owner):
+        # Look up the member descriptor of the reserved slot, once per
+        # class since subclasses may add the slot
+        member = self.__members.get(owner)
+        if member is None:
+            slot = self.__slot or '_' + self.__name__
+            member = getattr(owner, slot, None)
+            if not isinstance(member, types.MemberDescriptorType):
+                member = False
+            self.__members[owner] = member
+        return member
+
+    def __remover(self, key):
+        # Drop the table entry when the instance goes away
+        table = self.__table
+
+        def remove(ref):
+            if table.get(key, (None,))[0] is ref:
+                del table[key]
+        return remove
+
+    def _has_value(self, inst, name):
+        member = self.__member(inst.__class__)
+
+        if member is not False:
+            try:
+                member.__get__(inst, inst.__class__)
+            except AttributeError:
+                return False
+            return True
+
+        entry = self.__table.get(id(inst))
+        return entry is not None and entry[0]() is inst
+
+    def _store(self, inst, name, value):
+        member = self.__member(inst.__class__)
+
+        if member is not False:
+            member.__set__(inst, value)
+        else:
+            key = id(inst)
+            self.__table[key] = (weakref.ref(inst, self.__remover(key)), value)
+
+    def _invalidate(self, inst, name):
+        member = self.__member(inst.__class__)
+
+        if member is not False:
+            try:
+                member.__delete__(inst)
+            except AttributeError:
+                pass
+        else:
+            entry = self.__table.get(id(inst))
+            if entry is not None and entry[0]() is inst:
+                del self.__table[id(inst)]
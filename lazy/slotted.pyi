@@ -0,0 +1,23 @@
+from typing import TypeVar, Callable, Optional, Any, overload
+from typing_extensions import Self
+
+from .lazy import lazy, _Tags, _Names
+
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+
+
+class slotted(lazy[_R]):
+
+    @overload
+    def __new__(cls, func: Callable[[Any], _R], slot: Optional[str] = ..., tags: _Tags = ...,
+                depends_on: _Names = ...) -> Self: ...
+
+    @overload
+    def __new__(cls, *, slot: Optional[str] = ..., tags: _Tags = ...,
+                depends_on: _Names = ...) -> _slotted_decorator: ...
+
+
+class _slotted_decorator(slotted[Any]):
+
+    def __call__(self, func: Callable[[Any], _T]) -> slotted[_T]: ...
@@ -0,0 +1,116 @@
+"""Decorator to create lazy attributes from generator functions."""
+
+import threading
+
+try:
+    from collections.abc import Sequence
+except ImportError:
+    from collections import Sequence
+
+from .lazy import lazy
+
+
+class streamed(lazy):
+    """streamed descriptor
+
+    Like lazy but for generator functions. The attribute evaluates to
+    a sequence which pulls items from the generator as they are needed
+    and caches them.
+    """
+
+    def _compute(self, inst, name):
+        return Stream(lazy._compute(self, inst, name))
+
+
+class Stream(Sequence):
+    """Sequence of the items of an iterable, pulled on demand.
+
+    Indexing, slicing, and iteration pull only as many items as they
+    need. Negative indexes and len() pull all items.
+    """
+
+    def __init__(self, iterable):
+        self.__iterator = iter(iterable)
+        self.__items = []
+        self.__error = None
+        self.__lock = threading.RLock()
+
+    @property
+    def consumed(self):
+        """The number of items pulled so far."""
+        return len(self.__items)
+
+    @property
+    def exhausted(self):
+        """True if all items have been pulled."""
+        return self.__iterator is None and self.__error is None
+
+    def __fill(self, count=None):
+        # Pull items until there are 'count' items, or all if None
+        items = self.__items
+        if count is not None and len(items) >= count:
+            return
+
+        with self.__lock:
+            iterator = self.__iterator
+            while iterator is not None and (count is None or len(items) < count):
+                try:
+                    items.append(next(iterator))
+                except StopIteration:
+                    self.__iterator = iterator = None
+                except Exception as e:
+                    # The generator is finished, raise again when pulled
+                    self.__iterator = iterator = None
+                    self.__error = e
+                    raise
+
+            error = self.__error
+            if error is not None and (count is None or len(items) < count):
+                if hasattr(error, 'with_traceback'):
+                    error = error.with_traceback(None)
+                raise error
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop = index.start, index.stop
+            if index.step is not None and index.step < 0:
+                # Reversed slices begin at start, the highest index
+                start, stop = stop, start
+                if stop is not None and stop >= 0:
+                    stop += 1
+            if stop is None or stop < 0 or (start is not None and start < 0):
+                self.__fill()
+            else:
+                self.__fill(stop)
+        elif index < 0:
+            self.__fill()
+        else:
+            self.__fill(index + 1)
+        return self.__items[index]
+
+    def __iter__(self):
+        items = self.__items
+        i = 0
+        while True:
+            if i >= len(items):
+                self.__fill(i + 1)
+                if i >= len(items):
+                    return
+            yield items[i]
+            i += 1
+
+    def __len__(self):
+        self.__fill()
+        return len(self.__items)
+
+    def __bool__(self):
+        self.__fill(1)
+        return bool(self.__items)
+
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        items = list(self.__items)
+        if not self.exhausted:
+            return '<Stream %r...>' % (items,)
+        return '<Stream %r>' % (items,)
@@ -0,0 +1,45 @@
+from typing import TypeVar, Callable, Iterable, Iterator, Sequence, List, Any, overload
+from typing_extensions import Self
+
+from .lazy import lazy, _Tags, _Names
+
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+
+
+class streamed(lazy[Stream[_R]]):
+
+    @overload
+    def __new__(cls, func: Callable[[Any], Iterable[_R]], tags: _Tags = ...,
+                depends_on: _Names = ...) -> Self: ...
+
+    @overload
+    def __new__(cls, *, tags: _Tags = ..., depends_on: _Names = ...) -> _streamed_decorator: ...
+
+
+class _streamed_decorator(streamed[Any]):
+
+    def __call__(self, func: Callable[[Any], Iterable[_T]]) -> streamed[_T]: ...
+
+
+class Stream(Sequence[_R]):
+
+    def __init__(self, iterable: Iterable[_R]) -> None: ...
+
+    @property
+    def consumed(self) -> int: ...
+
+    @property
+    def exhausted(self) -> bool: ...
+
+    @overload
+    def __getitem__(self, index: int) -> _R: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[_R]: ...
+
+    def __iter__(self) -> Iterator[_R]: ...
+
+    def __len__(self) -> int: ...
+
+    def __bool__(self) -> bool: ...
@@ -0,0 +1,160 @@
+import sys
+import unittest
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+from lazy import lazy
+from lazy import awaitable
+from lazy.tests.test_lazy import TestCase
+
+
+def delayed(value, delay=0.01):
+    return asyncio.sleep(delay, result=value)
+
+
+def failed(exc):
+    future = asyncio.Future()
+    future.set_exception(exc)
+    return future
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'requires asyncio')
+class AwaitableTests(TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def run_until_complete(self, aw):
+        return self.loop.run_until_complete(aw)
+
+    def test_evaluate_once(self):
+        # Awaitable attributes should be evaluated only once.
+        called = []
+
+        class Foo(object):
+            @awaitable
+            def foo(self):
+                called.append('foo')
+                return delayed(object())
+
+        f = Foo()
+        result = self.run_until_complete(f.foo)
+        self.assertTrue(self.run_until_complete(f.foo) is result)
+        self.assertTrue(self.run_until_complete(f.foo) is result)
+        self.assertEqual(len(called), 1)
+        self.assertTrue(isinstance(Foo.foo, lazy))
+
+    def test_concurrent_awaiters(self):
+        # Concurrent awaiters should share one task.
+        called = []
+
+        class Foo(object):
+            @awaitable
+            def foo(self):
+                called.append('foo')
+                return delayed(object())
+
+        f = Foo()
+        results = self.run_until_complete(asyncio.gather(f.foo, f.foo, f.foo))
+        self.assertEqual(len(called), 1)
+        self.assertTrue(results[0] is results[1] is results[2])
+
+    def test_exception_not_cached(self):
+        # Exceptions should propagate and not be cached.
+        called = []
+
+        class Foo(object):
+            @awaitable
+            def foo(self):
+                called.append('foo')
+                if len(called) == 1:
+                    return failed(ValueError('foo'))
+                return delayed(1)
+
+        f = Foo()
+        self.assertException(ValueError, 'foo', self.run_until_complete, f.foo)
+        self.assertFalse('foo' in f.__dict__)
+        self.assertEqual(self.run_until_complete(f.foo), 1)
+        self.assertEqual(len(called), 2)
+
+    def test_cancelled_awaiter(self):
+        # Cancelling one awaiter should not affect the others.
+        called = []
+
+        class Foo(object):
+            @awaitable
+            def foo(self):
+                called.append('foo')
+                return delayed(1, 0.05)
+
+        f = Foo()
+        first = asyncio.ensure_future(f.foo)
+        second = asyncio.ensure_future(f.foo)
+        self.loop.call_later(0.01, first.cancel)
+
+        self.assertEqual(self.run_until_complete(second), 1)
+        self.assertTrue(first.cancelled())
+        self.assertEqual(self.run_until_complete(f.foo), 1)
+        self.assertEqual(len(called), 1)
+
+    def test_cancelled_task_not_cached(self):
+        # A cancelled computation should not be cached.
+        called = []
+
+        class Foo(object):
+            @awaitable
+            def foo(self):
+                called.append('foo')
+                if len(called) == 1:
+                    future = asyncio.Future()
+                    future.cancel()
+                    return future
+                return delayed(1)
+
+        f = Foo()
+        self.assertRaises(asyncio.CancelledError, self.run_until_complete, f.foo)
+        self.assertFalse('foo' in f.__dict__)
+        self.assertEqual(self.run_until_complete(f.foo), 1)
+        self.assertEqual(len(called), 2)
+
+    def test_invalidate(self):
+        # It should be possible to invalidate an awaitable attribute.
+        called = []
+
+        class Foo(object):
+            @awaitable
+            def foo(self):
+                called.append('foo')
+                return delayed(len(called))
+
+        f = Foo()
+        self.assertEqual(self.run_until_complete(f.foo), 1)
+        awaitable.invalidate(f, 'foo')
+        self.assertEqual(self.run_until_complete(f.foo), 2)
+        self.assertEqual(len(called), 2)
+
+    def test_invalidate_while_running(self):
+        # Invalidating a running attribute should not resurrect
+        # its result.
+        called = []
+
+        class Foo(object):
+            @awaitable
+            def foo(self):
+                called.append('foo')
+                return delayed(len(called))
+
+        f = Foo()
+        first = f.foo
+        lazy.invalidate(f, 'foo')
+        self.assertEqual(self.run_until_complete(first), 1)
+        self.assertEqual(self.run_until_complete(f.foo), 2)
+        self.assertEqual(len(called), 2)
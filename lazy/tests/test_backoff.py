@@ -0,0 +1,182 @@
+import copy
+import importlib
+import traceback
+
+from lazy import lazy
+from lazy import backoff
+from lazy.tests.test_lazy import TestCase
+
+module = importlib.import_module('lazy.backoff')
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class BackoffTests(TestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        self.saved = module._clock
+        module._clock = self.clock
+
+    def tearDown(self):
+        module._clock = self.saved
+
+    def make_class(self, called, results, **options):
+
+        class Foo(object):
+            @backoff(**options)
+            def foo(self):
+                called.append('foo')
+                result = results.pop(0)
+                if isinstance(result, Exception):
+                    raise result
+                return result
+
+        return Foo
+
+    def test_evaluate_once(self):
+        # Backoff attributes should be evaluated only once.
+        called = []
+        Foo = self.make_class(called, [1])
+
+        f = Foo()
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(len(called), 1)
+        self.assertTrue(isinstance(Foo.foo, lazy))
+
+    def test_cache_failure(self):
+        # Exceptions should be raised again until the delay has passed.
+        called = []
+        error = ValueError('foo')
+        Foo = self.make_class(called, [error, 1], delay=10)
+
+        f = Foo()
+        self.assertException(ValueError, 'foo', getattr, f, 'foo')
+        self.clock.now += 9
+        self.assertException(ValueError, 'foo', getattr, f, 'foo')
+        self.assertEqual(len(called), 1)
+        self.assertTrue(backoff.failure(f, 'foo') is error)
+
+        self.clock.now += 1
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(len(called), 2)
+        self.assertEqual(backoff.failure(f, 'foo'), None)
+        self.assertEqual(f.__dict__, {'foo': 1})
+
+    def test_exponential_backoff(self):
+        # The delay should grow with every failure in a row.
+        called = []
+        Foo = self.make_class(called, [ValueError()] * 5, delay=1, factor=3, max_delay=20)
+
+        f = Foo()
+        deadlines = []
+        for i in range(5):
+            self.assertRaises(ValueError, getattr, f, 'foo')
+            deadline = f.__dict__['__lazy_failures__']['foo'][1]
+            deadlines.append(deadline - self.clock.now)
+            self.clock.now = deadline
+        self.assertEqual(deadlines, [1, 3, 9, 20, 20])
+        self.assertEqual(len(called), 5)
+
+    def test_reset_on_success(self):
+        # Success should reset the delay.
+        called = []
+        Foo = self.make_class(called, [ValueError(), ValueError(), 1, ValueError()], delay=1)
+
+        f = Foo()
+        for i in range(3):
+            try:
+                f.foo
+            except ValueError:
+                self.clock.now += 10
+        lazy.invalidate(f, 'foo')
+        self.assertRaises(ValueError, getattr, f, 'foo')
+        self.assertEqual(f.__dict__['__lazy_failures__']['foo'][1], self.clock.now + 1)
+
+    def test_exceptions(self):
+        # Other exceptions should not be cached.
+        called = []
+        Foo = self.make_class(called, [KeyError('foo'), 1], exceptions=(ValueError, TypeError))
+
+        f = Foo()
+        self.assertRaises(KeyError, getattr, f, 'foo')
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(len(called), 2)
+
+    def test_invalidate(self):
+        # Invalidating should clear a cached failure.
+        called = []
+        Foo = self.make_class(called, [ValueError(), 1], delay=10)
+
+        f = Foo()
+        self.assertRaises(ValueError, getattr, f, 'foo')
+        lazy.invalidate(f, 'foo')
+        self.assertEqual(f.__dict__, {})
+        self.assertEqual(f.foo, 1)
+
+    def test_invalidate_all(self):
+        # Invalidating all attributes should clear cached failures.
+        called = []
+        Foo = self.make_class(called, [ValueError(), 1], delay=10)
+
+        f = Foo()
+        self.assertRaises(ValueError, getattr, f, 'foo')
+        lazy.invalidate_all(f)
+        self.assertEqual(f.foo, 1)
+
+    def test_copy(self):
+        # Copies should not share failures.
+        called = []
+        Foo = self.make_class(called, [ValueError(), ValueError(), 1], delay=10)
+
+        f = Foo()
+        self.assertRaises(ValueError, getattr, f, 'foo')
+        g = copy.copy(f)
+        lazy.invalidate(g, 'foo')
+        self.assertRaises(ValueError, getattr, g, 'foo')
+        lazy.invalidate(f, 'foo')
+        self.assertEqual(f.foo, 1)
+        self.assertRaises(ValueError, getattr, g, 'foo')
+
+    def test_traceback(self):
+        # Tracebacks should not grow with every access.
+        called = []
+        Foo = self.make_class(called, [ValueError()], delay=10)
+
+        f = Foo()
+        lengths = []
+        for i in range(5):
+            try:
+                f.foo
+            except ValueError as e:
+                lengths.append(len(traceback.extract_tb(getattr(e, '__traceback__', None))))
+        self.assertEqual(len(set(lengths[1:])), 1)
+
+    def test_private_attribute(self):
+        # It should be possible to create private backoff attributes.
+        called = []
+
+        class Foo(object):
+            @backoff(delay=10)
+            def __foo(self):
+                called.append('foo')
+                raise ValueError()
+            def get_foo(self):
+                return self.__foo
+
+        f = Foo()
+        self.assertRaises(ValueError, f.get_foo)
+        self.assertRaises(ValueError, f.get_foo)
+        self.assertEqual(len(called), 1)
+        self.assertTrue(isinstance(backoff.failure(f, '__foo'), ValueError))
+        lazy.invalidate(f, '__foo')
+        self.assertRaises(ValueError, f.get_foo)
+        self.assertEqual(len(called), 2)
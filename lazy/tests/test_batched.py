@@ -0,0 +1,124 @@
+import gc
+import copy
+import pickle
+import weakref
+
+from lazy import lazy
+from lazy import batched
+from lazy.tests.test_lazy import TestCase
+
+calls = []
+
+
+class Post(object):
+
+    def __init__(self, owner_id):
+        self.owner_id = owner_id
+
+    @batched
+    def owner(posts):
+        calls.append([post.owner_id for post in posts])
+        return ['user%d' % post.owner_id for post in posts]
+
+    @batched(size=2)
+    def likes(posts):
+        calls.append(len(posts))
+        return [post.owner_id * 10 for post in posts]
+
+
+class BatchedTests(TestCase):
+
+    def setUp(self):
+        del calls[:]
+
+    def test_batch(self):
+        # Values should be computed for all siblings in one call.
+        posts = batched.batch(Post(i) for i in range(5))
+        self.assertEqual([post.owner for post in posts], ['user0', 'user1', 'user2', 'user3', 'user4'])
+        self.assertEqual(calls, [[0, 1, 2, 3, 4]])
+        self.assertEqual(posts[3].__dict__['owner'], 'user3')
+        self.assertTrue(isinstance(Post.owner, lazy))
+
+    def test_any_sibling_first(self):
+        # Any sibling may trigger the batch.
+        posts = batched.batch([Post(i) for i in range(4)])
+        self.assertEqual(posts[2].owner, 'user2')
+        self.assertEqual(calls, [[2, 3, 0, 1]])
+        self.assertEqual(lazy.computed(posts[0]), ('owner',))
+
+    def test_pending_only(self):
+        # Siblings with values should be skipped.
+        posts = batched.batch([Post(i) for i in range(4)])
+        posts[1].owner
+        lazy.invalidate(posts[3], 'owner')
+        lazy.invalidate(posts[0], 'owner')
+        posts[0].owner
+        self.assertEqual(calls, [[1, 2, 3, 0], [0, 3]])
+
+    def test_unbatched(self):
+        # Instances without batch should be computed alone.
+        self.assertEqual(Post(7).owner, 'user7')
+        self.assertEqual(calls, [[7]])
+
+    def test_size(self):
+        # Calls should receive at most size instances.
+        posts = batched.batch([Post(i) for i in range(5)])
+        self.assertEqual([post.likes for post in posts], [0, 10, 20, 30, 40])
+        self.assertEqual(calls, [2, 2, 1])
+
+    def test_rebatch(self):
+        # Registering a new batch should replace the previous one.
+        posts = batched.batch([Post(i) for i in range(4)])
+        batched.batch(posts[2:])
+        posts[0].owner
+        posts[2].owner
+        self.assertEqual(calls, [[0, 1], [2, 3]])
+
+    def test_freed(self):
+        # Batches should not keep siblings alive.
+        posts = batched.batch([Post(i) for i in range(3)])
+        ref = weakref.ref(posts[1])
+        del posts[1]
+        gc.collect()
+        self.assertTrue(ref() is None)
+        posts[0].owner
+        self.assertEqual(calls, [[0, 2]])
+
+    def test_other_classes(self):
+        # Siblings without the attribute should be skipped.
+        class Page(object):
+            pass
+
+        post, page = batched.batch([Post(1), Page()])
+        self.assertEqual(post.owner, 'user1')
+        self.assertEqual(calls, [[1]])
+
+    def test_wrong_length(self):
+        # Functions must return one value per instance.
+        class Foo(object):
+            @batched
+            def bar(foos):
+                return [1]
+
+        foos = batched.batch([Foo(), Foo()])
+        self.assertException(ValueError, 'bar returned 1 values for 2 instances', getattr, foos[0], 'bar')
+        self.assertEqual(lazy.computed(foos[1]), ())
+
+    def test_exception(self):
+        # Exceptions should not store values.
+        class Foo(object):
+            @batched
+            def bar(foos):
+                raise ValueError('bar')
+
+        foos = batched.batch([Foo(), Foo()])
+        self.assertException(ValueError, 'bar', getattr, foos[0], 'bar')
+        self.assertEqual(lazy.computed(foos[1]), ())
+
+    def test_copy_and_pickle(self):
+        # Copies should not belong to the batch.
+        posts = batched.batch([Post(i) for i in range(2)])
+        for other in (copy.deepcopy(posts[0]), pickle.loads(pickle.dumps(posts[0]))):
+            self.assertEqual(other.owner, 'user0')
+        self.assertEqual(calls, [[0], [0]])
+        self.assertEqual(lazy.computed(posts[1]), ())
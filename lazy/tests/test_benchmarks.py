@@ -0,0 +1,57 @@
+import json
+import tempfile
+import shutil
+import os
+
+from lazy.benchmarks import bench
+from lazy.tests.test_lazy import TestCase
+
+
+class BenchmarkTests(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_run(self):
+        # All benchmarks should run for all variants.
+        results = bench.run(number=10, repeat=1, threads=2)
+        benchmarks = set(r['benchmark'] for r in results['results'])
+        variants = set(r['variant'] for r in results['results'])
+        self.assertEqual(benchmarks, set(['cold', 'warm', 'invalidate', 'deep', 'private', 'threads']))
+        self.assertTrue(set(['property', 'lazy', 'cached', 'locked']) <= variants)
+        for r in results['results']:
+            self.assertTrue(r['ns_per_op'] >= 0)
+
+    def test_filter(self):
+        # Benchmarks and variants should be selectable.
+        results = bench.run(['warm'], ['lazy'], number=10, repeat=1)
+        self.assertEqual([(r['benchmark'], r['variant']) for r in results['results']],
+                         [('warm', 'lazy')])
+
+    def test_compare(self):
+        # Slower results should be reported.
+        baseline = {'results': [
+            {'benchmark': 'warm', 'variant': 'lazy', 'ns_per_op': 100.0},
+            {'benchmark': 'cold', 'variant': 'lazy', 'ns_per_op': 100.0},
+        ]}
+        results = {'results': [
+            {'benchmark': 'warm', 'variant': 'lazy', 'ns_per_op': 120.0},
+            {'benchmark': 'cold', 'variant': 'lazy', 'ns_per_op': 130.0},
+            {'benchmark': 'deep', 'variant': 'lazy', 'ns_per_op': 500.0},
+        ]}
+        self.assertEqual(bench.compare(results, baseline),
+                         [('cold', 'lazy', 100.0, 130.0)])
+        self.assertEqual(len(bench.compare(results, baseline, 0.1)), 2)
+
+    def test_main(self):
+        # Results should be written as JSON.
+        output = os.path.join(self.dir, 'results.json')
+        args = ['-b', 'warm', '-v', 'lazy', '-n', '10', '-r', '1', '-o', output]
+        self.assertEqual(bench.main(args), 0)
+        with open(output) as f:
+            results = json.load(f)
+        self.assertEqual(len(results['results']), 1)
+        self.assertEqual(bench.main(args + ['--compare', output, '--tolerance', '1000']), 0)
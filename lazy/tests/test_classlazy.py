@@ -0,0 +1,166 @@
+import re
+
+from lazy import lazy
+from lazy import classlazy
+from lazy.tests.test_lazy import TestCase
+
+
+class ClassLazyTests(TestCase):
+
+    def test_evaluate_once(self):
+        # Class attributes should be evaluated once per class.
+        called = []
+
+        class Foo(object):
+            @classlazy
+            def pattern(cls):
+                called.append(cls)
+                return re.compile('foo')
+
+        self.assertEqual(Foo.pattern.pattern, 'foo')
+        self.assertTrue(Foo.pattern is Foo.pattern)
+        self.assertTrue(Foo().pattern is Foo.pattern)
+        self.assertEqual(called, [Foo])
+        self.assertTrue(isinstance(Foo.__dict__['pattern'], lazy))
+
+    def test_instance_first(self):
+        # Access through an instance should compute the class value.
+        called = []
+
+        class Foo(object):
+            @classlazy
+            def table(cls):
+                called.append(cls)
+                return {'a': 1}
+
+        f = Foo()
+        self.assertEqual(f.table, {'a': 1})
+        self.assertTrue(Foo.table is f.table)
+        self.assertEqual(f.__dict__, {})
+        self.assertEqual(called, [Foo])
+
+    def test_subclasses(self):
+        # Subclasses should compute their own values.
+        called = []
+
+        class Foo(object):
+            name = 'foo'
+            @classlazy
+            def table(cls):
+                called.append(cls)
+                return cls.name.upper()
+
+        class Bar(Foo):
+            name = 'bar'
+
+        self.assertEqual(Foo.table, 'FOO')
+        self.assertEqual(Bar.table, 'BAR')
+        self.assertEqual(Bar().table, 'BAR')
+        self.assertEqual(Foo.table, 'FOO')
+        self.assertEqual(called, [Foo, Bar])
+
+    def test_subclass_first(self):
+        # Computing a subclass value should not affect the base class.
+        class Foo(object):
+            name = 'foo'
+            @classlazy
+            def table(cls):
+                return cls.name
+
+        class Bar(Foo):
+            name = 'bar'
+
+        self.assertEqual(Bar.table, 'bar')
+        self.assertEqual(Foo.table, 'foo')
+
+    def test_invalidate(self):
+        # Invalidating should drop the values of the class and its
+        # subclasses.
+        called = []
+
+        class Foo(object):
+            @classlazy
+            def table(cls):
+                called.append(cls)
+                return len(called)
+
+        class Bar(Foo):
+            pass
+
+        class Baz(Foo):
+            pass
+
+        Foo.table, Bar.table, Baz.table
+        classlazy.invalidate(Bar, 'table')
+        self.assertEqual((Foo.table, Bar.table, Baz.table), (1, 4, 3))
+        classlazy.invalidate(Foo, 'table')
+        self.assertEqual((Foo.table, Bar.table, Baz.table), (5, 6, 7))
+
+    def test_invalidate_instance(self):
+        # Invalidating instances should not drop class values.
+        called = []
+
+        class Foo(object):
+            @classlazy
+            def table(cls):
+                called.append(cls)
+                return 1
+
+        f = Foo()
+        f.table
+        lazy.invalidate_all(f)
+        f.table
+        self.assertEqual(len(called), 1)
+
+    def test_invalidate_non_classlazy(self):
+        # Only classlazy attributes should be invalidated.
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 1
+
+        self.assertException(AttributeError,
+            "'Foo.foo' is not a classlazy attribute",
+            classlazy.invalidate, Foo, 'foo')
+
+    def test_computed(self):
+        # Class values should be listed as computed.
+        class Foo(object):
+            @classlazy
+            def table(cls):
+                return 1
+
+        f = Foo()
+        self.assertEqual(lazy.computed(f), ())
+        Foo.table
+        self.assertEqual(lazy.computed(f), ('table',))
+        self.assertEqual(classlazy.attributes(Foo), ('table',))
+
+    def test_private_attribute(self):
+        # It should be possible to create private class attributes.
+        called = []
+
+        class Foo(object):
+            @classlazy
+            def __table(cls):
+                called.append(cls)
+                return 1
+            @classmethod
+            def get_table(cls):
+                return cls.__table
+
+        self.assertEqual(Foo.get_table(), 1)
+        self.assertEqual(Foo().get_table(), 1)
+        self.assertEqual(len(called), 1)
+        classlazy.invalidate(Foo, '__table')
+        self.assertEqual(Foo.get_table(), 1)
+        self.assertEqual(len(called), 2)
+
+    def test_metaclass_setattr(self):
+        # Values should be stored regardless of the metaclass.
+        class Meta(type):
+            def __setattr__(cls, name, value):
+                raise AttributeError('read-only')
+
+        Foo = Meta('Foo', (object,), {'table': classlazy(lambda cls: 42)})
+        self.assertEqual(Foo.table, 42)
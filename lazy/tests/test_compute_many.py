@@ -0,0 +1,220 @@
+import os
+import unittest
+
+from lazy import lazy
+from lazy import slotted
+from lazy import expiring
+from lazy import evictable
+from lazy import tracked
+from lazy import awaitable
+from lazy import classlazy
+from lazy.tests.test_lazy import TestCase
+
+try:
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = ThreadPoolExecutor = None
+
+
+# Classes must be importable by worker processes
+
+class Foo(object):
+
+    def __init__(self, x):
+        self.x = x
+
+    @lazy
+    def square(self):
+        return self.x * self.x
+
+    @lazy
+    def pid(self):
+        return os.getpid()
+
+    @lazy
+    def __cube(self):
+        return self.x ** 3
+
+    def get_cube(self):
+        return self.__cube
+
+
+class Bar(Foo):
+    pass
+
+
+class Slotted(object):
+    __slots__ = ('x', '_square')
+
+    def __init__(self, x):
+        self.x = x
+
+    def __getstate__(self):
+        return self.x
+
+    def __setstate__(self, state):
+        self.x = state
+
+    @slotted
+    def square(self):
+        return self.x * self.x
+
+
+class Expiring(object):
+
+    def __init__(self, x):
+        self.x = x
+
+    @expiring(ttl=60)
+    def square(self):
+        return self.x * self.x
+
+
+class Evictable(object):
+
+    def __init__(self, x):
+        self.x = x
+
+    @evictable(cost=1)
+    def square(self):
+        return self.x * self.x
+
+
+@unittest.skipIf(ProcessPoolExecutor is None, 'requires concurrent.futures')
+class ComputeManyTests(TestCase):
+
+    def setUp(self):
+        self.executor = ProcessPoolExecutor(2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_compute_many(self):
+        # Values should be computed in worker processes.
+        objs = [Foo(i) for i in range(10)]
+        self.assertEqual(lazy.compute_many(objs, 'square', executor=self.executor), 10)
+        self.assertEqual([obj.__dict__['square'] for obj in objs], [i * i for i in range(10)])
+
+    def test_worker_processes(self):
+        # The function should not run in the calling process.
+        objs = [Foo(i) for i in range(4)]
+        lazy.compute_many(objs, 'pid', executor=self.executor, chunksize=2)
+        for obj in objs:
+            self.assertNotEqual(obj.pid, os.getpid())
+
+    def test_skip_computed(self):
+        # Instances that have a value should be skipped.
+        objs = [Foo(i) for i in range(4)]
+        objs[1].square = 'x'
+        self.assertEqual(lazy.compute_many(objs, 'square', executor=self.executor), 3)
+        self.assertEqual([obj.square for obj in objs], [0, 'x', 4, 9])
+        self.assertEqual(lazy.compute_many(objs, 'square', executor=self.executor), 0)
+
+    def test_duplicates(self):
+        # Instances should be computed once.
+        f = Foo(3)
+        self.assertEqual(lazy.compute_many([f, f, f], 'square', executor=self.executor), 1)
+        self.assertEqual(f.square, 9)
+
+    def test_private_attribute(self):
+        # Values should be stored under the mangled name.
+        objs = [Foo(2), Foo(3)]
+        lazy.compute_many(objs, '__cube', executor=self.executor)
+        self.assertEqual(objs[0].__dict__['_Foo__cube'], 8)
+        self.assertEqual(objs[0].get_cube(), 8)
+        self.assertEqual(objs[1].get_cube(), 27)
+
+    def test_mixed_classes(self):
+        # Instances of different classes should be computed.
+        objs = [Foo(2), Bar(3)]
+        lazy.compute_many(objs, 'square', executor=self.executor)
+        self.assertEqual([obj.__dict__['square'] for obj in objs], [4, 9])
+
+    def test_slotted(self):
+        # Values should be stored in the reserved slot.
+        objs = [Slotted(i) for i in range(3)]
+        slotted.compute_many(objs, 'square', executor=self.executor)
+        self.assertEqual([obj._square for obj in objs], [0, 1, 4])
+        self.assertEqual(slotted.computed(objs[0]), ('square',))
+
+    def test_expiring(self):
+        # Values should be stored with a deadline.
+        objs = [Expiring(i) for i in range(3)]
+        expiring.compute_many(objs, 'square', executor=self.executor)
+        self.assertEqual([obj.square for obj in objs], [0, 1, 4])
+        self.assertEqual(lazy.computed(objs[2]), ('square',))
+
+    def test_evictable(self):
+        # Values should be registered in the LRU.
+        evictable.evict_all()
+        objs = [Evictable(i) for i in range(3)]
+        evictable.compute_many(objs, 'square', executor=self.executor)
+        self.assertEqual(evictable.usage(), (3, 3))
+        evictable.evict_all()
+        self.assertEqual(lazy.computed(objs[0]), ())
+
+    def test_thread_pool(self):
+        # Other executors should work as well.
+        executor = ThreadPoolExecutor(2)
+        try:
+            objs = [Foo(i) for i in range(4)]
+            lazy.compute_many(objs, 'square', executor=executor)
+            self.assertEqual([obj.__dict__['square'] for obj in objs], [0, 1, 4, 9])
+        finally:
+            executor.shutdown()
+
+    def test_default_executor(self):
+        # A process pool should be used by default.
+        objs = [Foo(i) for i in range(2)]
+        self.assertEqual(lazy.compute_many(objs, 'pid'), 2)
+        self.assertNotEqual(objs[0].pid, os.getpid())
+
+    def test_not_lazy(self):
+        # Names of other attributes should be rejected.
+        self.assertException(AttributeError,
+            "'Foo.get_cube' is not a lazy attribute",
+            lazy.compute_many, [Foo(1)], 'get_cube', executor=self.executor)
+        self.assertException(AttributeError,
+            "'Foo.square' is not a slotted attribute",
+            slotted.compute_many, [Foo(1)], 'square', executor=self.executor)
+
+    def test_overridden_compute(self):
+        # Subclasses computing values differently should be rejected.
+        class Foo(object):
+            @awaitable
+            def a(self):
+                pass
+
+            @tracked
+            def b(self):
+                return 1
+
+        self.assertException(TypeError,
+            "compute_many does not support awaitable attribute 'Foo.a'",
+            lazy.compute_many, [Foo()], 'a', executor=self.executor)
+        self.assertException(TypeError,
+            "compute_many does not support tracked attribute 'Foo.b'",
+            tracked.compute_many, [Foo()], 'b', executor=self.executor)
+        self.assertEqual(lazy.computed(Foo()), ())
+
+    def test_classlazy(self):
+        # Lazy class attributes should be rejected.
+        class Foo(object):
+            @classlazy
+            def table(cls):
+                return cls.__name__
+
+        self.assertException(TypeError,
+            "compute_many does not support classlazy attribute 'Foo.table'",
+            lazy.compute_many, [Foo()], 'table', executor=self.executor)
+        self.assertFalse('__lazy_table' in Foo.__dict__)
+
+    def test_slotted_thread_pool(self):
+        # Subclasses storing values differently should be supported.
+        executor = ThreadPoolExecutor(2)
+        try:
+            objs = [Slotted(i) for i in range(4)]
+            self.assertEqual(slotted.compute_many(objs, 'square', executor=executor), 4)
+            self.assertEqual([obj._square for obj in objs], [0, 1, 4, 9])
+        finally:
+            executor.shutdown()
@@ -0,0 +1,213 @@
+from lazy import lazy
+from lazy import expiring
+from lazy import slotted
+from lazy.lazy import _index, _indexes
+from lazy.tests.test_lazy import TestCase
+
+
+class Rect(object):
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.called = []
+
+    @lazy(depends_on=('width', 'height'))
+    def area(self):
+        self.called.append('area')
+        return self.width * self.height
+
+    @lazy(depends_on='area')
+    def label(self):
+        self.called.append('label')
+        return '%d m2' % (self.area,)
+
+
+class DependsOnTests(TestCase):
+
+    def test_assign(self):
+        # Assigning an input should invalidate dependent attributes.
+        r = Rect(2, 3)
+        self.assertEqual(r.area, 6)
+        r.width = 4
+        self.assertFalse('area' in r.__dict__)
+        self.assertEqual(r.area, 12)
+        r.height = 1
+        self.assertEqual(r.area, 4)
+        self.assertEqual(r.called, ['area', 'area', 'area'])
+
+    def test_delete(self):
+        # Deleting an input should invalidate dependent attributes.
+        r = Rect(2, 3)
+        r.area
+        del r.width
+        self.assertFalse('area' in r.__dict__)
+        self.assertRaises(AttributeError, getattr, r, 'area')
+
+    def test_unrelated(self):
+        # Assigning other attributes should keep cached values.
+        r = Rect(2, 3)
+        r.area
+        r.color = 'red'
+        self.assertEqual(r.area, 6)
+        self.assertEqual(r.called, ['area'])
+
+    def test_unrelated_skip_index(self):
+        # Assigning other attributes should not look up the index.
+        r = Rect(2, 3)
+        r.area
+        _indexes.pop(Rect, None)
+        r.color = 'red'
+        self.assertFalse(Rect in _indexes)
+        r.width = 1
+        self.assertTrue(Rect in _indexes)
+
+    def test_new_class_keeps_indexes(self):
+        # Creating a class should not drop the indexes of other classes.
+        index = _index(Rect)
+
+        class Other(object):
+            @lazy
+            def value(self):
+                return 1
+
+        self.assertTrue(_indexes.get(Rect) is index)
+
+    def test_set_name_drops_subclass_indexes(self):
+        # Adding a lazy attribute should drop the indexes of subclasses.
+        class Base(object):
+            pass
+
+        class Sub(Base):
+            pass
+
+        self.assertEqual(_index(Sub).descriptors, {})
+        value = lazy(lambda self: 1)
+        Base.value = value
+        value.__set_name__(Base, 'value')
+        self.assertFalse(Sub in _indexes)
+        self.assertEqual(_index(Sub).descriptors, {'value': value})
+
+    def test_cascade(self):
+        # Invalidation should reach attributes depending on dependents.
+        r = Rect(2, 3)
+        self.assertEqual(r.label, '6 m2')
+        r.width = 1
+        self.assertEqual(lazy.computed(r), ())
+        self.assertEqual(r.label, '3 m2')
+
+    def test_assign_lazy(self):
+        # Assigning a lazy attribute should invalidate its dependents.
+        r = Rect(2, 3)
+        r.label
+        r.area = 10
+        self.assertEqual(r.label, '10 m2')
+
+    def test_reverse_index(self):
+        # The index should map inputs to dependent attributes.
+        inputs = _index(Rect).inputs
+        self.assertEqual(sorted(inputs), ['area', 'height', 'width'])
+        self.assertEqual([name for name, descriptor in inputs['width']], ['area'])
+
+    def test_subclass(self):
+        # Subclasses should inherit dependencies.
+        class Square(Rect):
+            def __init__(self, size):
+                Rect.__init__(self, size, size)
+
+        s = Square(2)
+        self.assertEqual(s.area, 4)
+        s.width = 3
+        self.assertEqual(s.area, 6)
+
+    def test_own_setattr(self):
+        # A __setattr__ of the class should still be called.
+        called = []
+
+        class Foo(object):
+            def __setattr__(self, name, value):
+                called.append(name)
+                object.__setattr__(self, name, value)
+
+            @lazy(depends_on='x')
+            def y(self):
+                return self.x + 1
+
+        f = Foo()
+        f.x = 1
+        self.assertEqual(f.y, 2)
+        f.x = 2
+        self.assertEqual(f.y, 3)
+        self.assertEqual(called, ['x', 'x'])
+
+    def test_private_input(self):
+        # Private inputs should be mangled.
+        class Foo(object):
+            def __init__(self, x):
+                self.__x = x
+
+            def set_x(self, x):
+                self.__x = x
+
+            @lazy(depends_on='__x')
+            def y(self):
+                return self.__x + 1
+
+        f = Foo(1)
+        self.assertEqual(f.y, 2)
+        f.set_x(2)
+        self.assertEqual(f.y, 3)
+
+    def test_private_input_subclass(self):
+        # Private inputs should be mangled with the defining class.
+        class Base(object):
+            def __init__(self, w):
+                self.__w = w
+
+            def set_w(self, w):
+                self.__w = w
+
+            @lazy(depends_on='__w')
+            def area(self):
+                return self.__w * 10
+
+        class Sub(Base):
+            pass
+
+        for cls in (Base, Sub):
+            obj = cls(1)
+            self.assertEqual(obj.area, 10)
+            obj.set_w(2)
+            self.assertEqual(obj.area, 20)
+
+    def test_subclasses_of_lazy(self):
+        # Subclasses of lazy should support dependencies.
+        class Foo(object):
+            __slots__ = ('x', '_y')
+
+            @slotted(slot='_y', depends_on='x')
+            def y(self):
+                return self.x + 1
+
+        class Bar(object):
+            x = 1
+
+            @expiring(ttl=60, depends_on='x')
+            def y(self):
+                return self.x + 1
+
+        for cls in (Foo, Bar):
+            f = cls()
+            f.x = 1
+            self.assertEqual(f.y, 2)
+            f.x = 2
+            self.assertEqual(f.y, 3)
+
+    def test_no_dependencies(self):
+        # Classes without dependencies should not be changed.
+        class Foo(object):
+            @lazy
+            def y(self):
+                return 1
+
+        self.assertTrue(Foo.__setattr__ is object.__setattr__)
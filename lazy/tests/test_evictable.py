@@ -0,0 +1,158 @@
+import gc
+
+from lazy import lazy
+from lazy import evictable
+from lazy.tests.test_lazy import TestCase
+
+
+class Foo(object):
+
+    def __init__(self):
+        self.called = []
+
+    @evictable(cost=10)
+    def foo(self):
+        self.called.append('foo')
+        return 'foo'
+
+    @evictable(cost=len)
+    def bar(self):
+        self.called.append('bar')
+        return 'x' * 100
+
+
+class EvictableTests(TestCase):
+
+    def setUp(self):
+        evictable.evict_all()
+        evictable.configure()
+
+    def tearDown(self):
+        evictable.evict_all()
+        evictable.configure()
+
+    def test_evaluate_once(self):
+        # Evictable attributes should be evaluated only once.
+        f = Foo()
+        self.assertEqual(f.foo, 'foo')
+        self.assertEqual(f.foo, 'foo')
+        self.assertEqual(f.called, ['foo'])
+        self.assertEqual(evictable.usage(), (1, 10))
+        self.assertTrue(isinstance(Foo.foo, lazy))
+
+    def test_cost(self):
+        # Costs should be taken from the cost hints.
+        f = Foo()
+        f.foo
+        f.bar
+        self.assertEqual(evictable.usage(), (2, 110))
+
+    def test_default_cost(self):
+        # The default cost should be the size of the value.
+        import sys
+
+        class Bar(object):
+            @evictable
+            def foo(self):
+                return 'x' * 1000
+
+        b = Bar()
+        self.assertEqual(evictable.usage(), (0, 0))
+        b.foo
+        self.assertEqual(evictable.usage(), (1, sys.getsizeof(b.foo)))
+
+    def test_max_entries(self):
+        # Least recently used values should be evicted.
+        objs = [Foo() for i in range(5)]
+        evictable.configure(max_entries=3)
+
+        for obj in objs:
+            obj.foo
+        self.assertEqual(evictable.usage(), (3, 30))
+        self.assertEqual([lazy.computed(obj) for obj in objs],
+                         [(), (), ('foo',), ('foo',), ('foo',)])
+
+        # Touch the oldest entry
+        objs[2].foo
+        objs[0].foo
+        self.assertEqual([lazy.computed(obj) for obj in objs],
+                         [('foo',), (), ('foo',), (), ('foo',)])
+
+    def test_max_bytes(self):
+        # Values should be evicted when the byte budget is exceeded.
+        f = Foo()
+        g = Foo()
+        evictable.configure(max_bytes=115)
+
+        f.foo
+        f.bar
+        g.foo
+        self.assertEqual(evictable.usage(), (2, 110))
+        self.assertEqual(lazy.computed(f), ('bar',))
+        self.assertEqual(lazy.computed(g), ('foo',))
+
+    def test_recompute(self):
+        # Evicted values should be computed again on next access.
+        f = Foo()
+        f.foo
+        evictable.evict_all()
+        self.assertEqual(evictable.usage(), (0, 0))
+        self.assertEqual(f.foo, 'foo')
+        self.assertEqual(f.called, ['foo', 'foo'])
+
+    def test_configure_evicts(self):
+        # Lowering the budget should evict values.
+        objs = [Foo() for i in range(5)]
+        for obj in objs:
+            obj.foo
+        evictable.configure(max_entries=1)
+        self.assertEqual(evictable.usage(), (1, 10))
+
+    def test_assign(self):
+        # Assigned values should be registered.
+        f = Foo()
+        f.foo = 'bar'
+        self.assertEqual(f.foo, 'bar')
+        self.assertEqual(evictable.usage(), (1, 10))
+        del f.foo
+        self.assertEqual(evictable.usage(), (0, 0))
+        self.assertRaises(AttributeError, delattr, f, 'foo')
+
+    def test_invalidate(self):
+        # Invalidated values should be removed from the LRU.
+        f = Foo()
+        f.foo
+        f.bar
+        evictable.invalidate(f, 'foo')
+        self.assertEqual(evictable.usage(), (1, 100))
+        lazy.invalidate_all(f)
+        self.assertEqual(evictable.usage(), (0, 0))
+
+    def test_instance_goes_away(self):
+        # Values should be removed from the LRU with their instance.
+        f = Foo()
+        f.foo
+        f.bar
+        del f
+        gc.collect()
+        self.assertEqual(evictable.usage(), (0, 0))
+
+    def test_private_attribute(self):
+        # It should be possible to create private evictable attributes.
+        called = []
+
+        class Bar(object):
+            @evictable(cost=1)
+            def __foo(self):
+                called.append('foo')
+                return 1
+            def get_foo(self):
+                return self.__foo
+
+        b = Bar()
+        self.assertEqual(b.get_foo(), 1)
+        self.assertEqual(b.get_foo(), 1)
+        self.assertEqual(len(called), 1)
+        evictable.evict_all()
+        self.assertEqual(b.get_foo(), 1)
+        self.assertEqual(len(called), 2)
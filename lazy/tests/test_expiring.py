@@ -0,0 +1,205 @@
+import time
+import threading
+import importlib
+
+from lazy import lazy
+from lazy import expiring
+from lazy.tests.test_lazy import TestCase
+
+module = importlib.import_module('lazy.expiring')
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ClockTestCase(TestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        self.saved = module._clock
+        module._clock = self.clock
+
+    def tearDown(self):
+        module._clock = self.saved
+
+
+class ExpiringTests(ClockTestCase):
+
+    def test_evaluate_once(self):
+        # Expiring attributes should be evaluated once per ttl.
+        called = []
+
+        class Foo(object):
+            @expiring(ttl=10)
+            def foo(self):
+                called.append('foo')
+                return len(called)
+
+        f = Foo()
+        self.assertEqual(f.foo, 1)
+        self.clock.now += 9
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(len(called), 1)
+        self.assertTrue(isinstance(Foo.foo, lazy))
+
+    def test_expire(self):
+        # Expired attributes should be computed again.
+        called = []
+
+        class Foo(object):
+            @expiring(ttl=10)
+            def foo(self):
+                called.append('foo')
+                return len(called)
+
+        f = Foo()
+        self.assertEqual(f.foo, 1)
+        self.clock.now += 10
+        self.assertEqual(f.foo, 2)
+        self.clock.now += 5
+        self.assertEqual(f.foo, 2)
+        self.clock.now += 5
+        self.assertEqual(f.foo, 3)
+
+    def test_jitter(self):
+        # Jitter should spread the deadlines.
+
+        class Foo(object):
+            @expiring(ttl=10, jitter=5)
+            def foo(self):
+                return 1
+
+        objs = [Foo() for i in range(20)]
+        for obj in objs:
+            obj.foo
+
+        deadlines = [obj.__dict__['foo'][1] for obj in objs]
+        for deadline in deadlines:
+            self.assertTrue(1010 <= deadline <= 1015)
+        self.assertTrue(len(set(deadlines)) > 1)
+
+    def test_computed(self):
+        # Expired attributes should not be listed as computed.
+
+        class Foo(object):
+            @expiring(ttl=10)
+            def foo(self):
+                return 1
+
+        f = Foo()
+        f.foo
+        self.assertEqual(lazy.computed(f), ('foo',))
+        self.clock.now += 10
+        self.assertEqual(lazy.computed(f), ())
+
+    def test_assign(self):
+        # Assigned values should expire as well.
+        called = []
+
+        class Foo(object):
+            @expiring(ttl=10)
+            def foo(self):
+                called.append('foo')
+                return 1
+
+        f = Foo()
+        f.foo = 42
+        self.assertEqual(f.foo, 42)
+        self.clock.now += 10
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(len(called), 1)
+
+        del f.foo
+        self.assertRaises(AttributeError, delattr, f, 'foo')
+
+    def test_invalidate(self):
+        # It should be possible to invalidate an expiring attribute.
+        called = []
+
+        class Foo(object):
+            @expiring(ttl=10)
+            def foo(self):
+                called.append('foo')
+                return len(called)
+
+        f = Foo()
+        self.assertEqual(f.foo, 1)
+        expiring.invalidate(f, 'foo')
+        self.assertEqual(f.foo, 2)
+
+    def test_private_attribute(self):
+        # It should be possible to create private expiring attributes.
+        called = []
+
+        class Foo(object):
+            @expiring(ttl=10)
+            def __foo(self):
+                called.append('foo')
+                return len(called)
+            def get_foo(self):
+                return self.__foo
+
+        f = Foo()
+        self.assertEqual(f.get_foo(), 1)
+        self.assertEqual(f.get_foo(), 1)
+        self.clock.now += 10
+        self.assertEqual(f.get_foo(), 2)
+        lazy.invalidate(f, '__foo')
+        self.assertEqual(f.get_foo(), 3)
+
+    def test_readonly_object(self):
+        # The descriptor should raise an AttributeError when used on
+        # a read-only object.
+
+        class Foo(object):
+            __slots__ = ()
+            @expiring(ttl=10)
+            def foo(self):
+                return 1
+
+        self.assertException(AttributeError,
+            "'Foo' object has no attribute '__dict__'",
+            getattr, Foo(), 'foo')
+
+
+class ExpiringLockTests(ClockTestCase):
+
+    def test_single_refresher(self):
+        # With lock, concurrent readers should not recompute an
+        # expired value.
+        called = []
+        start = threading.Event()
+
+        class Foo(object):
+            @expiring(ttl=10, lock=True)
+            def foo(self):
+                called.append('foo')
+                time.sleep(0.05)
+                return len(called)
+
+        f = Foo()
+        self.assertEqual(f.foo, 1)
+        self.clock.now += 10
+
+        results = []
+
+        def target():
+            start.wait()
+            results.append(f.foo)
+
+        threads = [threading.Thread(target=target) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        start.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(called), 2)
+        self.assertEqual(results, [2] * 8)
+        self.assertEqual(Foo.foo._expiring__locks.pending, {})
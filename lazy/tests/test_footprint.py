@@ -0,0 +1,114 @@
+import sys
+
+from lazy import lazy
+from lazy import slotted
+from lazy import expiring
+from lazy.tests.test_lazy import TestCase
+
+
+class Foo(object):
+
+    def __init__(self, size=100):
+        self.size = size
+
+    @lazy
+    def data(self):
+        return [object() for i in range(self.size)]
+
+    @lazy
+    def name(self):
+        return 'foo'
+
+
+def key(cls):
+    return '%s.%s' % (cls.__module__, getattr(cls, '__qualname__', cls.__name__))
+
+
+class FootprintTests(TestCase):
+
+    def test_footprint(self):
+        # Values should be sized deeply.
+        f = Foo()
+        f.data
+        report = lazy.footprint([f])
+        self.assertEqual(list(report), [key(Foo)])
+        entry = report[key(Foo)]
+        self.assertEqual(entry['instances'], 1)
+        self.assertEqual(list(entry['attributes']), ['data'])
+        size = sys.getsizeof(f.data) + sum(sys.getsizeof(x) for x in f.data)
+        self.assertEqual(entry['attributes']['data'], {'count': 1, 'bytes': size})
+        self.assertEqual(entry['bytes'], size)
+
+    def test_totals(self):
+        # Attributes and classes should be totaled over instances.
+        instances = [Foo(10), Foo(20), Foo(30)]
+        for f in instances[:2]:
+            f.data
+            f.name
+        entry = lazy.footprint(instances)[key(Foo)]
+        self.assertEqual(entry['instances'], 3)
+        self.assertEqual(entry['attributes']['data']['count'], 2)
+        self.assertEqual(entry['attributes']['name']['count'], 2)
+        self.assertEqual(entry['bytes'], entry['attributes']['data']['bytes'] +
+                         entry['attributes']['name']['bytes'])
+
+    def test_shared(self):
+        # Shared objects should be counted once.
+        shared = [object() for i in range(100)]
+
+        class Bar(object):
+            @lazy
+            def a(self):
+                return [shared]
+
+            @lazy
+            def b(self):
+                return [shared]
+
+        b = Bar()
+        b.a, b.b
+        attributes = lazy.footprint([b])[key(Bar)]['attributes']
+        self.assertTrue(attributes['a']['bytes'] > attributes['b']['bytes'] * 10)
+
+    def test_instances_excluded(self):
+        # Values referencing instances should not include them.
+        class Bar(object):
+            @lazy
+            def parent(self):
+                return [self.other]
+
+        a, b = Bar(), Bar()
+        a.other, b.other = b, Foo(1000)
+        a.parent
+        attributes = lazy.footprint([a, b])[key(Bar)]['attributes']
+        self.assertEqual(attributes['parent']['bytes'], sys.getsizeof([b]))
+
+    def test_live_objects(self):
+        # All live instances should be found by default.
+        f = Foo()
+        f.data
+        entry = lazy.footprint()[key(Foo)]
+        self.assertTrue(entry['instances'] >= 1)
+        self.assertTrue(entry['bytes'] >= sys.getsizeof(f.data))
+
+    def test_subclasses(self):
+        # Only attributes of cls and its subclasses should be reported.
+        class Bar(object):
+            __slots__ = ('_a', '__dict__', '__weakref__')
+
+            @slotted(slot='_a')
+            def a(self):
+                return [1, 2, 3]
+
+            @expiring(ttl=60)
+            def b(self):
+                return [1, 2, 3]
+
+        b = Bar()
+        b.a, b.b
+        self.assertEqual(sorted(lazy.footprint([b])[key(Bar)]['attributes']), ['a', 'b'])
+        self.assertEqual(list(slotted.footprint([b])[key(Bar)]['attributes']), ['a'])
+
+    def test_no_lazy(self):
+        # Objects without lazy attributes should be skipped.
+        self.assertEqual(lazy.footprint([object(), [], 'foo']), {})
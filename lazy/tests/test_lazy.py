@@ -1,4 +1,6 @@
 import sys
+import copy
+import pickle
 import functools
 import inspect
 import unittest
@@ -434,6 +436,25 @@ class LazyTests(TestCase):
         self.assertEqual(len(called), 1)
 
 
+    def test_copy(self):
+        # Copied and unpickled descriptors should be lazy descriptors.
+        for descriptor in (lazy(_answer), lazy(_answer, tags='a'), cached(_answer)):
+            for clone in (copy.copy(descriptor), copy.deepcopy(descriptor),
+                          pickle.loads(pickle.dumps(descriptor, 2))):
+                self.assertTrue(type(clone) is type(descriptor))
+                self.assertEqual(clone.__name__, '_answer')
+                self.assertTrue(clone._lazy__func is _answer)
+                self.assertEqual(clone._lazy__tags, descriptor._lazy__tags)
+
+                class Foo(object):
+                    answer = clone
+
+                self.assertEqual(Foo().answer, 42)
+
+
+def _answer(self):
+    return 42
+
 class InvalidateTests(TestCase):
 
     def test_invalidate_attribute(self):
@@ -642,6 +663,377 @@ class InvalidateTests(TestCase):
         self.assertEqual(len(called), 2)
 
 
+class InvalidateManyTests(TestCase):
+
+    def test_invalidate_many(self):
+        # It should be possible to invalidate several lazy attributes
+        # at once.
+        called = []
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                called.append('foo')
+                return 1
+            @lazy
+            def bar(self):
+                called.append('bar')
+                return 2
+            @lazy
+            def __baz(self):
+                called.append('baz')
+                return 3
+            def get_baz(self):
+                return self.__baz
+
+        f = Foo()
+        self.assertEqual((f.foo, f.bar, f.get_baz()), (1, 2, 3))
+        lazy.invalidate(f, 'foo', 'bar', '__baz')
+        self.assertFalse('foo' in f.__dict__)
+        self.assertFalse('bar' in f.__dict__)
+        self.assertFalse('_Foo__baz' in f.__dict__)
+        self.assertEqual((f.foo, f.bar, f.get_baz()), (1, 2, 3))
+        self.assertEqual(len(called), 6)
+
+    def test_invalidate_many_nonlazy_attribute(self):
+        # Invalidating several attributes where one is not lazy
+        # should raise an AttributeError.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 1
+            def bar(self):
+                return 2
+
+        f = Foo()
+        self.assertException(AttributeError,
+            "'Foo.bar' is not a lazy attribute",
+            lazy.invalidate, f, 'foo', 'bar')
+
+    def test_invalidate_all(self):
+        # It should be possible to invalidate all lazy attributes.
+        called = []
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                called.append('foo')
+                return 1
+            @lazy
+            def __bar(self):
+                called.append('bar')
+                return 2
+            def get_bar(self):
+                return self.__bar
+
+        f = Foo()
+        f.baz = 3
+        self.assertEqual((f.foo, f.get_bar()), (1, 2))
+        lazy.invalidate_all(f)
+        self.assertEqual(f.__dict__, {'baz': 3})
+        self.assertEqual((f.foo, f.get_bar()), (1, 2))
+        self.assertEqual(len(called), 4)
+
+    def test_invalidate_all_uncalled(self):
+        # It should be possible to invalidate all lazy attributes
+        # when none has been computed.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 1
+
+        f = Foo()
+        lazy.invalidate_all(f) # Nothing happens
+        self.assertEqual(f.__dict__, {})
+
+    def test_invalidate_all_inherited(self):
+        # Inherited lazy attributes should be invalidated.
+        called = []
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                called.append('foo')
+                return 1
+            @lazy
+            def bar(self):
+                called.append('bar')
+                return 2
+
+        class Bar(Foo):
+            @lazy
+            def baz(self):
+                called.append('baz')
+                return 3
+
+        b = Bar()
+        self.assertEqual((b.foo, b.bar, b.baz), (1, 2, 3))
+        lazy.invalidate_all(b)
+        self.assertEqual(b.__dict__, {})
+        self.assertEqual(len(called), 3)
+
+    def test_invalidate_all_shadowed(self):
+        # Lazy attributes shadowed by a subclass should not be
+        # invalidated.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 1
+            @lazy
+            def bar(self):
+                return 2
+
+        class Bar(Foo):
+            bar = 42
+
+        b = Bar()
+        self.assertEqual(b.foo, 1)
+        b.__dict__['bar'] = 3
+        lazy.invalidate_all(b)
+        self.assertEqual(b.__dict__, {'bar': 3})
+
+    def test_invalidate_all_subclass(self):
+        # cached.invalidate_all should only invalidate cached attributes.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 1
+            @cached
+            def bar(self):
+                return 2
+
+        f = Foo()
+        self.assertEqual((f.foo, f.bar), (1, 2))
+        cached.invalidate_all(f)
+        self.assertEqual(f.__dict__, {'foo': 1})
+        lazy.invalidate_all(f)
+        self.assertEqual(f.__dict__, {})
+
+    def test_invalidate_tags(self):
+        # It should be possible to invalidate lazy attributes by tag.
+        called = []
+
+        class Foo(object):
+            @lazy(tags=('db',))
+            def foo(self):
+                called.append('foo')
+                return 1
+            @lazy(tags=('db', 'http'))
+            def bar(self):
+                called.append('bar')
+                return 2
+            @lazy(tags='http')
+            def baz(self):
+                called.append('baz')
+                return 3
+            @lazy
+            def quux(self):
+                called.append('quux')
+                return 4
+
+        f = Foo()
+        self.assertEqual((f.foo, f.bar, f.baz, f.quux), (1, 2, 3, 4))
+
+        lazy.invalidate_all(f, tags='db')
+        self.assertEqual(sorted(f.__dict__), ['baz', 'quux'])
+
+        self.assertEqual((f.foo, f.bar), (1, 2))
+        lazy.invalidate_all(f, tags=('http',))
+        self.assertEqual(sorted(f.__dict__), ['foo', 'quux'])
+
+        self.assertEqual((f.bar, f.baz), (2, 3))
+        lazy.invalidate_all(f, tags=('db', 'http'))
+        self.assertEqual(sorted(f.__dict__), ['quux'])
+
+        lazy.invalidate_all(f, tags='nope') # Nothing happens
+        self.assertEqual(sorted(f.__dict__), ['quux'])
+        self.assertEqual(len(called), 8)
+
+    def test_invalidate_tags_subclass(self):
+        # Tags should be supported by lazy subclasses.
+
+        class Foo(object):
+            @cached(tags='db')
+            def foo(self):
+                return 1
+
+        f = Foo()
+        self.assertEqual(f.foo, 1)
+        self.assertTrue(isinstance(Foo.foo, cached))
+        cached.invalidate_all(f, tags='db')
+        self.assertEqual(f.__dict__, {})
+
+    def test_index_is_cached(self):
+        # The descriptor index should be built once per class.
+        from lazy.lazy import _index
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 1
+
+        self.assertTrue(_index(Foo) is _index(Foo))
+        self.assertEqual(_index(Foo).descriptors, {'foo': Foo.__dict__['foo']})
+
+        class Bar(Foo):
+            @lazy
+            def bar(self):
+                return 2
+
+        self.assertEqual(sorted(_index(Bar).descriptors), ['bar', 'foo'])
+        self.assertEqual(sorted(_index(Foo).descriptors), ['foo'])
+
+
+class IntrospectionTests(TestCase):
+
+    def test_attributes(self):
+        # It should be possible to list the lazy attributes of a class.
+
+        def other(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+            return wrapper
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 'foo'
+            @lazy
+            def __bar(self):
+                return 'bar'
+            @lazy
+            @other
+            def baz(self):
+                return 'baz'
+            @other
+            @lazy
+            def quux(self):
+                return 'quux'
+
+        self.assertEqual(lazy.attributes(Foo), ('_Foo__bar', 'baz', 'foo'))
+
+    def test_inherited_attributes(self):
+        # Inherited lazy attributes should be listed.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 'foo'
+            @lazy
+            def __bar(self):
+                return 'bar'
+            @lazy
+            def baz(self):
+                return 'baz'
+
+        class Bar(Foo):
+            @lazy
+            def __bar(self):
+                return 'bar'
+            baz = 'baz'
+
+        if sys.version_info >= (3, 6):
+            self.assertEqual(lazy.attributes(Bar), ('_Bar__bar', '_Foo__bar', 'foo'))
+        else:
+            self.assertEqual(lazy.attributes(Bar), ('_Bar__bar', 'foo'))
+
+    def test_renamed_attributes(self):
+        # Attributes should be listed by the name set by __set_name__.
+
+        class Foo(object):
+            def _foo(self):
+                return 1
+            foo = lazy(_foo)
+
+        if sys.version_info >= (3, 6):
+            self.assertEqual(lazy.attributes(Foo), ('foo',))
+        else:
+            self.assertEqual(lazy.attributes(Foo), ('_foo',))
+
+    def test_subclass_attributes(self):
+        # cached.attributes should only list cached attributes.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 'foo'
+            @cached
+            def bar(self):
+                return 'bar'
+
+        self.assertEqual(lazy.attributes(Foo), ('bar', 'foo'))
+        self.assertEqual(cached.attributes(Foo), ('bar',))
+
+    def test_attributes_are_cached(self):
+        # The result should be computed once per class.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 'foo'
+
+        self.assertTrue(lazy.attributes(Foo) is lazy.attributes(Foo))
+
+    def test_computed(self):
+        # It should be possible to list the computed lazy attributes
+        # of an instance.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 'foo'
+            @lazy
+            def __bar(self):
+                return 'bar'
+            @lazy
+            def baz(self):
+                return 'baz'
+            def get_bar(self):
+                return self.__bar
+
+        f = Foo()
+        self.assertEqual(lazy.computed(f), ())
+        f.foo
+        self.assertEqual(lazy.computed(f), ('foo',))
+        f.get_bar()
+        self.assertEqual(lazy.computed(f), ('_Foo__bar', 'foo'))
+        lazy.invalidate(f, 'foo')
+        self.assertEqual(lazy.computed(f), ('_Foo__bar',))
+
+    def test_computed_subclass(self):
+        # cached.computed should only list cached attributes.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 'foo'
+            @cached
+            def bar(self):
+                return 'bar'
+
+        f = Foo()
+        f.foo
+        f.bar
+        self.assertEqual(lazy.computed(f), ('bar', 'foo'))
+        self.assertEqual(cached.computed(f), ('bar',))
+
+    def test_computed_readonly_object(self):
+        # Objects without __dict__ have no computed attributes.
+
+        class Foo(object):
+            __slots__ = ()
+            @lazy
+            def foo(self):
+                return 'foo'
+
+        self.assertEqual(lazy.computed(Foo()), ())
+
+
 # A lazy subclass
 class cached(lazy):
     pass
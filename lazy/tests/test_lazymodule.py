@@ -0,0 +1,153 @@
+import sys
+import types
+import unittest
+import threading
+
+from lazy import lazymodule
+from lazy.tests.test_lazy import TestCase
+
+pep562 = unittest.skipIf(sys.version_info < (3, 7), 'requires PEP 562')
+
+
+class LazyModuleTests(TestCase):
+
+    def setUp(self):
+        self.module = types.ModuleType('lazy.tests.fake')
+        sys.modules[self.module.__name__] = self.module
+
+    def tearDown(self):
+        del sys.modules[self.module.__name__]
+
+    def test_attribute(self):
+        # Lazy attributes should be computed once.
+        called = []
+        m = lazymodule(self.module.__name__)
+
+        @m.attribute('TABLE')
+        def _table():
+            called.append('TABLE')
+            return {'a': 1}
+
+        self.assertEqual(self.module.TABLE, {'a': 1})
+        self.assertTrue(self.module.TABLE is self.module.TABLE)
+        self.assertEqual(len(called), 1)
+        self.assertEqual(self.module.__dict__['TABLE'], {'a': 1})
+
+    @pep562
+    def test_deferred(self):
+        # Lazy attributes should be computed on first access.
+        called = []
+        m = lazymodule(self.module.__name__)
+        m.attribute('TABLE', lambda: called.append('TABLE') or 42)
+
+        self.assertEqual(called, [])
+        self.assertFalse('TABLE' in self.module.__dict__)
+        self.assertTrue('TABLE' in dir(self.module))
+        self.assertEqual(self.module.TABLE, 42)
+        self.assertEqual(called, ['TABLE'])
+
+    @pep562
+    def test_imports(self):
+        # Imports should be deferred.
+        m = lazymodule(self.module.__name__)
+        m.imports(json='json', loads='json:loads', test_lazy='.test_lazy')
+
+        self.assertFalse('json' in self.module.__dict__)
+        import json
+        from lazy.tests import test_lazy
+        self.assertTrue(self.module.json is json)
+        self.assertTrue(self.module.loads is json.loads)
+        self.assertTrue(self.module.test_lazy is test_lazy)
+        self.assertTrue('loads' in self.module.__dict__)
+
+    def test_imports_values(self):
+        # Imported names should be available on all Python versions.
+        m = lazymodule(self.module.__name__)
+        m.imports(loads='json:loads')
+
+        import json
+        self.assertTrue(self.module.loads is json.loads)
+
+    @pep562
+    def test_package(self):
+        # Relative imports should be resolved against packages.
+        self.module.__path__ = []
+        m = lazymodule(self.module.__name__)
+        m.imports(lazymodule='...lazymodule')
+
+        self.assertTrue(self.module.lazymodule is sys.modules['lazy.lazymodule'])
+
+    def test_invalidate(self):
+        # Invalidated attributes should be computed again.
+        called = []
+        m = lazymodule(self.module.__name__)
+        m.attribute('TABLE', lambda: called.append('TABLE') or len(called))
+
+        self.assertEqual(self.module.TABLE, 1)
+        m.invalidate('TABLE')
+        self.assertEqual(self.module.TABLE, 2)
+        self.assertException(AttributeError,
+            "'lazy.tests.fake.foo' is not a lazy attribute",
+            m.invalidate, 'foo')
+
+    @pep562
+    def test_missing(self):
+        # Unknown names should raise AttributeError.
+        lazymodule(self.module.__name__)
+        self.assertException(AttributeError,
+            "module 'lazy.tests.fake' has no attribute 'foo'",
+            getattr, self.module, 'foo')
+
+    @pep562
+    def test_fallback(self):
+        # An existing module __getattr__ should be called for unknown names.
+        self.module.__getattr__ = lambda name: name.upper()
+        m = lazymodule(self.module.__name__)
+        m.attribute('foo', lambda: 'bar')
+
+        self.assertEqual(self.module.foo, 'bar')
+        self.assertEqual(self.module.baz, 'BAZ')
+
+    @pep562
+    def test_exception(self):
+        # Exceptions should not be cached.
+        called = []
+        m = lazymodule(self.module.__name__)
+
+        @m.attribute('TABLE')
+        def _table():
+            called.append('TABLE')
+            if len(called) == 1:
+                raise ValueError('TABLE')
+            return 1
+
+        self.assertRaises(ValueError, getattr, self.module, 'TABLE')
+        self.assertEqual(self.module.TABLE, 1)
+
+    @pep562
+    def test_threads(self):
+        # Attributes should be computed by one thread.
+        called = []
+        start = threading.Event()
+        m = lazymodule(self.module.__name__)
+
+        @m.attribute('TABLE')
+        def _table():
+            called.append('TABLE')
+            start.wait(0.05)
+            return object()
+
+        results = []
+
+        def target():
+            results.append(self.module.TABLE)
+
+        threads = [threading.Thread(target=target) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        start.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(called), 1)
+        self.assertEqual(len(set(map(id, results))), 1)
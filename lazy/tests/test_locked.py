@@ -0,0 +1,203 @@
+import os
+import time
+import threading
+import unittest
+
+from lazy import lazy
+from lazy import locked
+from lazy.tests.test_lazy import TestCase
+
+
+def run_threads(target, count=8):
+    threads = [threading.Thread(target=target) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class LockedTests(TestCase):
+
+    def test_evaluate_once(self):
+        # Locked attributes should be evaluated only once.
+        called = []
+
+        class Foo(object):
+            @locked
+            def foo(self):
+                called.append('foo')
+                return 1
+
+        f = Foo()
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(len(called), 1)
+        self.assertTrue(isinstance(Foo.foo, lazy))
+
+    def test_single_flight(self):
+        # Concurrent threads should compute the value once and
+        # share the result.
+        called = []
+        results = []
+        start = threading.Event()
+
+        class Foo(object):
+            @locked
+            def foo(self):
+                called.append('foo')
+                time.sleep(0.05)
+                return object()
+
+        f = Foo()
+
+        def target():
+            start.wait()
+            results.append(f.foo)
+
+        threading.Timer(0.01, start.set).start()
+        run_threads(target)
+
+        self.assertEqual(len(called), 1)
+        self.assertEqual(len(results), 8)
+        for result in results:
+            self.assertTrue(result is f.foo)
+
+    def test_per_instance(self):
+        # Instances should not block each other.
+        called = []
+
+        class Foo(object):
+            @locked
+            def foo(self):
+                called.append('foo')
+                return object()
+
+        objs = [Foo() for i in range(8)]
+
+        def target():
+            for obj in objs:
+                obj.foo
+
+        run_threads(target)
+        self.assertEqual(len(called), 8)
+
+    def test_nested_attributes(self):
+        # A locked attribute should be able to read another
+        # without deadlocking.
+        called = []
+
+        class Foo(object):
+            @locked
+            def foo(self):
+                called.append('foo')
+                return self.bar + 1
+            @locked
+            def bar(self):
+                called.append('bar')
+                return self.baz + 1
+            @locked
+            def baz(self):
+                called.append('baz')
+                return 1
+
+        f = Foo()
+        run_threads(lambda: f.foo)
+        self.assertEqual(f.foo, 3)
+        self.assertEqual(sorted(called), ['bar', 'baz', 'foo'])
+
+    def test_exception(self):
+        # Exceptions should propagate and release the lock.
+        called = []
+
+        class Foo(object):
+            @locked
+            def foo(self):
+                called.append('foo')
+                if len(called) == 1:
+                    raise ValueError('foo')
+                return 1
+
+        f = Foo()
+        self.assertException(ValueError, 'foo', getattr, f, 'foo')
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(len(called), 2)
+        self.assertEqual(Foo.foo._locked__locks.pending, {})
+
+    def test_no_pending_locks(self):
+        # Locks should be released once the value is cached.
+
+        class Foo(object):
+            @locked
+            def foo(self):
+                return 1
+
+        f = Foo()
+        run_threads(lambda: f.foo)
+        self.assertEqual(Foo.foo._locked__locks.pending, {})
+
+    def test_invalidate(self):
+        # It should be possible to invalidate a locked attribute.
+        called = []
+
+        class Foo(object):
+            @locked
+            def foo(self):
+                called.append('foo')
+                return 1
+
+        f = Foo()
+        self.assertEqual(f.foo, 1)
+        locked.invalidate(f, 'foo')
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(len(called), 2)
+
+    def test_readonly_object(self):
+        # The descriptor should raise an AttributeError when used on
+        # a read-only object.
+
+        class Foo(object):
+            __slots__ = ()
+            @locked
+            def foo(self):
+                return 1
+
+        f = Foo()
+        self.assertException(AttributeError,
+            "'Foo' object has no attribute '__dict__'",
+            getattr, f, 'foo')
+
+    @unittest.skipUnless(hasattr(os, 'register_at_fork'), 'requires os.register_at_fork')
+    def test_fork(self):
+        # Locks held by other threads should be reset in a forked child.
+        entered = threading.Event()
+        release = threading.Event()
+
+        class Foo(object):
+            @locked
+            def foo(self):
+                if threading.current_thread().name == 'blocker':
+                    entered.set()
+                    release.wait()
+                return os.getpid()
+
+        f = Foo()
+        blocker = threading.Thread(target=lambda: f.foo, name='blocker')
+        blocker.start()
+        entered.wait()
+
+        try:
+            pid = os.fork()
+            if pid == 0:
+                # The child must not wait for the blocker thread
+                code = 1
+                try:
+                    import signal
+                    signal.alarm(5)
+                    code = 0 if f.foo == os.getpid() else 1
+                finally:
+                    os._exit(code)
+            status = os.waitpid(pid, 0)[1]
+            self.assertEqual(status, 0)
+        finally:
+            release.set()
+            blocker.join()
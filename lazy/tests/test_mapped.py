@@ -0,0 +1,99 @@
+import os
+import mmap
+import shutil
+import tempfile
+
+from lazy import lazy
+from lazy import mapped
+from lazy.tests.test_lazy import TestCase
+
+
+class Foo(object):
+
+    def __init__(self, path):
+        self.path = path
+        self.called = 0
+
+    @mapped
+    def data(self):
+        self.called += 1
+        return self.path
+
+
+class MappedTests(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'data.bin')
+        with open(self.path, 'wb') as f:
+            f.write(b'hello world')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_evaluate_once(self):
+        # Files should be mapped once.
+        f = Foo(self.path)
+        self.assertTrue(f.data is f.data)
+        self.assertEqual(f.called, 1)
+        self.assertEqual(bytes(f.data[:5]), b'hello')
+        self.assertEqual(len(f.data), 11)
+        self.assertTrue(isinstance(Foo.data, lazy))
+
+    def test_memoryview(self):
+        # Values should be read-only memoryviews of a map.
+        f = Foo(self.path)
+        if not hasattr(memoryview, 'release'):
+            self.assertTrue(isinstance(f.data, mmap.mmap))
+            return
+        self.assertTrue(isinstance(f.data, memoryview))
+        self.assertTrue(isinstance(f.data.obj, mmap.mmap))
+        self.assertTrue(f.data.readonly)
+        self.assertRaises(TypeError, f.data.__setitem__, 0, b'x')
+
+    def test_empty(self):
+        # Empty files should give empty values.
+        with open(self.path, 'wb'):
+            pass
+        f = Foo(self.path)
+        self.assertEqual(len(f.data), 0)
+        lazy.invalidate(f, 'data')
+
+    def test_invalidate(self):
+        # Invalidating should close the map.
+        f = Foo(self.path)
+        data = f.data
+        if not hasattr(memoryview, 'release'):
+            lazy.invalidate(f, 'data')
+            self.assertRaises(ValueError, data.__getitem__, 0)
+            return
+        mapping = data.obj
+        lazy.invalidate(f, 'data')
+        self.assertTrue(mapping.closed)
+        self.assertRaises(ValueError, len, data)
+        self.assertEqual(bytes(f.data[:5]), b'hello')
+        self.assertEqual(f.called, 2)
+
+    def test_invalidate_slices(self):
+        # Slices in use should keep the map open.
+        f = Foo(self.path)
+        if not hasattr(memoryview, 'release'):
+            return
+        head = f.data[:5]
+        mapping = f.data.obj
+        lazy.invalidate(f, 'data')
+        self.assertFalse(mapping.closed)
+        self.assertEqual(bytes(head), b'hello')
+        head.release()
+
+    def test_invalidate_uncomputed(self):
+        # Invalidating uncomputed attributes should have no effect.
+        f = Foo(self.path)
+        lazy.invalidate(f, 'data')
+        self.assertEqual(f.called, 0)
+
+    def test_missing_file(self):
+        # Missing files should raise and not be cached.
+        f = Foo(os.path.join(self.dir, 'missing.bin'))
+        self.assertRaises(IOError, getattr, f, 'data')
+        self.assertEqual(lazy.computed(f), ())
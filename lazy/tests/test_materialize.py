@@ -0,0 +1,146 @@
+import gc
+import sys
+import unittest
+
+from lazy import lazy
+from lazy import memoized
+from lazy import slotted
+from lazy import tracked
+from lazy.tests.test_lazy import TestCase
+
+
+class Leaf(object):
+
+    def __init__(self, called):
+        self.called = called
+
+    @lazy
+    def value(self):
+        self.called.append('value')
+        return 1
+
+
+class Node(object):
+
+    def __init__(self, called, children=()):
+        self.called = called
+        self.children = list(children)
+
+    @lazy
+    def total(self):
+        self.called.append('total')
+        return len(self.children)
+
+    @tracked
+    def label(self):
+        self.called.append('label')
+        return 'node'
+
+    @lazy
+    def leaf(self):
+        self.called.append('leaf')
+        return Leaf(self.called)
+
+    @memoized
+    def price(self, currency):
+        self.called.append('price')
+        return currency
+
+
+class MaterializeTests(TestCase):
+
+    def test_materialize(self):
+        # All lazy attributes should be computed.
+        called = []
+        n = Node(called)
+        result = lazy.materialize(n)
+        self.assertEqual(sorted(called), ['label', 'leaf', 'total'])
+        self.assertEqual(lazy.computed(n), ('label', 'leaf', 'total'))
+        self.assertEqual((result['objects'], result['attributes']), (1, 3))
+        self.assertTrue(result['seconds'] >= 0)
+
+    def test_computed(self):
+        # Computed attributes should not be computed again.
+        called = []
+        n = Node(called)
+        n.total
+        result = lazy.materialize(n)
+        self.assertEqual(called.count('total'), 1)
+        self.assertEqual(result['attributes'], 2)
+        self.assertEqual(lazy.materialize(n)['attributes'], 0)
+
+    def test_roots(self):
+        # Several roots may be passed.
+        called = []
+        result = lazy.materialize([Node(called), Node(called), Leaf(called)])
+        self.assertEqual(result['objects'], 3)
+        self.assertEqual(result['attributes'], 7)
+
+    def test_recursive(self):
+        # Reachable objects should be included if recursive is true.
+        called = []
+        leaf = Leaf(called)
+        child = Node(called, [leaf])
+        root = Node(called, [child])
+        root.cache = {'leaf': Leaf(called)}
+
+        lazy.materialize(root)
+        self.assertEqual(lazy.computed(child), ())
+
+        result = lazy.materialize(root, recursive=True)
+        self.assertEqual(lazy.computed(child), ('label', 'leaf', 'total'))
+        self.assertEqual(lazy.computed(leaf), ('value',))
+        self.assertEqual(lazy.computed(root.cache['leaf']), ('value',))
+        # Leaves computed by root and child are visited too
+        self.assertEqual(lazy.computed(root.leaf), ('value',))
+        self.assertEqual(lazy.computed(child.leaf), ('value',))
+        self.assertEqual(result['objects'], 5)
+
+    def test_cycles(self):
+        # Reference cycles should be visited once.
+        called = []
+        a = Node(called)
+        b = Node(called, [a])
+        a.children.append(b)
+        lazy.materialize(a, recursive=True)
+        self.assertEqual(called.count('total'), 2)
+
+    def test_subclasses(self):
+        # Only attributes of cls and its subclasses should be computed.
+        called = []
+        n = Node(called)
+        result = tracked.materialize(n)
+        self.assertEqual(called, ['label'])
+        self.assertEqual(result['attributes'], 1)
+
+    def test_slotted(self):
+        # Values stored outside __dict__ should be recognized.
+        class Foo(object):
+            __slots__ = ('_bar',)
+
+            @slotted(slot='_bar')
+            def bar(self):
+                return 1
+
+        f = Foo()
+        self.assertEqual(lazy.materialize(f)['attributes'], 1)
+        self.assertEqual(lazy.materialize(f)['attributes'], 0)
+
+    def test_exception(self):
+        # Exceptions should be raised.
+        class Foo(object):
+            @lazy
+            def bar(self):
+                raise ValueError('bar')
+
+        self.assertException(ValueError, 'bar', lazy.materialize, Foo())
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'requires gc.freeze')
+    def test_freeze(self):
+        # Objects should be moved to the permanent generation.
+        gc.unfreeze()
+        try:
+            lazy.materialize(Node([]), freeze=True)
+            self.assertTrue(gc.get_freeze_count() > 0)
+        finally:
+            gc.unfreeze()
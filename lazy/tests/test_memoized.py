@@ -0,0 +1,167 @@
+import gc
+import copy
+import pickle
+import weakref
+
+from lazy import lazy
+from lazy import memoized
+from lazy.tests.test_lazy import TestCase
+
+
+class Foo(object):
+
+    def __init__(self):
+        self.called = []
+
+    @memoized(maxsize=2)
+    def price(self, currency, rate=1):
+        self.called.append((currency, rate))
+        return '%d %s' % (10 * rate, currency)
+
+
+class MemoizedTests(TestCase):
+
+    def test_evaluate_once(self):
+        # Results should be computed once per arguments.
+        f = Foo()
+        self.assertEqual(f.price('EUR'), '10 EUR')
+        self.assertEqual(f.price('EUR'), '10 EUR')
+        self.assertEqual(f.price('USD', rate=2), '20 USD')
+        self.assertEqual(f.price('USD', rate=2), '20 USD')
+        self.assertEqual(f.called, [('EUR', 1), ('USD', 2)])
+        self.assertTrue(isinstance(Foo.price, lazy))
+
+    def test_per_instance(self):
+        # Instances should have their own caches.
+        f, g = Foo(), Foo()
+        f.price('EUR')
+        g.price('EUR')
+        self.assertEqual(f.called, [('EUR', 1)])
+        self.assertEqual(g.called, [('EUR', 1)])
+        self.assertEqual(list(f.__dict__['price']), [('EUR',)])
+
+    def test_maxsize(self):
+        # The least recently used results should be dropped.
+        f = Foo()
+        f.price('EUR')
+        f.price('USD')
+        f.price('EUR')
+        f.price('CHF')
+        self.assertEqual(len(f.__dict__['price']), 2)
+        f.price('EUR')
+        f.price('USD')
+        self.assertEqual(f.called, [('EUR', 1), ('USD', 1), ('CHF', 1), ('USD', 1)])
+
+    def test_unbounded(self):
+        # maxsize=None should keep all results.
+        class Bar(object):
+            @memoized(maxsize=None)
+            def double(self, x):
+                return x * 2
+
+        b = Bar()
+        for i in range(1000):
+            b.double(i)
+        self.assertEqual(len(b.__dict__['double']), 1000)
+
+    def test_invalidate(self):
+        # Invalidating should drop all results.
+        f = Foo()
+        f.price('EUR')
+        lazy.invalidate(f, 'price')
+        self.assertFalse('price' in f.__dict__)
+        f.price('EUR')
+        self.assertEqual(len(f.called), 2)
+        del f.price
+        self.assertRaises(AttributeError, delattr, f, 'price')
+        self.assertEqual(lazy.computed(f), ())
+
+    def test_invalidate_all(self):
+        # memoized methods should be invalidated with other attributes.
+        f = Foo()
+        f.price('EUR')
+        self.assertEqual(lazy.computed(f), ('price',))
+        lazy.invalidate_all(f)
+        self.assertEqual(lazy.computed(f), ())
+
+    def test_set(self):
+        # memoized methods should not be assignable.
+        f = Foo()
+        self.assertRaises(AttributeError, setattr, f, 'price', None)
+
+    def test_unhashable(self):
+        # Unhashable arguments should raise TypeError.
+        f = Foo()
+        self.assertRaises(TypeError, f.price, [])
+
+    def test_exception(self):
+        # Exceptions should not be cached.
+        class Bar(object):
+            called = 0
+            @memoized
+            def fail(self, x):
+                self.called += 1
+                raise ValueError(x)
+
+        b = Bar()
+        self.assertException(ValueError, 'a', b.fail, 'a')
+        self.assertException(ValueError, 'a', b.fail, 'a')
+        self.assertEqual(b.called, 2)
+
+    def test_freed(self):
+        # Caches should not keep instances alive.
+        f = Foo()
+        f.price('EUR')
+        ref = weakref.ref(f)
+        del f
+        gc.collect()
+        self.assertTrue(ref() is None)
+
+    def test_copy_and_pickle(self):
+        # Copies should compute results for themselves.
+        f = Foo()
+        f.price('EUR')
+        g = pickle.loads(pickle.dumps(f))
+        self.assertEqual(g.price('EUR'), '10 EUR')
+        h = copy.deepcopy(f)
+        self.assertEqual(h.price('USD'), '10 USD')
+        self.assertEqual(h.called, [('EUR', 1), ('USD', 1)])
+
+    def test_private_method(self):
+        # It should be possible to create private methods.
+        class Bar(object):
+            @memoized
+            def __double(self, x):
+                return x * 2
+            def double(self, x):
+                return self.__double(x)
+
+        b = Bar()
+        self.assertEqual(b.double(2), 4)
+        self.assertEqual(list(b.__dict__['_Bar__double']), [(2,)])
+
+    def test_depends_on(self):
+        # Assigning an input should drop all results.
+        class Bar(object):
+            factor = 2
+            @memoized(depends_on='factor')
+            def scale(self, x):
+                return x * self.factor
+
+        b = Bar()
+        self.assertEqual(b.scale(2), 4)
+        b.factor = 3
+        self.assertEqual(b.scale(2), 6)
+
+    def test_metrics(self):
+        # Calls should be counted as hits and misses.
+        lazy.enable_metrics()
+        try:
+            f = Foo()
+            f.price('EUR')
+            f.price('EUR')
+            f.price('USD')
+            stats = [v for k, v in lazy.metrics().items() if k.endswith('price')][0]
+            self.assertEqual((stats['hits'], stats['misses']), (1, 2))
+        finally:
+            lazy.disable_metrics()
@@ -0,0 +1,289 @@
+import threading
+
+from lazy import lazy
+from lazy import classlazy
+from lazy import locked
+from lazy import slotted
+from lazy import tracked
+from lazy import expiring
+from lazy import evictable
+from lazy.tests.test_lazy import TestCase
+
+
+class MetricsTestCase(TestCase):
+
+    def setUp(self):
+        self.events = []
+        lazy.enable_metrics(self.hook)
+
+    def tearDown(self):
+        lazy.disable_metrics()
+
+    def hook(self, event, descriptor, inst, elapsed):
+        self.events.append((event, descriptor.__name__, elapsed is None))
+
+    def stats(self, cls, name):
+        # Python 2 has no qualified names
+        if hasattr(cls, '__qualname__'):
+            name = '%s.%s' % (cls.__qualname__, name)
+        return lazy.metrics()['%s.%s' % (cls.__module__, name)]
+
+
+class MetricsTests(MetricsTestCase):
+
+    def test_hits_and_misses(self):
+        # Hits and misses should be counted.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 1
+
+        f = Foo()
+        f.foo
+        f.foo
+        f.foo
+        g = Foo()
+        g.foo
+        stats = self.stats(Foo, 'foo')
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['exceptions'], 0)
+        self.assertEqual(stats['invalidations'], 0)
+        self.assertEqual(self.events, [('miss', 'foo', False), ('hit', 'foo', True),
+                                       ('hit', 'foo', True), ('miss', 'foo', False)])
+
+    def test_compute_time(self):
+        # Compute times should be measured.
+        import time
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                time.sleep(0.01)
+                return 1
+
+        Foo().foo
+        Foo().foo
+        stats = self.stats(Foo, 'foo')
+        self.assertTrue(stats['max_time'] >= 0.005)
+        self.assertTrue(stats['total_time'] >= stats['max_time'] * 1.5)
+
+    def test_exceptions(self):
+        # Exceptions should be counted.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                raise ValueError('foo')
+
+        f = Foo()
+        self.assertRaises(ValueError, getattr, f, 'foo')
+        self.assertRaises(ValueError, getattr, f, 'foo')
+        stats = self.stats(Foo, 'foo')
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['exceptions'], 2)
+        self.assertEqual(self.events[0], ('error', 'foo', False))
+
+    def test_invalidations(self):
+        # Invalidations of computed values should be counted.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 1
+            @lazy
+            def bar(self):
+                return 2
+
+        f = Foo()
+        lazy.invalidate(f, 'foo')
+        f.foo
+        lazy.invalidate(f, 'foo')
+        f.foo
+        f.bar
+        lazy.invalidate_all(f)
+        self.assertEqual(self.stats(Foo, 'foo')['invalidations'], 2)
+        self.assertEqual(self.stats(Foo, 'foo')['misses'], 2)
+        self.assertEqual(self.stats(Foo, 'bar')['invalidations'], 1)
+
+    def test_assign(self):
+        # Assigned values should be read as hits.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 1
+            @lazy
+            def __bar(self):
+                return 2
+            def get_bar(self):
+                return self.__bar
+
+        f = Foo()
+        f.foo = 42
+        self.assertEqual(f.foo, 42)
+        self.assertEqual(self.stats(Foo, 'foo')['hits'], 1)
+        self.assertEqual(self.stats(Foo, 'foo')['misses'], 0)
+        del f.foo
+        self.assertRaises(AttributeError, delattr, f, 'foo')
+        self.assertEqual(f.foo, 1)
+        f._Foo__bar = 3
+        self.assertEqual(f.get_bar(), 3)
+
+    def test_classlazy_assign(self):
+        # Instance values should shadow lazy class attributes.
+
+        class Foo(object):
+            @classlazy
+            def table(cls):
+                return 'class'
+
+        f = Foo()
+        self.assertEqual(f.table, 'class')
+        f.table = 'inst'
+        self.assertEqual(f.table, 'inst')
+        self.assertEqual(Foo.table, 'class')
+        del f.table
+        self.assertEqual(f.table, 'class')
+        self.assertRaises(AttributeError, delattr, f, 'table')
+
+    def test_subclasses(self):
+        # Hits should be counted for lazy subclasses.
+
+        class Foo(object):
+            @locked
+            def foo(self):
+                return 1
+            @tracked
+            def bar(self):
+                return 2
+            @expiring(ttl=60)
+            def baz(self):
+                return 3
+            @evictable(cost=1)
+            def quux(self):
+                return 4
+
+        class Bar(object):
+            __slots__ = ('_spam',)
+            @slotted
+            def spam(self):
+                return 5
+
+        f = Foo()
+        b = Bar()
+        for i in range(2):
+            f.foo, f.bar, f.baz, f.quux, b.spam
+        for name in ('foo', 'bar', 'baz', 'quux'):
+            self.assertEqual(self.stats(Foo, name)['hits'], 1)
+            self.assertEqual(self.stats(Foo, name)['misses'], 1)
+        self.assertEqual(self.stats(Bar, 'spam')['hits'], 1)
+        evictable.evict_all()
+
+    def test_filter(self):
+        # Metrics should be filtered by class.
+
+        class cached(lazy):
+            pass
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 1
+            @cached
+            def bar(self):
+                return 2
+
+        f = Foo()
+        f.foo
+        f.bar
+        self.assertEqual([key.split('.')[-1] for key in cached.metrics()], ['bar'])
+        self.assertEqual(sorted(key.split('.')[-1] for key in lazy.metrics()), ['bar', 'foo'])
+
+    def test_reset(self):
+        # Resetting should clear the metrics.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 1
+
+        Foo().foo
+        self.assertEqual(len(lazy.metrics()), 1)
+        lazy.reset_metrics()
+        self.assertEqual(lazy.metrics(), {})
+
+    def test_threads(self):
+        # Counts should not be lost under contention.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 1
+
+        f = Foo()
+        f.foo
+
+        def target():
+            for i in range(1000):
+                f.foo
+
+        threads = [threading.Thread(target=target) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.stats(Foo, 'foo')['hits'], 4000)
+
+
+class DisabledTests(TestCase):
+
+    def test_disabled(self):
+        # Metrics should not be collected when disabled.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 1
+
+        self.assertEqual(lazy.metrics(), {})
+        Foo().foo
+        self.assertEqual(lazy.metrics(), {})
+
+    def test_non_data_descriptor(self):
+        # Lazy should be a non-data descriptor when disabled.
+        self.assertFalse(hasattr(lazy, '__set__'))
+        self.assertFalse(hasattr(lazy, '__delete__'))
+
+        lazy.enable_metrics()
+        lazy.enable_metrics()
+        try:
+            self.assertTrue(hasattr(lazy, '__set__'))
+        finally:
+            lazy.disable_metrics()
+            lazy.disable_metrics()
+
+        self.assertFalse(hasattr(lazy, '__set__'))
+        self.assertFalse(hasattr(lazy, '__delete__'))
+
+    def test_cached_values(self):
+        # Values computed while enabled should be read from the instance
+        # __dict__ when disabled.
+        called = []
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                called.append('foo')
+                return 1
+
+        f = Foo()
+        lazy.enable_metrics()
+        try:
+            f.foo
+        finally:
+            lazy.disable_metrics()
+        f.foo
+        self.assertEqual(len(called), 1)
+        self.assertEqual(lazy.metrics(), {})
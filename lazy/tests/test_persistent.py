@@ -0,0 +1,270 @@
+import os
+import sys
+import json
+import subprocess
+import shutil
+import tempfile
+import threading
+
+from lazy import lazy
+from lazy import persistent
+from lazy.persistent import SQLiteBackend
+from lazy.persistent import DirectoryBackend
+from lazy.tests.test_lazy import TestCase
+
+
+class MemoryBackend(object):
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, data):
+        self.data[key] = data
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class PersistentTests(TestCase):
+
+    def setUp(self):
+        self.backend = MemoryBackend()
+
+    def make_class(self, called, **options):
+        backend = self.backend
+
+        class Foo(object):
+            def __init__(self, id):
+                self.id = id
+            @persistent(backend=backend, key=lambda self: self.id, **options)
+            def foo(self):
+                called.append(self.id)
+                return {'id': self.id}
+
+        return Foo
+
+    def test_evaluate_once(self):
+        # Persistent attributes should be evaluated only once.
+        called = []
+        Foo = self.make_class(called)
+
+        f = Foo(1)
+        self.assertEqual(f.foo, {'id': 1})
+        self.assertEqual(f.foo, {'id': 1})
+        self.assertEqual(called, [1])
+        self.assertTrue(isinstance(Foo.foo, lazy))
+
+    def test_read_through(self):
+        # Values should be read from the backend before computing.
+        called = []
+        Foo = self.make_class(called)
+
+        Foo(1).foo
+        Foo(2).foo
+        self.assertEqual(Foo(1).foo, {'id': 1})
+        self.assertEqual(Foo(2).foo, {'id': 2})
+        self.assertEqual(called, [1, 2])
+        self.assertEqual(len(self.backend.data), 2)
+
+    def test_keys(self):
+        # Keys should be qualified by attribute.
+        called = []
+        Foo = self.make_class(called)
+
+        Foo(1).foo
+        key, = self.backend.data
+        self.assertTrue(key.startswith('lazy.tests.test_persistent.'))
+        self.assertTrue(key.endswith('foo:1'))
+
+    def test_invalidate(self):
+        # Invalidation should remove the value from the backend.
+        called = []
+        Foo = self.make_class(called)
+
+        f = Foo(1)
+        f.foo
+        lazy.invalidate(f, 'foo')
+        self.assertEqual(self.backend.data, {})
+        self.assertEqual(Foo(1).foo, {'id': 1})
+        self.assertEqual(called, [1, 1])
+
+    def test_serializer(self):
+        # The serializer should be pluggable.
+        called = []
+
+        class Serializer(object):
+            def dumps(self, value):
+                return json.dumps(value).encode('utf-8')
+            def loads(self, data):
+                return json.loads(data.decode('utf-8'))
+
+        Foo = self.make_class(called, serializer=Serializer())
+        Foo(1).foo
+        self.assertEqual(list(self.backend.data.values()), [b'{"id": 1}'])
+        self.assertEqual(Foo(1).foo, {'id': 1})
+        self.assertEqual(called, [1])
+
+    def test_corrupt_data(self):
+        # Values that cannot be loaded should be computed again.
+        called = []
+        Foo = self.make_class(called)
+
+        Foo(1).foo
+        for key in self.backend.data:
+            self.backend.data[key] = b'garbage'
+        self.assertEqual(Foo(1).foo, {'id': 1})
+        self.assertEqual(called, [1, 1])
+        self.assertEqual(Foo(1).foo, {'id': 1})
+        self.assertEqual(called, [1, 1])
+
+    def test_unserializable(self):
+        # Values that cannot be serialized should be cached in the
+        # instance only.
+        backend = self.backend
+
+        class Foo(object):
+            @persistent(backend=backend, key=id)
+            def foo(self):
+                return threading.Lock()
+
+        f = Foo()
+        self.assertTrue(f.foo is f.foo)
+        f.foo = threading.Lock()
+        self.assertTrue(f.foo is f.__dict__['foo'])
+        self.assertEqual(backend.data, {})
+
+    def test_backend_error(self):
+        # Values should be returned when the backend fails to write.
+        called = []
+
+        class Backend(MemoryBackend):
+            def set(self, key, data):
+                raise IOError('read-only')
+
+        self.backend = Backend()
+        Foo = self.make_class(called)
+        f = Foo(1)
+        self.assertEqual(f.foo, {'id': 1})
+        self.assertEqual(f.foo, {'id': 1})
+        self.assertEqual(called, [1])
+
+    def test_exception(self):
+        # Exceptions should not be stored.
+        backend = self.backend
+
+        class Foo(object):
+            @persistent(backend=backend, key=id)
+            def foo(self):
+                raise ValueError('foo')
+
+        self.assertRaises(ValueError, getattr, Foo(), 'foo')
+        self.assertEqual(backend.data, {})
+
+    def test_private_attribute(self):
+        # It should be possible to create private persistent attributes.
+        called = []
+        backend = self.backend
+
+        class Foo(object):
+            @persistent(backend=backend, key=lambda self: 'x')
+            def __foo(self):
+                called.append('foo')
+                return 1
+            def get_foo(self):
+                return self.__foo
+
+        self.assertEqual(Foo().get_foo(), 1)
+        self.assertEqual(Foo().get_foo(), 1)
+        self.assertEqual(len(called), 1)
+
+
+    def test_deferred_imports(self):
+        # Importing lazy should not import the backend modules.
+        code = 'import sys, lazy; print(sorted(set(sys.argv[1:]) & set(sys.modules)))'
+        output = subprocess.check_output([sys.executable, '-c', code, 'sqlite3', 'pickle', 'tempfile'])
+        self.assertEqual(output.strip(), b'[]')
+
+
+class BackendTests(object):
+
+    def test_get_set_delete(self):
+        # Backends should store bytes.
+        backend = self.backend
+        self.assertEqual(backend.get('foo'), None)
+        backend.set('foo', b'\x00bar')
+        self.assertEqual(backend.get('foo'), b'\x00bar')
+        backend.set('foo', b'baz')
+        self.assertEqual(backend.get('foo'), b'baz')
+        backend.delete('foo')
+        self.assertEqual(backend.get('foo'), None)
+        backend.delete('foo')
+
+    def test_persistence(self):
+        # Values should survive the backend.
+        self.backend.set('foo', b'bar')
+        self.assertEqual(self.reopen().get('foo'), b'bar')
+
+    def test_descriptor(self):
+        # Values should be read from a reopened backend.
+        called = []
+
+        def make_class(backend):
+            class Foo(object):
+                @persistent(backend=backend, key=lambda self: 1)
+                def foo(self):
+                    called.append('foo')
+                    return [1, 2, 3]
+            return Foo
+
+        self.assertEqual(make_class(self.backend)().foo, [1, 2, 3])
+        self.assertEqual(make_class(self.reopen())().foo, [1, 2, 3])
+        self.assertEqual(len(called), 1)
+
+
+class SQLiteBackendTests(BackendTests, TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'cache.db')
+        self.backend = SQLiteBackend(self.path)
+
+    def tearDown(self):
+        self.backend.close()
+        shutil.rmtree(self.dir)
+
+    def reopen(self):
+        self.backend.close()
+        self.backend = SQLiteBackend(self.path)
+        return self.backend
+
+    def test_table(self):
+        # Backends with different tables should not share values.
+        self.backend.set('foo', b'bar')
+        other = SQLiteBackend(self.path, table='other')
+        try:
+            self.assertEqual(other.get('foo'), None)
+        finally:
+            other.close()
+
+
+class DirectoryBackendTests(BackendTests, TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'cache')
+        self.backend = DirectoryBackend(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def reopen(self):
+        self.backend = DirectoryBackend(self.path)
+        return self.backend
+
+    def test_no_temporary_files(self):
+        # Temporary files should not be left behind.
+        self.backend.set('foo', b'bar')
+        self.assertEqual(len(os.listdir(self.path)), 1)
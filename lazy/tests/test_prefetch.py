@@ -0,0 +1,280 @@
+import os
+import sys
+import time
+import threading
+import unittest
+
+from lazy import lazy
+from lazy import slotted
+from lazy import streamed
+from lazy import memoized
+from lazy.tests.test_lazy import TestCase
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+
+@unittest.skipIf(ThreadPoolExecutor is None, 'requires concurrent.futures')
+class PrefetchTests(TestCase):
+
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(4)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_prefetch(self):
+        # Prefetched attributes should be computed in the background.
+        called = []
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                called.append(threading.current_thread().name)
+                return 'foo'
+
+        f = Foo()
+        futures = lazy.prefetch(f, ['foo'], executor=self.executor)
+        self.assertEqual(sorted(futures), ['foo'])
+        self.assertEqual(futures['foo'].result(), 'foo')
+        self.assertEqual(f.__dict__, {'foo': 'foo'})
+        self.assertEqual(f.foo, 'foo')
+        self.assertEqual(len(called), 1)
+        self.assertNotEqual(called[0], threading.current_thread().name)
+
+    def test_prefetch_all(self):
+        # All uncomputed attributes should be prefetched by default.
+        called = []
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                called.append('foo')
+                return 'foo'
+            @lazy
+            def bar(self):
+                called.append('bar')
+                return 'bar'
+            @lazy
+            def __baz(self):
+                called.append('baz')
+                return 'baz'
+
+        f = Foo()
+        f.foo
+        futures = lazy.prefetch(f, executor=self.executor)
+        self.assertEqual(sorted(futures), ['_Foo__baz', 'bar'])
+        for future in futures.values():
+            future.result()
+        self.assertEqual(sorted(f.__dict__), ['_Foo__baz', 'bar', 'foo'])
+        self.assertEqual(sorted(called), ['bar', 'baz', 'foo'])
+
+    def test_join_running(self):
+        # Accessing a running attribute should wait for its result.
+        called = []
+        started = threading.Event()
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                called.append('foo')
+                started.set()
+                time.sleep(0.05)
+                return object()
+
+        f = Foo()
+        futures = lazy.prefetch(f, 'foo', executor=self.executor)
+        started.wait()
+        self.assertTrue(f.foo is futures['foo'].result())
+        self.assertEqual(len(called), 1)
+
+    def test_join_running_subclass(self):
+        # Joining should return the stored value of subclasses which
+        # process the result of the function.
+        called = []
+        started = threading.Event()
+
+        class Foo(object):
+            @streamed
+            def foo(self):
+                called.append('foo')
+                started.set()
+                time.sleep(0.05)
+                return iter([1, 2, 3])
+
+        f = Foo()
+        futures = lazy.prefetch(f, 'foo', executor=self.executor)
+        started.wait()
+        self.assertTrue(f.foo is futures['foo'].result())
+        self.assertEqual(list(f.foo), [1, 2, 3])
+        self.assertEqual(len(called), 1)
+
+    def test_prefetch_all_skips_memoized(self):
+        # Prefetching all attributes should skip memoized methods.
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 'foo'
+            @memoized
+            def bar(self, x):
+                return x
+
+        f = Foo()
+        futures = lazy.prefetch(f, executor=self.executor)
+        self.assertEqual(sorted(futures), ['foo'])
+        futures['foo'].result()
+        self.assertEqual(f.__dict__, {'foo': 'foo'})
+
+    def test_compute_queued(self):
+        # Accessing a queued attribute should compute it right away.
+        called = []
+        release = threading.Event()
+        executor = ThreadPoolExecutor(1)
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                called.append('foo')
+                return 'foo'
+
+        try:
+            executor.submit(release.wait)
+            f = Foo()
+            futures = lazy.prefetch(f, 'foo', executor=executor)
+            self.assertEqual(f.foo, 'foo')
+            self.assertTrue(futures['foo'].cancelled())
+            self.assertEqual(len(called), 1)
+        finally:
+            release.set()
+            executor.shutdown()
+
+    def test_nested_prefetch(self):
+        # Attributes reading each other should not deadlock.
+        executor = ThreadPoolExecutor(1)
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return self.bar + 1
+            @lazy
+            def bar(self):
+                return 1
+
+        try:
+            f = Foo()
+            futures = lazy.prefetch(f, ['foo', 'bar'], executor=executor)
+            self.assertEqual(futures['foo'].result(), 2)
+            self.assertEqual(f.bar, 1)
+        finally:
+            executor.shutdown()
+
+    def test_prefetch_twice(self):
+        # Prefetching a running attribute should return its future.
+        release = threading.Event()
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                release.wait()
+                return 'foo'
+
+        f = Foo()
+        first = lazy.prefetch(f, 'foo', executor=self.executor)
+        second = lazy.prefetch(f, 'foo', executor=self.executor)
+        release.set()
+        self.assertTrue(first['foo'] is second['foo'])
+        self.assertEqual(f.foo, 'foo')
+
+    def test_exception(self):
+        # Exceptions should propagate to readers and not be cached.
+        called = []
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                called.append('foo')
+                if len(called) == 1:
+                    raise ValueError('foo')
+                return 'foo'
+
+        f = Foo()
+        futures = lazy.prefetch(f, 'foo', executor=self.executor)
+        self.assertRaises(ValueError, futures['foo'].result)
+        self.assertEqual(f.foo, 'foo')
+        self.assertEqual(len(called), 2)
+
+    def test_no_pending_futures(self):
+        # Finished prefetches should be cleaned up.
+        from lazy.lazy import _pending
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                return 'foo'
+
+        f = Foo()
+        lazy.prefetch(f, executor=self.executor)['foo'].result()
+        self.executor.shutdown()
+        self.assertEqual(_pending, {})
+
+    def test_prefetch_slotted(self):
+        # Prefetching should work with lazy subclasses.
+
+        class Foo(object):
+            __slots__ = ('_foo',)
+            @slotted
+            def foo(self):
+                return 'foo'
+
+        f = Foo()
+        lazy.prefetch(f, executor=self.executor)['foo'].result()
+        self.assertEqual(f._foo, 'foo')
+
+    def test_prefetch_nonlazy_attribute(self):
+        # Prefetching an attribute that is not lazy should raise an
+        # AttributeError.
+
+        class Foo(object):
+            def foo(self):
+                return 'foo'
+
+        self.assertException(AttributeError,
+            "'Foo.foo' is not a lazy attribute",
+            lazy.prefetch, Foo(), 'foo', self.executor)
+
+    @unittest.skipUnless(hasattr(os, 'register_at_fork'), 'requires os.register_at_fork')
+    def test_fork(self):
+        # Running prefetches should be dropped in a forked child.
+        started = threading.Event()
+        release = threading.Event()
+
+        class Foo(object):
+            @lazy
+            def foo(self):
+                if threading.current_thread().name != 'MainThread':
+                    started.set()
+                    release.wait()
+                return os.getpid()
+
+        f = Foo()
+        lazy.prefetch(f, 'foo', executor=self.executor)
+        started.wait()
+
+        try:
+            pid = os.fork()
+            if pid == 0:
+                # The child must not wait for the prefetch
+                code = 1
+                try:
+                    import signal
+                    signal.alarm(5)
+                    code = 0 if f.foo == os.getpid() else 1
+                finally:
+                    os._exit(code)
+            status = os.waitpid(pid, 0)[1]
+            self.assertEqual(status, 0)
+        finally:
+            release.set()
@@ -0,0 +1,203 @@
+import threading
+import importlib
+
+from lazy import lazy
+from lazy import revalidating
+from lazy.tests.test_lazy import TestCase
+from lazy.tests.test_expiring import Clock
+
+module = importlib.import_module('lazy.revalidating')
+
+
+class Executor(object):
+    """Executor running submitted calls on demand."""
+
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, func, *args):
+        self.calls.append((func, args))
+
+    def run(self):
+        calls, self.calls = self.calls, []
+        for func, args in calls:
+            func(*args)
+
+
+executor = Executor()
+
+
+class Foo(object):
+
+    def __init__(self):
+        self.called = 0
+
+    @revalidating(ttl=10, max_stale=20, executor=executor)
+    def foo(self):
+        self.called += 1
+        return self.called
+
+
+class RevalidatingTests(TestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        self.saved = module._clock
+        module._clock = self.clock
+        del executor.calls[:]
+
+    def tearDown(self):
+        module._clock = self.saved
+
+    def test_evaluate_once(self):
+        # Fresh values should be returned.
+        f = Foo()
+        self.assertEqual(f.foo, 1)
+        self.clock.now += 9
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(executor.calls, [])
+        self.assertTrue(isinstance(Foo.foo, lazy))
+
+    def test_stale(self):
+        # Stale values should be returned while computed in the background.
+        f = Foo()
+        f.foo
+        self.clock.now += 10
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(len(executor.calls), 1)
+        executor.run()
+        self.assertEqual(f.foo, 2)
+        self.assertEqual(f.called, 2)
+
+    def test_fresh_after_revalidate(self):
+        # Revalidated values should be fresh for ttl seconds.
+        f = Foo()
+        f.foo
+        self.clock.now += 15
+        f.foo
+        executor.run()
+        self.clock.now += 9
+        self.assertEqual(f.foo, 2)
+        self.assertEqual(executor.calls, [])
+
+    def test_max_stale(self):
+        # Values stale for too long should be computed synchronously.
+        f = Foo()
+        f.foo
+        self.clock.now += 30
+        self.assertEqual(f.foo, 2)
+        self.assertEqual(executor.calls, [])
+
+    def test_no_max_stale(self):
+        # Without max_stale, stale values should always be returned.
+        class Bar(object):
+            @revalidating(ttl=10, executor=executor)
+            def bar(self):
+                return self.clock()
+
+        b = Bar()
+        b.clock = self.clock
+        self.assertEqual(b.bar, 1000)
+        self.clock.now += 10000
+        self.assertEqual(b.bar, 1000)
+        executor.run()
+        self.assertEqual(b.bar, 11000)
+
+    def test_invalidate(self):
+        # Invalidated attributes should be computed synchronously.
+        f = Foo()
+        f.foo
+        self.clock.now += 15
+        lazy.invalidate(f, 'foo')
+        self.assertEqual(f.foo, 2)
+        self.assertEqual(executor.calls, [])
+
+    def test_invalidate_while_pending(self):
+        # Background results should not replace newer values.
+        f = Foo()
+        f.foo
+        self.clock.now += 15
+        f.foo
+        lazy.invalidate(f, 'foo')
+        self.assertEqual(f.foo, 2)
+        executor.run()
+        self.assertEqual(f.foo, 2)
+        self.assertEqual(f.called, 3)
+
+    def test_exception(self):
+        # Background exceptions should keep the stale value and be retried.
+        class Bar(object):
+            fail = False
+
+            @revalidating(ttl=10, executor=executor)
+            def bar(self):
+                if self.fail:
+                    raise ValueError('bar')
+                return 1
+
+        b = Bar()
+        b.bar
+        b.fail = True
+        self.clock.now += 15
+        b.bar
+        executor.run()
+        self.assertEqual(b.bar, 1)
+        self.assertEqual(len(executor.calls), 1)
+
+    def test_assign(self):
+        # Assigned values should be fresh.
+        f = Foo()
+        f.foo = 42
+        self.assertEqual(f.foo, 42)
+        del f.foo
+        self.assertRaises(AttributeError, delattr, f, 'foo')
+        self.assertEqual(f.foo, 1)
+
+    def test_computed(self):
+        # Stale values should count as computed until max_stale.
+        f = Foo()
+        f.foo
+        self.clock.now += 15
+        self.assertEqual(lazy.computed(f), ('foo',))
+        self.clock.now += 15
+        self.assertEqual(lazy.computed(f), ())
+
+    def test_threads(self):
+        # One thread should compute the value in the background.
+        started = threading.Event()
+        release = threading.Event()
+
+        class Bar(object):
+            called = 0
+
+            @revalidating(ttl=10)
+            def bar(self):
+                self.called += 1
+                if self.called > 1:
+                    started.set()
+                    release.wait(5)
+                return self.called
+
+        b = Bar()
+        b.bar
+        self.clock.now += 15
+        results = []
+
+        def target():
+            results.append(b.bar)
+
+        threads = [threading.Thread(target=target) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [1] * 8)
+        self.assertTrue(started.wait(5))
+        release.set()
+        for i in range(500):
+            if b.__dict__['bar'][0] == 2:
+                break
+            threading.Event().wait(0.01)
+        self.assertEqual(b.bar, 2)
+        self.assertEqual(b.called, 2)
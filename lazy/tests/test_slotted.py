@@ -0,0 +1,269 @@
+import gc
+import sys
+import unittest
+
+from lazy import lazy
+from lazy import slotted
+from lazy.tests.test_lazy import TestCase
+
+
+class SlottedTests(TestCase):
+
+    def test_reserved_slot(self):
+        # Values should be stored in the reserved slot.
+        called = []
+
+        class Foo(object):
+            __slots__ = ('_foo',)
+            @slotted
+            def foo(self):
+                called.append('foo')
+                return 1
+
+        f = Foo()
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(f._foo, 1)
+        self.assertEqual(len(called), 1)
+        self.assertTrue(isinstance(Foo.foo, lazy))
+
+    def test_named_slot(self):
+        # It should be possible to name the reserved slot.
+        called = []
+
+        class Foo(object):
+            __slots__ = ('cache',)
+            @slotted(slot='cache')
+            def foo(self):
+                called.append('foo')
+                return 1
+
+        f = Foo()
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(f.cache, 1)
+        self.assertEqual(len(called), 1)
+
+    def test_side_table(self):
+        # Values should be stored in a side table when there is
+        # no reserved slot.
+        called = []
+
+        class Foo(object):
+            __slots__ = ('__weakref__',)
+            @slotted
+            def foo(self):
+                called.append('foo')
+                return object()
+
+        f = Foo()
+        g = Foo()
+        self.assertTrue(f.foo is f.foo)
+        self.assertTrue(g.foo is g.foo)
+        self.assertFalse(f.foo is g.foo)
+        self.assertEqual(len(called), 2)
+
+    def test_subclass_adds_slot(self):
+        # Subclasses adding the reserved slot should not affect the
+        # base class.
+
+        class Base(object):
+            __slots__ = ('__weakref__',)
+            @slotted
+            def foo(self):
+                return self.__class__.__name__
+
+        class Sub(Base):
+            __slots__ = ('_foo',)
+
+        s = Sub()
+        self.assertEqual(s.foo, 'Sub')
+        self.assertEqual(s._foo, 'Sub')
+        b = Base()
+        self.assertEqual(b.foo, 'Base')
+        lazy.invalidate(b, 'foo')
+        lazy.invalidate(s, 'foo')
+        self.assertRaises(AttributeError, getattr, s, '_foo')
+        self.assertEqual(lazy.computed(b), ())
+
+    def test_side_table_cleanup(self):
+        # Side table entries should go away with the instance.
+
+        class Foo(object):
+            __slots__ = ('__weakref__',)
+            @slotted
+            def foo(self):
+                return 1
+
+        f = Foo()
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(len(Foo.foo._slotted__table), 1)
+        del f
+        gc.collect()
+        self.assertEqual(len(Foo.foo._slotted__table), 0)
+
+    def test_no_weakref(self):
+        # Without reserved slot the instance must support weak
+        # references.
+        called = []
+
+        class Foo(object):
+            __slots__ = ()
+            @slotted
+            def foo(self):
+                called.append('foo')
+                return 1
+
+        f = Foo()
+        self.assertException(TypeError,
+            "cannot create weak reference to 'Foo' object",
+            getattr, f, 'foo')
+        self.assertEqual(len(called), 0)
+
+    @unittest.skipIf(sys.version_info < (3, 11), 'requires dataclass weakref_slot')
+    def test_frozen_dataclass(self):
+        # Slotted attributes should work on frozen dataclasses.
+        import dataclasses
+        called = []
+
+        def foo(self):
+            called.append('foo')
+            return self.x * 2
+
+        Foo = dataclasses.make_dataclass('Foo', [('x', int)],
+            namespace={'foo': slotted(foo)},
+            frozen=True, slots=True, weakref_slot=True)
+
+        f = Foo(21)
+        self.assertEqual(f.foo, 42)
+        self.assertEqual(f.foo, 42)
+        self.assertEqual(len(called), 1)
+        self.assertEqual(f, Foo(21))
+
+        lazy.invalidate(f, 'foo')
+        self.assertEqual(f.foo, 42)
+        self.assertEqual(len(called), 2)
+
+    def test_private_attribute(self):
+        # It should be possible to create private slotted attributes.
+        called = []
+
+        class Foo(object):
+            __slots__ = ('__weakref__',)
+            @slotted
+            def __foo(self):
+                called.append('foo')
+                return 1
+            def get_foo(self):
+                return self.__foo
+
+        f = Foo()
+        self.assertEqual(f.get_foo(), 1)
+        self.assertEqual(f.get_foo(), 1)
+        self.assertEqual(len(called), 1)
+
+        slotted.invalidate(f, '__foo')
+        self.assertEqual(f.get_foo(), 1)
+        self.assertEqual(len(called), 2)
+
+    def test_computed(self):
+        # Computed slotted attributes should be listed.
+
+        class Foo(object):
+            __slots__ = ('_foo', '__weakref__')
+            @slotted
+            def foo(self):
+                return 1
+            @slotted
+            def bar(self):
+                return 2
+
+        f = Foo()
+        self.assertEqual(lazy.computed(f), ())
+        f.foo
+        self.assertEqual(lazy.computed(f), ('foo',))
+        f.bar
+        self.assertEqual(lazy.computed(f), ('bar', 'foo'))
+        lazy.invalidate_all(f)
+        self.assertEqual(lazy.computed(f), ())
+
+
+class InvalidateSlottedTests(TestCase):
+
+    def test_invalidate_reserved_slot(self):
+        # It should be possible to invalidate a slotted attribute.
+        called = []
+
+        class Foo(object):
+            __slots__ = ('_foo',)
+            @slotted
+            def foo(self):
+                called.append('foo')
+                return 1
+
+        f = Foo()
+        self.assertEqual(f.foo, 1)
+        slotted.invalidate(f, 'foo')
+        self.assertRaises(AttributeError, getattr, f, '_foo')
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(len(called), 2)
+
+    def test_invalidate_side_table(self):
+        # It should be possible to invalidate a slotted attribute
+        # stored in the side table.
+        called = []
+
+        class Foo(object):
+            __slots__ = ('__weakref__',)
+            @slotted
+            def foo(self):
+                called.append('foo')
+                return 1
+
+        f = Foo()
+        self.assertEqual(f.foo, 1)
+        lazy.invalidate(f, 'foo')
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(len(called), 2)
+
+    def test_invalidate_attribute_twice(self):
+        # It should be possible to invalidate a slotted attribute
+        # twice without causing harm.
+        called = []
+
+        class Foo(object):
+            __slots__ = ('_foo', '__weakref__')
+            @slotted
+            def foo(self):
+                called.append('foo')
+                return 1
+            @slotted(slot='_nope')
+            def bar(self):
+                called.append('bar')
+                return 1
+
+        f = Foo()
+        slotted.invalidate(f, 'foo') # Nothing happens
+        slotted.invalidate(f, 'bar') # Nothing happens
+        self.assertEqual(f.foo, 1)
+        self.assertEqual(f.bar, 1)
+        slotted.invalidate(f, 'foo')
+        slotted.invalidate(f, 'foo')
+        slotted.invalidate(f, 'bar')
+        slotted.invalidate(f, 'bar')
+        self.assertEqual(len(called), 2)
+
+    def test_invalidate_nonslotted_attribute(self):
+        # Invalidating an attribute that is not slotted should
+        # raise an AttributeError.
+
+        class Foo(object):
+            __slots__ = ('_foo',)
+            @lazy
+            def foo(self):
+                return 1
+
+        f = Foo()
+        self.assertException(AttributeError,
+            "'Foo.foo' is not a slotted attribute",
+            slotted.invalidate, f, 'foo')
@@ -0,0 +1,175 @@
+import threading
+
+from lazy import lazy
+from lazy import streamed
+from lazy.streamed import Stream
+from lazy.tests.test_lazy import TestCase
+
+
+class Foo(object):
+
+    def __init__(self, count=10):
+        self.count = count
+        self.pulled = []
+
+    @streamed
+    def rows(self):
+        for i in range(self.count):
+            self.pulled.append(i)
+            yield i * 10
+
+
+class StreamedTests(TestCase):
+
+    def test_evaluate_once(self):
+        # Streamed attributes should be evaluated only once.
+        f = Foo()
+        self.assertTrue(f.rows is f.rows)
+        self.assertTrue(isinstance(f.rows, Stream))
+        self.assertTrue(isinstance(Foo.rows, lazy))
+        self.assertEqual(f.pulled, [])
+
+    def test_index(self):
+        # Indexing should pull only the needed items.
+        f = Foo()
+        self.assertEqual(f.rows[0], 0)
+        self.assertEqual(f.pulled, [0])
+        self.assertEqual(f.rows[3], 30)
+        self.assertEqual(f.pulled, [0, 1, 2, 3])
+        self.assertEqual(f.rows[1], 10)
+        self.assertEqual(f.pulled, [0, 1, 2, 3])
+        self.assertEqual(f.rows.consumed, 4)
+        self.assertFalse(f.rows.exhausted)
+
+    def test_index_error(self):
+        # Indexing past the end should raise IndexError.
+        f = Foo(3)
+        self.assertRaises(IndexError, f.rows.__getitem__, 3)
+        self.assertTrue(f.rows.exhausted)
+
+    def test_negative_index(self):
+        # Negative indexes should pull all items.
+        f = Foo()
+        self.assertEqual(f.rows[-1], 90)
+        self.assertEqual(len(f.pulled), 10)
+
+    def test_slice(self):
+        # Slicing should pull only the needed items.
+        f = Foo()
+        self.assertEqual(f.rows[:3], [0, 10, 20])
+        self.assertEqual(f.pulled, [0, 1, 2])
+        self.assertEqual(f.rows[1:5:2], [10, 30])
+        self.assertEqual(len(f.pulled), 5)
+        self.assertEqual(f.rows[8:], [80, 90])
+        self.assertEqual(len(f.pulled), 10)
+
+    def test_reversed_slice(self):
+        # Slicing with a negative step should pull up to the start.
+        f = Foo()
+        self.assertEqual(f.rows[5:1:-1], [50, 40, 30, 20])
+        self.assertEqual(f.pulled, [0, 1, 2, 3, 4, 5])
+        self.assertEqual(f.rows[3::-2], [30, 10])
+        self.assertEqual(len(f.pulled), 6)
+        self.assertEqual(f.rows[:7:-1], [90, 80])
+        self.assertEqual(len(f.pulled), 10)
+        self.assertEqual(Foo().rows[-2:-5:-1], [80, 70, 60])
+
+    def test_iter(self):
+        # Iteration should pull items as it goes.
+        f = Foo()
+        for row in f.rows:
+            if row == 20:
+                break
+        self.assertEqual(f.pulled, [0, 1, 2])
+        self.assertEqual(list(f.rows), [0, 10, 20, 30, 40, 50, 60, 70, 80, 90])
+        self.assertEqual(list(f.rows), [0, 10, 20, 30, 40, 50, 60, 70, 80, 90])
+        self.assertEqual(len(f.pulled), 10)
+
+    def test_interleaved_iter(self):
+        # Several iterators should see the same items.
+        f = Foo(3)
+        a = iter(f.rows)
+        b = iter(f.rows)
+        self.assertEqual(next(a), 0)
+        self.assertEqual(next(a), 10)
+        self.assertEqual(list(b), [0, 10, 20])
+        self.assertEqual(list(a), [20])
+
+    def test_len(self):
+        # len() should pull all items.
+        f = Foo()
+        self.assertEqual(len(f.rows), 10)
+        self.assertTrue(f.rows.exhausted)
+
+    def test_bool(self):
+        # Truth testing should pull one item.
+        f = Foo()
+        self.assertTrue(f.rows)
+        self.assertEqual(f.pulled, [0])
+        self.assertFalse(Foo(0).rows)
+
+    def test_contains(self):
+        # Membership tests should stop at the first match.
+        f = Foo()
+        self.assertTrue(20 in f.rows)
+        self.assertEqual(f.pulled, [0, 1, 2])
+        self.assertEqual(f.rows.index(30), 3)
+
+    def test_repr(self):
+        # The repr should show the pulled items.
+        f = Foo(3)
+        f.rows[1]
+        self.assertEqual(repr(f.rows), '<Stream [0, 10]...>')
+        len(f.rows)
+        self.assertEqual(repr(f.rows), '<Stream [0, 10, 20]>')
+
+    def test_exception(self):
+        # Exceptions should be raised again when more items are needed.
+        class Bar(object):
+            @streamed
+            def rows(self):
+                yield 1
+                raise ValueError('rows')
+
+        b = Bar()
+        self.assertEqual(b.rows[0], 1)
+        self.assertException(ValueError, 'rows', b.rows.__getitem__, 1)
+        self.assertException(ValueError, 'rows', len, b.rows)
+        self.assertEqual(b.rows[0], 1)
+        self.assertFalse(b.rows.exhausted)
+
+    def test_invalidate(self):
+        # Invalidated attributes should start over.
+        f = Foo()
+        f.rows[2]
+        lazy.invalidate(f, 'rows')
+        self.assertEqual(f.rows.consumed, 0)
+        self.assertEqual(f.rows[0], 0)
+
+    def test_threads(self):
+        # Items should be pulled once under contention.
+        f = Foo(1000)
+        f.rows
+        results = []
+
+        def target():
+            results.append(list(f.rows))
+
+        threads = [threading.Thread(target=target) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(f.pulled, list(range(1000)))
+        for result in results:
+            self.assertEqual(result, [i * 10 for i in range(1000)])
+
+    def test_iterable(self):
+        # Functions may return any iterable.
+        class Bar(object):
+            @streamed
+            def rows(self):
+                return [1, 2, 3]
+
+        self.assertEqual(Bar().rows[1], 2)
@@ -0,0 +1,205 @@
+import copy
+import threading
+
+from lazy import lazy
+from lazy import tracked
+from lazy.tests.test_lazy import TestCase
+
+
+class Table(object):
+
+    def __init__(self, rows):
+        self.called = []
+        self.source = rows
+
+    @tracked
+    def rows(self):
+        self.called.append('rows')
+        return list(self.source)
+
+    @tracked
+    def total(self):
+        self.called.append('total')
+        return sum(self.rows)
+
+    @tracked
+    def count(self):
+        self.called.append('count')
+        return len(self.rows)
+
+    @tracked
+    def mean(self):
+        self.called.append('mean')
+        return self.total / self.count
+
+    @tracked
+    def title(self):
+        self.called.append('title')
+        return 'Table'
+
+
+class TrackedTests(TestCase):
+
+    def test_evaluate_once(self):
+        # Tracked attributes should be evaluated only once.
+        t = Table([1, 2, 3])
+        self.assertEqual(t.total, 6)
+        self.assertEqual(t.total, 6)
+        self.assertEqual(t.called, ['total', 'rows'])
+        self.assertTrue(isinstance(Table.total, lazy))
+
+    def test_record_dependencies(self):
+        # Reads of tracked attributes should be recorded.
+        t = Table([1, 2, 3])
+        self.assertEqual(t.mean, 2)
+        self.assertEqual(tracked.dependents(t, 'rows'), ('count', 'total'))
+        self.assertEqual(tracked.dependents(t, 'total'), ('mean',))
+        self.assertEqual(tracked.dependents(t, 'count'), ('mean',))
+        self.assertEqual(tracked.dependents(t, 'mean'), ())
+        self.assertEqual(tracked.dependents(t, 'title'), ())
+
+    def test_record_cached_dependencies(self):
+        # Reads of already computed attributes should be recorded.
+        t = Table([1, 2, 3])
+        self.assertEqual(t.rows, [1, 2, 3])
+        self.assertEqual(t.total, 6)
+        self.assertEqual(tracked.dependents(t, 'rows'), ('total',))
+
+    def test_cascade(self):
+        # Invalidating an attribute should invalidate its dependents.
+        t = Table([1, 2, 3])
+        self.assertEqual((t.mean, t.title), (2, 'Table'))
+        del t.called[:]
+
+        t.source = [2, 4, 6]
+        lazy.invalidate(t, 'rows')
+        self.assertEqual(sorted(lazy.computed(t)), ['title'])
+
+        self.assertEqual((t.mean, t.title), (4, 'Table'))
+        self.assertEqual(sorted(t.called), ['count', 'mean', 'rows', 'total'])
+
+    def test_copies(self):
+        # Copies should not share changes to the dependency graph.
+        a = Table([1, 2, 3])
+        a.total
+        b = copy.copy(a)
+        lazy.invalidate(b, 'rows')
+        self.assertEqual(lazy.computed(b), ())
+        self.assertEqual(tracked.dependents(a, 'rows'), ('total',))
+
+        a.source = [6, 7]
+        lazy.invalidate(a, 'rows')
+        self.assertEqual(a.total, 13)
+
+    def test_cascade_narrowly(self):
+        # Only the dependents of an attribute should be invalidated.
+        t = Table([1, 2, 3])
+        self.assertEqual(t.mean, 2)
+
+        lazy.invalidate(t, 'count')
+        self.assertEqual(sorted(lazy.computed(t)), ['rows', 'total'])
+
+        lazy.invalidate(t, 'mean')
+        self.assertEqual(sorted(lazy.computed(t)), ['rows', 'total'])
+
+    def test_cascade_on_assignment(self):
+        # Assigning an attribute should invalidate its dependents.
+        t = Table([1, 2, 3])
+        self.assertEqual(t.mean, 2)
+
+        t.rows = [4, 5, 6]
+        self.assertEqual(sorted(lazy.computed(t)), ['rows'])
+        self.assertEqual(t.mean, 5)
+
+    def test_cascade_on_delete(self):
+        # Deleting an attribute should invalidate its dependents.
+        t = Table([1, 2, 3])
+        self.assertEqual(t.total, 6)
+
+        del t.rows
+        self.assertEqual(lazy.computed(t), ())
+        self.assertRaises(AttributeError, delattr, t, 'rows')
+
+    def test_stale_dependencies(self):
+        # Dependencies should be recorded again on recompute.
+        called = []
+
+        class Foo(object):
+            flag = True
+            @tracked
+            def foo(self):
+                return self.bar if self.flag else self.baz
+            @tracked
+            def bar(self):
+                return 'bar'
+            @tracked
+            def baz(self):
+                return 'baz'
+
+        f = Foo()
+        self.assertEqual(f.foo, 'bar')
+        f.flag = False
+        lazy.invalidate(f, 'bar')
+        self.assertEqual(f.foo, 'baz')
+        self.assertEqual(tracked.dependents(f, 'bar'), ())
+        self.assertEqual(tracked.dependents(f, 'baz'), ('foo',))
+
+        lazy.invalidate(f, 'bar')
+        self.assertEqual(sorted(lazy.computed(f)), ['baz', 'foo'])
+
+    def test_invalidate_all(self):
+        # Invalidating all attributes should work with dependencies.
+        t = Table([1, 2, 3])
+        self.assertEqual((t.mean, t.title), (2, 'Table'))
+        lazy.invalidate_all(t)
+        self.assertEqual(lazy.computed(t), ())
+        self.assertEqual(t.mean, 2)
+
+    def test_other_instances(self):
+        # Reads of other instances should not be recorded.
+        s = Table([1, 2, 3])
+        t = Table([4, 5, 6])
+
+        class Foo(object):
+            @tracked
+            def foo(self):
+                return s.total + t.total
+
+        f = Foo()
+        self.assertEqual(f.foo, 21)
+        self.assertEqual(tracked.dependents(s, 'total'), ())
+        self.assertEqual(tracked.dependents(t, 'total'), ())
+
+    def test_threads(self):
+        # Dependencies should be recorded per thread.
+        tables = [Table(range(i)) for i in range(8)]
+
+        def target(table):
+            table.mean if len(table.source) else table.total
+
+        threads = [threading.Thread(target=target, args=(t,)) for t in tables]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(tracked.dependents(tables[0], 'rows'), ('total',))
+        for table in tables[1:]:
+            self.assertEqual(tracked.dependents(table, 'rows'), ('count', 'total'))
+
+    def test_private_attribute(self):
+        # Private attributes should be tracked by their mangled names.
+
+        class Foo(object):
+            @tracked
+            def foo(self):
+                return self.__bar
+            @tracked
+            def __bar(self):
+                return 'bar'
+
+        f = Foo()
+        self.assertEqual(f.foo, 'bar')
+        self.assertEqual(tracked.dependents(f, '__bar'), ('foo',))
+        lazy.invalidate(f, '__bar')
+        self.assertEqual(lazy.computed(f), ())
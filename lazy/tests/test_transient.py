@@ -0,0 +1,194 @@
+import copy
+import pickle
+
+from lazy import lazy
+from lazy import tracked
+from lazy.tests.test_lazy import TestCase
+
+
+class cached(lazy):
+    pass
+
+
+# Classes must be importable for pickle
+
+@lazy.transient
+class Foo(object):
+
+    def __init__(self):
+        self.x = 1
+
+    @lazy
+    def foo(self):
+        return [1, 2, 3]
+
+    @cached
+    def bar(self):
+        return 'bar'
+
+    @lazy
+    def __baz(self):
+        return 'baz'
+
+    def get_baz(self):
+        return self.__baz
+
+
+class Bar(Foo):
+
+    @lazy
+    def quux(self):
+        return 'quux'
+
+
+@lazy.transient(keep=['foo', '__baz'])
+class Keep(object):
+
+    @lazy
+    def foo(self):
+        return 'foo'
+
+    @lazy
+    def bar(self):
+        return 'bar'
+
+    @lazy
+    def __baz(self):
+        return 'baz'
+
+    def get_baz(self):
+        return self.__baz
+
+
+@cached.transient
+class Kind(object):
+
+    @lazy
+    def foo(self):
+        return 'foo'
+
+    @cached
+    def bar(self):
+        return 'bar'
+
+
+@lazy.transient
+class GetState(object):
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['extra'] = True
+        return state
+
+    @lazy
+    def foo(self):
+        return 'foo'
+
+
+@lazy.transient
+class Slots(object):
+    __slots__ = ('x', '__dict__')
+
+    def __init__(self):
+        self.x = 1
+
+    @lazy
+    def foo(self):
+        return 'foo'
+
+
+@tracked.transient
+class Tracked(object):
+
+    @tracked
+    def foo(self):
+        return 1
+
+    @tracked
+    def bar(self):
+        return self.foo + 1
+
+
+class TransientTests(TestCase):
+
+    def test_pickle(self):
+        # Computed attributes should not be pickled.
+        f = Foo()
+        f.foo, f.bar, f.get_baz()
+        g = pickle.loads(pickle.dumps(f))
+        self.assertEqual(g.__dict__, {'x': 1})
+        self.assertEqual(g.foo, [1, 2, 3])
+        self.assertEqual(g.get_baz(), 'baz')
+        self.assertEqual(len(f.__dict__), 4)
+
+    def test_pickle_protocols(self):
+        # All protocols should drop computed attributes.
+        f = Foo()
+        f.foo
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(f, protocol)).__dict__, {'x': 1})
+
+    def test_copy(self):
+        # Computed attributes should not be copied.
+        f = Foo()
+        f.foo
+        self.assertEqual(copy.copy(f).__dict__, {'x': 1})
+        self.assertEqual(copy.deepcopy(f).__dict__, {'x': 1})
+        g = copy.copy(f)
+        self.assertFalse(g.foo is f.foo)
+
+    def test_uncomputed(self):
+        # Objects without computed attributes should be unaffected.
+        f = Foo()
+        self.assertTrue(f.__getstate__() is f.__dict__ or f.__getstate__() == {'x': 1})
+
+    def test_subclass(self):
+        # Attributes of subclasses should be dropped.
+        b = Bar()
+        b.foo, b.quux
+        self.assertEqual(pickle.loads(pickle.dumps(b)).__dict__, {'x': 1})
+
+    def test_keep(self):
+        # Attributes in keep should be pickled.
+        k = Keep()
+        k.foo, k.bar, k.get_baz()
+        self.assertEqual(sorted(copy.copy(k).__dict__), ['_Keep__baz', 'foo'])
+
+    def test_kind(self):
+        # Only attributes of the given kind should be dropped.
+        k = Kind()
+        k.foo, k.bar
+        self.assertEqual(sorted(copy.copy(k).__dict__), ['foo'])
+
+    def test_getstate(self):
+        # An existing __getstate__ should be used.
+        g = GetState()
+        g.foo
+        self.assertEqual(copy.copy(g).__dict__, {'extra': True})
+
+    def test_slots(self):
+        # Slots should be pickled.
+        s = Slots()
+        s.foo
+        t = pickle.loads(pickle.dumps(s, 2))
+        self.assertEqual(t.x, 1)
+        self.assertEqual(t.__dict__, {})
+
+    def test_tracked(self):
+        # Tracked attributes should be recomputed in copies.
+        t = Tracked()
+        self.assertEqual(t.bar, 2)
+        c = copy.copy(t)
+        self.assertEqual(lazy.computed(c), ())
+        self.assertEqual(c.bar, 2)
+        c.foo = 10
+        self.assertEqual(c.bar, 11)
+        self.assertEqual(t.bar, 2)
+
+    def test_returns_class(self):
+        # The decorator should return the class.
+        class Baz(object):
+            pass
+
+        self.assertTrue(lazy.transient(Baz) is Baz)
+        self.assertTrue(lazy.transient(keep='foo')(Baz) is Baz)
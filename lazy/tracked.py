@@ -0,0 +1,115 @@
+"""Decorator to create lazy attributes with dependency tracking."""
+
+import threading
+
+from .lazy import lazy, _record, _storage_name
+
+_marker = object()
+
+_local = threading.local()
+
+# Key of the dependency graph in the instance __dict__
+_DEPENDENTS = '__lazy_dependents__'
+
+
+class tracked(lazy):
+    """tracked descriptor
+
+    Like lazy but records which tracked attributes are read while
+    another tracked attribute is being computed. Invalidating or
+    assigning an attribute also invalidates the attributes computed
+    from it.
+    """
+
+    def __get__(self, inst, owner):
+        if inst is None:
+            return self
+
+        if not hasattr(inst, '__dict__'):
+            raise AttributeError("'%s' object has no attribute '__dict__'" % (owner.__name__,))
+
+        name = self.__name__
+        if name.startswith('__') and not name.endswith('__'):
+            name = '_%s%s' % (owner.__name__, name)
+
+        stack = getattr(_local, 'stack', None)
+        if stack:
+            reader, dependent = stack[-1]
+            if reader is inst and dependent != name:
+                graph = inst.__dict__.get(_DEPENDENTS, {})
+                dependents = graph.get(name, frozenset())
+                if dependent not in dependents:
+                    # Replace the graph, copies of the instance may share it
+                    graph = dict(graph)
+                    graph[name] = dependents | frozenset((dependent,))
+                    inst.__dict__[_DEPENDENTS] = graph
+
+        value = inst.__dict__.get(name, _marker)
+        if value is _marker:
+            value = lazy.__get__(self, inst, owner)
+        elif self._metrics is not None:
+            _record(self, 'hit', inst)
+        return value
+
+    def __set__(self, inst, value):
+        self._store(inst, _storage_name(self, inst), value)
+
+    def __delete__(self, inst):
+        name = _storage_name(self, inst)
+        if name not in inst.__dict__:
+            raise AttributeError(name)
+        self._invalidate(inst, name)
+
+    def _compute(self, inst, name):
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+
+        stack.append((inst, name))
+        try:
+            return lazy._compute(self, inst, name)
+        finally:
+            stack.pop()
+
+    def _store(self, inst, name, value):
+        _cascade(inst, name)
+        inst.__dict__[name] = value
+
+    def _invalidate(self, inst, name):
+        lazy._invalidate(self, inst, name)
+        _cascade(inst, name)
+
+    @classmethod
+    def dependents(cls, inst, name):
+        """Return the names of the attributes computed from attribute
+        'name' of instance 'inst'.
+        """
+        owner = inst.__class__
+        if name.startswith('__') and not name.endswith('__'):
+            name = '_%s%s' % (owner.__name__, name)
+
+        graph = inst.__dict__.get(_DEPENDENTS, {})
+        return tuple(sorted(graph.get(name, ())))
+
+
+def _cascade(inst, name):
+    # Invalidate the dependents of 'name', and theirs, and so on
+    graph = inst.__dict__.get(_DEPENDENTS)
+    if not graph:
+        return
+    if name not in graph and not any(name in dependents for dependents in graph.values()):
+        return
+
+    # Replace the graph, copies of the instance may share it
+    graph = dict(graph)
+    pending = [name]
+    while pending:
+        name = pending.pop()
+        # Dependencies are recorded again when 'name' is recomputed
+        for key, dependents in list(graph.items()):
+            if name in dependents:
+                graph[key] = dependents - frozenset((name,))
+        for dependent in graph.pop(name, ()):
+            inst.__dict__.pop(dependent, None)
+            pending.append(dependent)
+    inst.__dict__[_DEPENDENTS] = graph
@@ -0,0 +1,15 @@
+from typing import TypeVar, Tuple
+
+from .lazy import lazy
+
+_R = TypeVar("_R")
+
+
+class tracked(lazy[_R]):
+
+    def __set__(self, inst: object, value: _R) -> None: ...
+
+    def __delete__(self, inst: object) -> None: ...
+
+    @classmethod
+    def dependents(cls, inst: object, name: str) -> Tuple[str, ...]: ...